@@ -1,11 +1,11 @@
 """🤖 Auto Areas. A custom component for Home Assistant which automates your areas."""
 from __future__ import annotations
-import asyncio
 
 from homeassistant.helpers import issue_registry, config_validation as cv
+from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, Platform
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
 
 
@@ -13,7 +13,18 @@ from .auto_area import (
     AutoArea,
 )
 
-from .const import DOMAIN, LOGGER, ISSUE_TYPE_YAML_DETECTED
+from .const import (
+    DATA_AREA_INDEX,
+    DATA_COVER_COMMANDS,
+    DATA_LIGHT_COMMANDS,
+    DATA_PRESENCE_TIMERS,
+    DATA_STATE_ROUTER,
+    DOMAIN,
+    LOGGER,
+    ISSUE_TYPE_YAML_DETECTED,
+    STARTUP_MEMBER_TIMEOUT,
+)
+from .ha_helpers import async_wait_for_states
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
@@ -37,28 +48,36 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Initialize immediately
         await async_init(hass, entry, auto_area)
     else:
-        # Schedule initialization when HA is started and initialized
-        # https://developers.home-assistant.io/docs/asyncio_working_with_async/#calling-async-functions-from-threads
+        # HA start is the shared barrier for all entries: every integration
+        # has registered its entities by then. Each entry is started in its
+        # own task so that areas do not wait for each other.
 
         @callback
-        def init(hass: HomeAssistant, entry: ConfigEntry, auto_area: AutoArea):
-            asyncio.run_coroutine_threadsafe(
-                async_init(hass, entry, auto_area), hass.loop
-            ).result()
-
-        hass.bus.async_listen_once(
-            EVENT_HOMEASSISTANT_STARTED,
-            lambda params: init(hass, entry, auto_area)
-        )
+        def _async_started(hass: HomeAssistant) -> None:
+            entry.async_create_task(
+                hass,
+                async_init(hass, entry, auto_area),
+                f"{DOMAIN} init {entry.title}",
+            )
+
+        entry.async_on_unload(async_at_started(hass, _async_started))
 
     return True
 
 
 async def async_init(hass: HomeAssistant, entry: ConfigEntry, auto_area: AutoArea):
     """Initialize component."""
-    # Wait briefly for all area devices/entities to finish registering before
-    # building groups. async_block_till_done() can deadlock here during startup.
-    await asyncio.sleep(2)
+    # Wait until the members of this area have a state (bounded), so groups
+    # and aggregates start from real values instead of missing entities.
+    missing = await async_wait_for_states(
+        hass, auto_area.get_member_entity_ids(), STARTUP_MEMBER_TIMEOUT
+    )
+    if missing:
+        LOGGER.warning(
+            "%s: Starting without states for %s",
+            auto_area.area_name,
+            sorted(missing),
+        )
     # Set up platforms first so the aggregate entities (light group, presence
     # sensor, ...) exist and are available before AutoLights applies the initial
     # light state. Doing this the other way around makes async_initialize call
@@ -91,6 +110,25 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unloaded:
         hass.data[DOMAIN].pop(entry.entry_id)
         LOGGER.warning("Unloaded successfully %s", entry.entry_id)
+        if not any(
+            isinstance(value, AutoArea) for value in hass.data[DOMAIN].values()
+        ):
+            # last area is gone: release shared data
+            area_index = hass.data[DOMAIN].pop(DATA_AREA_INDEX, None)
+            if area_index is not None:
+                area_index.async_shutdown()
+            cover_commands = hass.data[DOMAIN].pop(DATA_COVER_COMMANDS, None)
+            if cover_commands is not None:
+                cover_commands.async_shutdown()
+            light_commands = hass.data[DOMAIN].pop(DATA_LIGHT_COMMANDS, None)
+            if light_commands is not None:
+                light_commands.async_shutdown()
+            presence_timers = hass.data[DOMAIN].pop(DATA_PRESENCE_TIMERS, None)
+            if presence_timers is not None:
+                presence_timers.async_shutdown()
+            state_router = hass.data[DOMAIN].pop(DATA_STATE_ROUTER, None)
+            if state_router is not None:
+                state_router.async_shutdown()
     else:
         LOGGER.error("Couldn't unload config entry %s", entry.entry_id)
 
@@ -0,0 +1,263 @@
+"""Integration-wide index of area members."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.area_registry import (
+    EVENT_AREA_REGISTRY_UPDATED,
+    EventAreaRegistryUpdatedData,
+)
+from homeassistant.helpers.device_registry import (
+    EVENT_DEVICE_REGISTRY_UPDATED,
+    EventDeviceRegistryUpdatedData,
+    async_get as async_get_device_registry,
+)
+from homeassistant.helpers.entity_registry import (
+    EVENT_ENTITY_REGISTRY_UPDATED,
+    EventEntityRegistryUpdatedData,
+    RegistryEntry,
+    async_get as async_get_entity_registry,
+)
+
+from .const import DATA_AREA_INDEX, DOMAIN, LOGGER
+from .ha_helpers import get_area_id
+
+# Called with the changed entity id, or None if the area itself changed
+AreaChangeListener = Callable[[str | None], None]
+
+
+class AreaIndex:
+    """Map area_id -> domain -> device_class -> entity ids.
+
+    The index is built once from the registries and then updated incrementally
+    from registry events, so looking up the members of an area costs
+    O(area size) instead of a scan over the whole entity registry.
+
+    It is also the single registry event dispatcher of the integration: each
+    event is resolved to the affected area(s) once, including the previous area
+    of a moved entity, and only the listeners of those areas are notified.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Build the index from the current registries."""
+        self.hass = hass
+        self.entity_registry = async_get_entity_registry(hass)
+        self.device_registry = async_get_device_registry(hass)
+
+        # area_id -> domain -> device_class -> entity ids (dicts as ordered sets)
+        self._areas: dict[str, dict[str, dict[str | None, dict[str, None]]]] = {}
+        # entity_id -> (resolved area_id, registry entry)
+        self._entries: dict[str, tuple[str | None, RegistryEntry]] = {}
+        # device_id -> entity ids, to re-resolve areas inherited from devices
+        self._device_entities: dict[str, set[str]] = {}
+        self._listeners: dict[str, list[AreaChangeListener]] = {}
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+        for entry in self.entity_registry.entities.values():
+            self._async_add(entry)
+
+        self._unsubs.append(
+            hass.bus.async_listen(
+                EVENT_ENTITY_REGISTRY_UPDATED,
+                self._async_handle_entity_registry_updated,
+            )
+        )
+        self._unsubs.append(
+            hass.bus.async_listen(
+                EVENT_DEVICE_REGISTRY_UPDATED,
+                self._async_handle_device_registry_updated,
+            )
+        )
+        self._unsubs.append(
+            hass.bus.async_listen(
+                EVENT_AREA_REGISTRY_UPDATED,
+                self._async_handle_area_registry_updated,
+            )
+        )
+        LOGGER.debug(
+            "Indexed %s entities in %s areas", len(self._entries), len(self._areas)
+        )
+
+    @callback
+    def async_get_entity_ids(
+        self,
+        area_id: str,
+        domains: Iterable[str] | None = None,
+        device_classes: Iterable[str] | None = None,
+    ) -> list[str]:
+        """Return entity ids of an area, optionally filtered."""
+        area = self._areas.get(area_id)
+        if area is None:
+            return []
+
+        wanted_classes = None if device_classes is None else set(device_classes)
+        entity_ids: dict[str, None] = {}
+        for domain in area if domains is None else domains:
+            for device_class, members in area.get(domain, {}).items():
+                if wanted_classes is None or device_class in wanted_classes:
+                    entity_ids.update(members)
+
+        return list(entity_ids)
+
+    @callback
+    def async_get_entities(
+        self,
+        area_id: str,
+        domains: Iterable[str] | None = None,
+    ) -> list[RegistryEntry]:
+        """Return registry entries of an area, optionally filtered by domain."""
+        return [
+            self._entries[entity_id][1]
+            for entity_id in self.async_get_entity_ids(area_id, domains)
+        ]
+
+    @callback
+    def async_get_area_id(self, entity_id: str) -> str | None:
+        """Return the indexed area of an entity."""
+        indexed = self._entries.get(entity_id)
+        return indexed[0] if indexed is not None else None
+
+    @callback
+    def async_subscribe(
+        self, area_id: str, listener: AreaChangeListener
+    ) -> CALLBACK_TYPE:
+        """Notify listener about registry changes affecting an area."""
+        listeners = self._listeners.setdefault(area_id, [])
+        listeners.append(listener)
+
+        @callback
+        def _async_unsubscribe() -> None:
+            listeners.remove(listener)
+            if not listeners and self._listeners.get(area_id) is listeners:
+                del self._listeners[area_id]
+
+        return _async_unsubscribe
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop listening to registry changes."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+        self._listeners.clear()
+
+    @callback
+    def _async_add(self, entry: RegistryEntry) -> str | None:
+        """Add a registry entry to the index and return its area."""
+        if entry.device_id is not None:
+            self._device_entities.setdefault(entry.device_id, set()).add(
+                entry.entity_id
+            )
+
+        area_id = get_area_id(entry, self.device_registry)
+        self._entries[entry.entity_id] = (area_id, entry)
+        if area_id is None:
+            return None
+
+        device_classes = self._areas.setdefault(area_id, {}).setdefault(
+            entry.domain, {}
+        )
+        for device_class in {entry.device_class, entry.original_device_class}:
+            device_classes.setdefault(device_class, {})[entry.entity_id] = None
+        return area_id
+
+    @callback
+    def _async_remove(
+        self, entity_id: str
+    ) -> tuple[str | None, RegistryEntry] | None:
+        """Remove an entity from the index and return what was indexed."""
+        indexed = self._entries.pop(entity_id, None)
+        if indexed is None:
+            return None
+        area_id, entry = indexed
+
+        if entry.device_id is not None:
+            device_entities = self._device_entities.get(entry.device_id)
+            if device_entities is not None:
+                device_entities.discard(entity_id)
+                if not device_entities:
+                    del self._device_entities[entry.device_id]
+
+        if area_id is None:
+            return indexed
+
+        area = self._areas[area_id]
+        device_classes = area[entry.domain]
+        for device_class in {entry.device_class, entry.original_device_class}:
+            members = device_classes.get(device_class)
+            if members is None:
+                continue
+            members.pop(entity_id, None)
+            if not members:
+                del device_classes[device_class]
+        if not device_classes:
+            del area[entry.domain]
+        if not area:
+            del self._areas[area_id]
+        return indexed
+
+    @callback
+    def _async_reindex(
+        self, entity_id: str, old_entity_id: str | None = None
+    ) -> None:
+        """Re-read an entity from the registry and notify affected areas."""
+        changed = [self._async_remove(entity_id)]
+        if old_entity_id is not None:
+            changed.append(self._async_remove(old_entity_id))
+        if (entry := self.entity_registry.async_get(entity_id)) is not None:
+            changed.append((self._async_add(entry), entry))
+
+        # Our own entities live in the areas too, but must not trigger updates
+        area_ids = {
+            indexed[0]
+            for indexed in changed
+            if indexed is not None
+            and indexed[0] is not None
+            and indexed[1].platform != DOMAIN
+        }
+        for area_id in area_ids:
+            self._async_notify(area_id, entity_id)
+
+    @callback
+    def _async_notify(self, area_id: str, entity_id: str | None) -> None:
+        """Call the listeners of an area."""
+        for listener in list(self._listeners.get(area_id, ())):
+            listener(entity_id)
+
+    @callback
+    def _async_handle_entity_registry_updated(
+        self, event: Event[EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Apply a single entity registry change."""
+        data = event.data
+        self._async_reindex(data["entity_id"], data.get("old_entity_id"))
+
+    @callback
+    def _async_handle_device_registry_updated(
+        self, event: Event[EventDeviceRegistryUpdatedData]
+    ) -> None:
+        """Re-resolve entities inheriting their area from a changed device."""
+        data = event.data
+        if data["action"] != "update" or "area_id" not in data.get("changes", {}):
+            return
+
+        for entity_id in list(self._device_entities.get(data["device_id"], ())):
+            self._async_reindex(entity_id)
+
+    @callback
+    def _async_handle_area_registry_updated(
+        self, event: Event[EventAreaRegistryUpdatedData]
+    ) -> None:
+        """Notify the listeners of a changed area."""
+        if (area_id := event.data.get("area_id")) is not None:
+            self._async_notify(area_id, None)
+
+
+@callback
+def async_get_area_index(hass: HomeAssistant) -> AreaIndex:
+    """Return the shared area index, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (area_index := domain_data.get(DATA_AREA_INDEX)) is None:
+        area_index = domain_data[DATA_AREA_INDEX] = AreaIndex(hass)
+    return area_index
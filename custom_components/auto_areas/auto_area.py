@@ -2,7 +2,7 @@
 from __future__ import annotations
 from collections.abc import Callable
 
-from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.area_registry import async_get as async_get_area_registry
 from homeassistant.helpers.device_registry import async_get as async_get_device_registry
 from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
@@ -12,15 +12,29 @@ from homeassistant.helpers.issue_registry import async_create_issue, IssueSeveri
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.util import slugify
 from homeassistant.helpers.area_registry import AreaEntry
-from homeassistant.helpers.entity_registry import RegistryEntry
+from homeassistant.components.cover import DOMAIN as COVER_DOMAIN
+from homeassistant.components.light import DOMAIN as LIGHT_DOMAIN
 
+from .area_index import async_get_area_index
 from .auto_lights import AutoLights
+from .cover_commands import async_get_cover_commands
+from .light_commands import async_get_light_commands
+from .metrics import AreaMetrics, instrumented
+from .presence_timers import async_get_presence_timers
+from .signals import AreaSignals
+from .state_router import async_get_state_router
 
-from .ha_helpers import get_all_entities, is_valid_entity
+from .ha_helpers import is_valid_entity
 
 from .const import (
+    BUCKET_COVER,
+    BUCKET_LIGHT,
     CONFIG_AREA,
+    CONFIG_COLLECT_METRICS,
+    CONFIG_EXCLUDED_LIGHT_ENTITIES,
+    DEVICE_CLASS_BUCKETS,
     DOMAIN,
+    EXCLUDED_DOMAINS,
     ISSUE_TYPE_INVALID_AREA,
     LOGGER,
     RELEVANT_DOMAINS,
@@ -47,6 +61,15 @@ class AutoArea:
         self.area_registry = async_get_area_registry(self.hass)
         self.device_registry = async_get_device_registry(self.hass)
         self.entity_registry = async_get_entity_registry(self.hass)
+        self.area_index = async_get_area_index(self.hass)
+        self.cover_commands = async_get_cover_commands(self.hass)
+        self.light_commands = async_get_light_commands(self.hass)
+        self.presence_timers = async_get_presence_timers(self.hass)
+        self.state_router = async_get_state_router(self.hass)
+        self.signals = AreaSignals(self.hass)
+        self.metrics = AreaMetrics(
+            bool(entry.options.get(CONFIG_COLLECT_METRICS, False))
+        )
 
         self.area_id: str | None = entry.data.get(CONFIG_AREA, None)
         self.area: AreaEntry | None = self.area_registry.async_get_area(
@@ -67,8 +90,12 @@ class AutoArea:
 
         self.auto_lights = None
         self._registry_unsubs: list[Callable[[], None]] = []
-        self._known_entity_ids: set[str] = set()
         self._reload_debounce_cancel: CALLBACK_TYPE | None = None
+        self._reload_required = False
+        self._rebind_listeners: list[Callable[[], None]] = []
+        self._has_light_group = False
+        self._has_cover_group = False
+        self._buckets: dict[str, list[str]] | None = None
 
     async def async_initialize(self):
         """Subscribe to area changes and reload if necessary."""
@@ -79,63 +106,43 @@ class AutoArea:
         self.auto_lights = AutoLights(self)
         await self.auto_lights.initialize()
 
-        self._known_entity_ids = {
-            e.entity_id for e in self.get_valid_entities()
-        }
+        # Platforms are set up at this point, remember which groups exist
+        self._has_light_group = bool(self.get_light_entity_ids())
+        self._has_cover_group = bool(self.get_cover_entity_ids())
 
         self._registry_unsubs.append(
-            self.hass.bus.async_listen(
-                "entity_registry_updated",
-                self._handle_entity_registry_updated,
-            )
-        )
-        self._registry_unsubs.append(
-            self.hass.bus.async_listen(
-                "area_registry_updated",
-                self._handle_area_registry_updated,
+            self.area_index.async_subscribe(
+                self.area_id or "",
+                self._handle_registry_change,
             )
         )
 
-    async def _handle_entity_registry_updated(self, event: Event) -> None:
-        """Reload when entities in this area change."""
-        data = event.data
-        if data.get("action") not in ("create", "update", "remove"):
-            return
-        entity_id = data.get("entity_id", "")
-        entity = self.entity_registry.async_get(entity_id)
-        if entity is None:
-            # Entity was removed — only reload if it belonged to this area
-            if data.get("action") == "remove" and entity_id in self._known_entity_ids:
-                LOGGER.debug(
-                    "%s: Known entity %s removed, scheduling reload",
-                    self.area_name,
-                    entity_id,
-                )
-                self._known_entity_ids.discard(entity_id)
-                await self._schedule_reload()
-            return
-        # Skip our own entities to avoid infinite reload loops
-        if entity.platform == DOMAIN:
-            return
-        from .ha_helpers import get_area_id
-        if get_area_id(entity, self.device_registry) == self.area_id:
-            LOGGER.debug(
-                "%s: Entity registry change for %s, scheduling reload",
-                self.area_name,
-                entity_id,
-            )
-            await self._schedule_reload()
-
-    async def _handle_area_registry_updated(self, event: Event) -> None:
-        """Reload when this area is updated."""
-        if event.data.get("area_id") == self.area_id:
-            LOGGER.debug(
-                "%s: Area registry updated, scheduling reload",
-                self.area_name,
-            )
-            await self._schedule_reload()
+    @callback
+    def async_register_rebind(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Register an entity to update its members in place on registry changes."""
+        self._rebind_listeners.append(listener)
+
+        @callback
+        def _async_unregister() -> None:
+            self._rebind_listeners.remove(listener)
+
+        return _async_unregister
+
+    @callback
+    def _handle_registry_change(self, entity_id: str | None) -> None:
+        """Rebind when entities in this area change, reload if the area changes."""
+        LOGGER.debug(
+            "%s: Registry change for %s, scheduling update",
+            self.area_name,
+            entity_id or "area",
+        )
+        if entity_id is None:
+            # Names of all our entities depend on the area
+            self._reload_required = True
+        self._schedule_reload()
 
-    async def _schedule_reload(self) -> None:
+    @callback
+    def _schedule_reload(self) -> None:
         """Schedule a debounced reload."""
         if self._reload_debounce_cancel:
             self._reload_debounce_cancel()
@@ -145,14 +152,24 @@ class AutoArea:
             self._do_reload,
         )
 
+    @instrumented
     async def _do_reload(self, _now=None) -> None:
-        """Execute the actual reload."""
+        """Rebind entities in place, or reload if groups must be (re)created."""
         self._reload_debounce_cancel = None
-        self._known_entity_ids = {
-            e.entity_id for e in self.get_valid_entities()
-        }
-        LOGGER.debug("%s: Reloading config entry", self.area_name)
-        await self.hass.config_entries.async_reload(self.config_entry.entry_id)
+        self._buckets = None
+        if (
+            self._reload_required
+            or bool(self.get_light_entity_ids()) != self._has_light_group
+            or bool(self.get_cover_entity_ids()) != self._has_cover_group
+        ):
+            self._reload_required = False
+            LOGGER.debug("%s: Reloading config entry", self.area_name)
+            await self.hass.config_entries.async_reload(self.config_entry.entry_id)
+            return
+
+        LOGGER.debug("%s: Rebinding entities", self.area_name)
+        for listener in list(self._rebind_listeners):
+            listener()
 
     def cleanup(self):
         """Deinitialize this area."""
@@ -169,28 +186,71 @@ class AutoArea:
         if self.auto_lights:
             self.auto_lights.cleanup()
 
-    def get_valid_entities(self) -> list[RegistryEntry]:
-        """Return all valid and relevant entities for this area."""
-        entities = [
-            entity
-            for entity in get_all_entities(
-                self.entity_registry,
-                self.device_registry,
+    def get_member_entity_ids(self) -> list[str]:
+        """Return all enabled entities of this area that are not our own."""
+        return [
+            entity.entity_id
+            for entity in self.area_index.async_get_entities(
                 self.area_id or "",
                 RELEVANT_DOMAINS,
             )
-            if is_valid_entity(self.hass, entity)
+            if not entity.disabled and entity.platform != DOMAIN
         ]
-        return entities
 
-    def get_area_entity_ids(self, device_classes: list[str]) -> list[str]:
-        """Return all entity ids in a list of device classes."""
-        return [
-            entity.entity_id
-            for entity in self.get_valid_entities()
-            if entity.device_class in device_classes
-            or entity.original_device_class in device_classes
-        ]
+    def get_entity_ids(self, bucket: str) -> list[str]:
+        """Return the entity ids of a classification bucket (see const.BUCKET_*)."""
+        if self._buckets is None:
+            self._buckets = self._classify_entities()
+        return list(self._buckets.get(bucket, ()))
+
+    def _classify_entities(self) -> dict[str, list[str]]:
+        """Sort all area members into buckets in a single pass.
+
+        Every platform reads its members from these buckets, so setting up an
+        area looks at each registry entry once instead of once per entity.
+        The buckets are dropped whenever the area changes.
+        """
+        excluded_light_entities = set(
+            self.config_entry.options.get(CONFIG_EXCLUDED_LIGHT_ENTITIES) or []
+        )
+        buckets: dict[str, list[str]] = {}
+        for entity in self.area_index.async_get_entities(
+            self.area_id or "",
+            RELEVANT_DOMAINS,
+        ):
+            if entity.domain == LIGHT_DOMAIN:
+                # Lights are only filtered by the light options
+                if (
+                    entity.entity_id not in excluded_light_entities
+                    and entity.platform not in EXCLUDED_DOMAINS
+                ):
+                    buckets.setdefault(BUCKET_LIGHT, []).append(entity.entity_id)
+                continue
+            if entity.platform == DOMAIN or not is_valid_entity(entity):
+                continue
+            if entity.domain == COVER_DOMAIN and entity.platform not in EXCLUDED_DOMAINS:
+                buckets.setdefault(BUCKET_COVER, []).append(entity.entity_id)
+            for bucket in {
+                DEVICE_CLASS_BUCKETS.get(device_class or "")
+                for device_class in (entity.device_class, entity.original_device_class)
+            }:
+                if bucket is not None:
+                    buckets.setdefault(bucket, []).append(entity.entity_id)
+
+        LOGGER.debug(
+            "%s: Classified entities %s",
+            self.area_name,
+            {bucket: len(entity_ids) for bucket, entity_ids in buckets.items()},
+        )
+        return buckets
+
+    def get_light_entity_ids(self) -> list[str]:
+        """Return all lights to be controlled in this area."""
+        return self.get_entity_ids(BUCKET_LIGHT)
+
+    def get_cover_entity_ids(self) -> list[str]:
+        """Return all covers in this area."""
+        return self.get_entity_ids(BUCKET_COVER)
 
     @property
     def device_info(self) -> DeviceInfo:
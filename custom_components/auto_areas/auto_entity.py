@@ -1,21 +1,50 @@
 """Base auto-entity class."""
 
-from typing import Generic, TypeVar, cast
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Generic, TypeVar, cast
 
-from homeassistant.core import Event, EventStateChangedData, State, HomeAssistant
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    State,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.const import STATE_UNKNOWN, STATE_UNAVAILABLE
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.typing import StateType
 from homeassistant.components.sensor.const import SensorDeviceClass
 from homeassistant.components.cover import CoverDeviceClass
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_time_interval,
+)
 
-from custom_components.auto_areas.calculations import get_calculation
+from custom_components.auto_areas.calculations import (
+    get_aggregator,
+    get_calculation,
+    get_deadband,
+    is_significant_change,
+)
 
 from .auto_area import AutoArea
-from .const import LOGGER
+from .ha_helpers import is_attribute_only_change
+from .metrics import instrumented
+from .state_router import StateSubscription
+from .const import (
+    CONFIG_COALESCE_UPDATES,
+    CONFIG_COALESCE_WINDOW,
+    CONFIG_MAX_PUBLISH_INTERVAL,
+    CONFIG_MIN_PUBLISH_INTERVAL,
+    CONFIG_TRACK_ATTRIBUTE_UPDATES,
+    DEVICE_CLASS_BUCKETS,
+    LOGGER,
+)
 
 _TEntity = TypeVar("_TEntity", bound=Entity)
 _TDeviceClass = TypeVar(
@@ -26,9 +55,12 @@ _TDeviceClass = TypeVar(
 )
 
 
-class AutoEntity(Entity, Generic[_TEntity, _TDeviceClass]):
+class AutoEntity(RestoreEntity, Generic[_TEntity, _TDeviceClass]):
     """Set up an Auto Area entity."""
 
+    # Area signal the state is published to, see AreaSignals
+    _signal: str | None = None
+
     def __init__(self,
                  hass: HomeAssistant,
                  auto_area: AutoArea,
@@ -40,15 +72,49 @@ class AutoEntity(Entity, Generic[_TEntity, _TDeviceClass]):
         super().__init__()
         self.hass = hass
         self.auto_area = auto_area
+        self.metrics = auto_area.metrics
         self._device_class = device_class
         self._name_prefix = name_prefix
         self._prefix = prefix
 
         self.entity_ids: list[str] = self._get_sensor_entities()
-        self.unsubscribe = None
+        self._subscription: StateSubscription | None = None
         self.entity_states: dict[str, State] = {}
         self.entity_float_values: dict[str, float] = {}
         self._aggregated_state: StateType = None
+        # Whether _aggregated_state was restored and no member has reported yet
+        self._restored = False
+        self._aggregator = get_aggregator(
+            self.auto_area.config_entry.options,
+            self.device_class
+        )
+        # Attribute-only updates are dropped unless explicitly requested
+        self._track_attribute_updates = bool(
+            self.auto_area.config_entry.options.get(
+                CONFIG_TRACK_ATTRIBUTE_UPDATES, False
+            )
+        )
+        self._deadband, self._deadband_relative = get_deadband(
+            self.auto_area.config_entry.options,
+            self.device_class
+        )
+        # Publishing limits, in seconds (0 = disabled)
+        self._min_publish_interval = float(
+            self.auto_area.config_entry.options.get(CONFIG_MIN_PUBLISH_INTERVAL) or 0
+        )
+        self._max_publish_interval = float(
+            self.auto_area.config_entry.options.get(CONFIG_MAX_PUBLISH_INTERVAL) or 0
+        )
+        self._last_publish: float | None = None
+        self._publish_cancel: CALLBACK_TYPE | None = None
+        # Coalescing of member updates, window in seconds (0 = same loop iteration)
+        self._coalesce = bool(
+            self.auto_area.config_entry.options.get(CONFIG_COALESCE_UPDATES, False)
+        )
+        self._coalesce_window = float(
+            self.auto_area.config_entry.options.get(CONFIG_COALESCE_WINDOW) or 0
+        ) / 1000
+        self._evaluate_handle: asyncio.Handle | None = None
 
         LOGGER.info(
             "%s (%s): Initialized sensor. Entities: %s",
@@ -59,12 +125,8 @@ class AutoEntity(Entity, Generic[_TEntity, _TDeviceClass]):
 
     def _get_sensor_entities(self) -> list[str]:
         """Retrieve all relevant entity ids for this sensor."""
-        return [
-            entity.entity_id
-            for entity in self.auto_area.get_valid_entities()
-            if entity.device_class == self.device_class
-            or entity.original_device_class == self.device_class
-        ]
+        bucket = DEVICE_CLASS_BUCKETS.get(self.device_class)
+        return self.auto_area.get_entity_ids(bucket) if bucket is not None else []
 
     @property
     def name(self):
@@ -97,57 +159,285 @@ class AutoEntity(Entity, Generic[_TEntity, _TDeviceClass]):
         for entity_id in self.entity_ids:
             state = self.hass.states.get(entity_id)
             if state is not None:
-                try:
-                    self.entity_states[entity_id] = state
-                except ValueError:
-                    LOGGER.warning(
-                        "%s (%s): No initial state available for %s",
-                        self.auto_area.area_name,
-                        self.device_class,
-                        entity_id
-                    )
+                self._update_entity_state(state)
+            else:
+                LOGGER.debug(
+                    "%s (%s): No initial state available for %s",
+                    self.auto_area.area_name,
+                    self.device_class,
+                    entity_id
+                )
 
         self._aggregated_state = self._get_state()
-        self.async_write_ha_state()
+        await self._async_restore_state()
+        self._async_write_state()
 
         # Subscribe to state changes
-        self.unsubscribe = async_track_state_change_event(
-            self.hass,
-            self.entity_ids,
-            self._handle_state_change,
+        self._async_subscribe_members()
+        self.async_on_remove(self.auto_area.async_register_rebind(self._async_rebind))
+        if self._max_publish_interval > 0:
+            self.async_on_remove(
+                async_track_time_interval(
+                    self.hass,
+                    self._async_heartbeat,
+                    timedelta(seconds=self._max_publish_interval),
+                )
+            )
+
+    async def _async_restore_state(self) -> None:
+        """Restore the last state until a tracked entity reports.
+
+        After a restart most members have not reported yet, so a freshly
+        calculated state would be wrong and make AutoLights act on it. The
+        restored state is kept until a member has a usable state.
+        """
+        if self._has_member_state():
+            return
+
+        last_state = await self.async_get_last_state()
+        if last_state is None or last_state.state in (
+            STATE_UNKNOWN,
+            STATE_UNAVAILABLE,
+        ):
+            return
+
+        LOGGER.debug(
+            "%s (%s): Restoring last state %s",
+            self.auto_area.area_name,
+            self.device_class,
+            last_state.state
+        )
+        self._restore_state(last_state)
+        self._restored = True
+
+    def _has_member_state(self) -> bool:
+        """Return whether any tracked entity has a usable state."""
+        return bool(self.entity_states)
+
+    def _keeps_restored_state(self) -> bool:
+        """Return whether the restored state is kept as no member reported yet."""
+        if self._restored and not self._has_member_state():
+            return True
+        self._restored = False
+        return False
+
+    def _restore_state(self, last_state: State) -> None:
+        """Apply a restored state."""
+        try:
+            self._aggregated_state = float(last_state.state)
+        except ValueError:
+            return
+
+    @callback
+    def _async_subscribe_members(self) -> None:
+        """Subscribe to state changes of all tracked entities.
+
+        Later calls only add and remove the entities that changed.
+        """
+        if self._subscription is None:
+            self._subscription = self.auto_area.state_router.async_subscribe(
+                self.entity_ids, self._handle_state_change
+            )
+        else:
+            self._subscription.async_set_entity_ids(self.entity_ids)
+
+    @callback
+    def _async_rebind(self) -> None:
+        """Update tracked entities in place after a registry change."""
+        entity_ids = self._get_sensor_entities()
+        if entity_ids == self.entity_ids:
+            return
+
+        added = set(entity_ids) - set(self.entity_ids)
+        removed = set(self.entity_ids) - set(entity_ids)
+        LOGGER.info(
+            "%s (%s): Tracked entities changed. Added: %s, removed: %s",
+            self.auto_area.area_name,
+            self.device_class,
+            added,
+            removed,
         )
+        self.entity_ids = entity_ids
+        self._async_subscribe_members()
+        self._async_members_changed(added, removed)
 
-    async def _handle_state_change(self, event: Event[EventStateChangedData]):
+    @callback
+    def _async_members_changed(self, added: set[str], removed: set[str]) -> None:
+        """Update the aggregate after tracked entities were added or removed."""
+        for entity_id in removed:
+            self._remove_entity_state(entity_id)
+        for entity_id in added:
+            if (state := self.hass.states.get(entity_id)) is not None:
+                self._update_entity_state(state)
+
+        self._async_update_aggregate()
+
+    @callback
+    @instrumented
+    def _handle_state_change(self, event: Event[EventStateChangedData]) -> None:
         """Handle state change of any tracked illuminance sensors."""
+        if is_attribute_only_change(event) and not self._track_attribute_updates:
+            return
+
         to_state = event.data.get("new_state")
         if to_state is None:
             return
 
-        if to_state.state in [
+        self._update_entity_state(to_state)
+        self._async_schedule_evaluation()
+
+    @callback
+    def _async_schedule_evaluation(self) -> None:
+        """Evaluate the entity now, or once per burst of member updates.
+
+        With coalescing enabled, the first update of a burst schedules the
+        evaluation for the end of the current loop iteration (or the coalesce
+        window). Further updates until then only change the member values.
+        """
+        if not self._coalesce:
+            self._async_evaluate()
+            return
+        if self._evaluate_handle is not None:
+            self.metrics.count("coalesced_updates")
+            return
+        if self._coalesce_window > 0:
+            self._evaluate_handle = self.hass.loop.call_later(
+                self._coalesce_window, self._async_run_evaluation
+            )
+        else:
+            self._evaluate_handle = self.hass.loop.call_soon(
+                self._async_run_evaluation
+            )
+
+    @callback
+    def _async_run_evaluation(self) -> None:
+        """Run a scheduled evaluation."""
+        self._evaluate_handle = None
+        self._async_evaluate()
+
+    @callback
+    def _async_evaluate(self) -> None:
+        """Derive the entity state from the current member values."""
+        self._async_update_aggregate()
+
+    @callback
+    def _async_update_aggregate(self) -> None:
+        """Publish the aggregated state, unless it stayed within the deadband.
+
+        The value is compared with the last published state, so slow drifts are
+        still published once they add up to more than the deadband. With a
+        minimum publish interval, updates arriving too early are published
+        together at the end of the interval.
+        """
+        if self._keeps_restored_state():
+            return
+
+        value = self._get_state()
+        if not is_significant_change(
+            self._aggregated_state,
+            value,
+            self._deadband,
+            self._deadband_relative,
+        ):
+            return
+
+        if self._min_publish_interval > 0 and self._last_publish is not None:
+            wait = self._last_publish + self._min_publish_interval - self.hass.loop.time()
+            if wait > 0:
+                if self._publish_cancel is None:
+                    self._publish_cancel = async_call_later(
+                        self.hass, wait, self._async_publish_pending
+                    )
+                return
+
+        self._async_publish(value)
+
+    @callback
+    def _async_publish(self, value: StateType) -> None:
+        """Write the aggregated state."""
+        if self._publish_cancel is not None:
+            self._publish_cancel()
+            self._publish_cancel = None
+        self._aggregated_state = value
+        self._last_publish = self.hass.loop.time()
+        self._async_write_state()
+
+    @property
+    def _signal_value(self) -> Any:
+        """Return the value published to the area signal."""
+        if isinstance(self._aggregated_state, int | float):
+            return float(self._aggregated_state)
+        return None
+
+    @callback
+    def _async_write_state(self) -> None:
+        """Write the state and publish it to the area signal, if any."""
+        self.async_write_ha_state()
+        if self._signal is not None:
+            self.auto_area.signals.async_publish(self._signal, self._signal_value)
+
+    @callback
+    def _async_publish_pending(self, _now: datetime) -> None:
+        """Publish the latest value after the minimum publish interval."""
+        self._publish_cancel = None
+        self._async_update_aggregate()
+
+    @callback
+    def _async_heartbeat(self, _now: datetime) -> None:
+        """Publish the latest value if nothing was published for too long."""
+        if (
+            self._last_publish is not None
+            and self.hass.loop.time() - self._last_publish < self._max_publish_interval
+        ):
+            return
+        if self._keeps_restored_state():
+            return
+        self._async_publish(self._get_state())
+
+    def _update_entity_state(self, state: State) -> None:
+        """Store the numeric value of a tracked entity, or drop it."""
+        if state.state in [
             STATE_UNKNOWN,
             STATE_UNAVAILABLE,
         ]:
-            self.entity_states.pop(to_state.entity_id, None)
-            self.entity_float_values.pop(to_state.entity_id, None)
-        else:
-            try:
-                self.entity_float_values[to_state.entity_id] = float(to_state.state)
-                self.entity_states[to_state.entity_id] = to_state
-            except ValueError:
-                self.entity_states.pop(to_state.entity_id, None)
-                self.entity_float_values.pop(to_state.entity_id, None)
+            self._remove_entity_state(state.entity_id)
+            return
 
-        self._aggregated_state = self._get_state()
+        try:
+            value = float(state.state)
+        except ValueError:
+            self._remove_entity_state(state.entity_id)
+            return
 
-        self.async_write_ha_state()
+        self.entity_float_values[state.entity_id] = value
+        self.entity_states[state.entity_id] = state
+        if self._aggregator is not None:
+            self._aggregator.update(state.entity_id, value, state.last_updated)
+
+    def _remove_entity_state(self, entity_id: str) -> None:
+        """Drop a tracked entity from the aggregate."""
+        self.entity_states.pop(entity_id, None)
+        self.entity_float_values.pop(entity_id, None)
+        if self._aggregator is not None:
+            self._aggregator.remove(entity_id)
 
     async def async_will_remove_from_hass(self) -> None:
         """Clean up event listeners."""
-        if self.unsubscribe:
-            self.unsubscribe()
+        if self._subscription is not None:
+            self._subscription.async_unsubscribe()
+            self._subscription = None
+        if self._publish_cancel is not None:
+            self._publish_cancel()
+            self._publish_cancel = None
+        if self._evaluate_handle is not None:
+            self._evaluate_handle.cancel()
+            self._evaluate_handle = None
 
     def _get_state(self) -> StateType | None:
         """Get the state of the sensor."""
+        if self._aggregator is not None:
+            return self._aggregator.value
+
         calculate_state = get_calculation(
             self.auto_area.config_entry.options,
             self.device_class
@@ -1,26 +1,30 @@
 """Auto lights."""
-from homeassistant.components.light import DOMAIN as LIGHT_DOMAIN
-from homeassistant.helpers.event import async_track_state_change_event
-from homeassistant.core import Event, EventStateChangedData
+import asyncio
+
+from homeassistant.core import Event, EventStateChangedData, callback
 from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    STATE_OFF,
     STATE_ON,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     SERVICE_TURN_ON,
     SERVICE_TURN_OFF,
-    ATTR_ENTITY_ID,
 )
 from homeassistant.util import slugify
 
+from .metrics import instrumented
 from .const import (
     CONFIG_AUTO_LIGHTS_MAX_ILLUMINANCE,
-    ILLUMINANCE_SENSOR_ENTITY_PREFIX,
     LIGHT_GROUP_ENTITY_PREFIX,
     LOGGER,
     CONFIG_IS_SLEEPING_AREA,
     CONFIG_EXCLUDED_LIGHT_ENTITIES,
-    PRESENCE_BINARY_SENSOR_ENTITY_PREFIX,
-    SLEEP_MODE_SWITCH_ENTITY_PREFIX,
+    CONFIG_DIFFERENTIAL_LIGHT_COMMANDS,
+    DIFFERENTIAL_LIGHT_GROUP_RATIO,
+    SIGNAL_ILLUMINANCE,
+    SIGNAL_PRESENCE,
+    SIGNAL_SLEEP_MODE,
 )
 
 
@@ -31,6 +35,7 @@ class AutoLights:
         """Initialize entities."""
         self.auto_area = auto_area
         self.hass = auto_area.hass
+        self.metrics = auto_area.metrics
 
         self.unsubscribe_sleep_mode = None
         self.unsubscribe_presence = None
@@ -52,20 +57,13 @@ class AutoLights:
                 CONFIG_EXCLUDED_LIGHT_ENTITIES)
             or []
         )
-
-        # Entities
-        self.sleep_mode_entity_id = (
-            f"{SLEEP_MODE_SWITCH_ENTITY_PREFIX}{
-                slugify(self.auto_area.area_name)}"
-        )
-        self.presence_entity_id = (
-            f"{PRESENCE_BINARY_SENSOR_ENTITY_PREFIX}{
-                slugify(self.auto_area.area_name)}"
-        )
-        self.illuminance_entity_id = (
-            f"{ILLUMINANCE_SENSOR_ENTITY_PREFIX}{
-                slugify(self.auto_area.area_name)}"
+        self.differential_light_commands = (
+            self.auto_area.config_entry.options.get(
+                CONFIG_DIFFERENTIAL_LIGHT_COMMANDS) or False
         )
+
+        # Presence, illuminance and sleep mode are received as area signals
+        self.signals = auto_area.signals
         self.light_group_entity_id = (
             f"{LIGHT_GROUP_ENTITY_PREFIX}{
                 slugify(self.auto_area.area_name)}"
@@ -83,84 +81,56 @@ class AutoLights:
         )
 
     async def initialize(self):
-        """Start subscribing to state changes."""
-        LOGGER.debug("AutoLights %s %s",
-                     self.presence_entity_id,
-                     self.illuminance_entity_id
-                     )
+        """Start subscribing to area signals and light changes."""
+        LOGGER.debug("%s: AutoLights starting", self.auto_area.area_name)
 
         if self.is_sleeping_area:
             # set initial state
-            sleep_mode_state = self.hass.states.get(self.sleep_mode_entity_id)
-            if sleep_mode_state:
-                self.sleep_mode_enabled = sleep_mode_state.state == STATE_ON
-            self.unsubscribe_sleep_mode = async_track_state_change_event(
-                self.hass,
-                self.sleep_mode_entity_id,
-                self.handle_sleep_mode_state_change,
+            self.sleep_mode_enabled = self.signals.async_get(SIGNAL_SLEEP_MODE)
+            self.unsubscribe_sleep_mode = self.signals.async_subscribe(
+                SIGNAL_SLEEP_MODE,
+                self.handle_sleep_mode_change,
             )
 
         # set lights initially based on presence
-        initial_presence_state = self.hass.states.get(self.presence_entity_id)
-        if initial_presence_state and self.light_group_entity_id:
-            if initial_presence_state.state == STATE_ON:
-                LOGGER.info(
-                    "%s: Initial presence detected. Turning lights on %s",
-                    self.auto_area.area_name,
-                    self.light_group_entity_id,
-                )
-                await self._turn_lights_on()
-            else:
-                LOGGER.info(
-                    "%s: No initial presence detected. Turning lights off %s",
-                    self.auto_area.area_name,
-                    self.light_group_entity_id,
-                )
-                await self._turn_lights_off()
+        initial_presence = self.signals.async_get(SIGNAL_PRESENCE)
+        if initial_presence is not None and self.light_group_entity_id:
+            LOGGER.info(
+                "%s: Initial presence %s. Reconciling lights %s",
+                self.auto_area.area_name,
+                initial_presence,
+                self.light_group_entity_id,
+            )
+            await self.reconcile_lights(initial_presence)
 
-        self.unsubscribe_presence = async_track_state_change_event(
-            self.auto_area.hass,
-            self.presence_entity_id,
-            self.handle_presence_state_change,
+        self.unsubscribe_presence = self.signals.async_subscribe(
+            SIGNAL_PRESENCE,
+            self.handle_presence_change,
         )
 
-        self.unsubscribe_illuminance = async_track_state_change_event(
-            self.auto_area.hass,
-            self.illuminance_entity_id,
+        self.unsubscribe_illuminance = self.signals.async_subscribe(
+            SIGNAL_ILLUMINANCE,
             self.handle_illuminance_change,
         )
 
-        self.unsubscribe_lights = async_track_state_change_event(
-            self.hass,
-            self.light_group_entity_id,
+        self.unsubscribe_lights = self.auto_area.state_router.async_subscribe(
+            [self.light_group_entity_id],
             self.handle_light_group_state_change,
-        )
+        ).async_unsubscribe
 
-    async def handle_presence_state_change(self, event: Event[EventStateChangedData]):
+    @instrumented
+    async def handle_presence_change(self, presence: bool | None):
         """Handle changes in presence."""
-        entity_id = event.data.get('entity_id')
-        from_state = event.data.get('old_state')
-        to_state = event.data.get('new_state')
-
-        LOGGER.debug("handle_presence_state_change")
-
-        previous_state = from_state.state if from_state else ""
-        if to_state is None:
+        if presence is None:
             return
 
-        current_state = to_state.state
-
         LOGGER.debug(
-            "%s: State change of presence entity %s -> %s",
-            entity_id,
-            previous_state,
-            current_state,
+            "%s: Presence changed to %s",
+            self.auto_area.area_name,
+            presence,
         )
 
-        if previous_state == current_state or current_state is None:
-            return
-
-        if current_state == STATE_ON:
+        if presence:
             if self.sleep_mode_enabled:
                 LOGGER.info(
                     "%s: Sleep mode is on. Not turning on lights",
@@ -201,6 +171,10 @@ class AutoLights:
                 )
             await self._turn_lights_off()
 
+    def has_presence(self) -> bool:
+        """Return whether the area is currently occupied."""
+        return self.signals.async_get(SIGNAL_PRESENCE) is True
+
     def _light_group_available(self) -> bool:
         """Return True if the area's light group entity exists and is available.
 
@@ -222,51 +196,124 @@ class AutoLights:
             return False
         return True
 
-    async def _turn_lights_on(self):
+    async def reconcile_lights(self, turn_on: bool) -> None:
+        """Bring the lights into the desired state, commanding only differences.
+
+        The group is commanded as a whole if all of its members differ, single
+        members otherwise. Nothing is sent if the lights already match, so
+        restarts and reloads do not cause any light traffic by themselves.
+        """
         if not self._light_group_available():
             return
-        await self.hass.services.async_call(
-            LIGHT_DOMAIN,
-            SERVICE_TURN_ON,
-            {ATTR_ENTITY_ID: self.light_group_entity_id},
+
+        entity_ids = self._differing_lights(turn_on, group_ratio=1.0)
+        if entity_ids:
+            if turn_on:
+                await self._turn_lights_on(entity_ids)
+            else:
+                await self._turn_lights_off(entity_ids)
+        self.lights_turned_on = turn_on
+
+    def _differing_lights(self, turn_on: bool, group_ratio: float) -> list[str]:
+        """Return the entities to command to bring the lights into a state.
+
+        This is the light group itself if at least ``group_ratio`` of its
+        members differ, the differing members otherwise, or nothing if the
+        lights already match. Unavailable members are never commanded.
+        """
+        desired_state = STATE_ON if turn_on else STATE_OFF
+        group_state = self.hass.states.get(self.light_group_entity_id)
+        member_ids: list[str] = list(group_state.attributes.get(ATTR_ENTITY_ID) or [])
+        if group_state.state == STATE_OFF or not member_ids:
+            # All members of a group that is off are off as well
+            commanded = group_state.state != desired_state
+            differing: list[str] = []
+        else:
+            differing = [
+                entity_id
+                for entity_id in member_ids
+                if (state := self.hass.states.get(entity_id)) is not None
+                and state.state not in (desired_state, STATE_UNAVAILABLE, STATE_UNKNOWN)
+            ]
+            commanded = bool(differing)
+
+        LOGGER.debug(
+            "%s: Lights to %s (group %s, differing members %s)",
+            self.auto_area.area_name,
+            desired_state,
+            group_state.state,
+            differing,
         )
+        if not commanded:
+            return []
+        if not differing or len(differing) >= group_ratio * len(member_ids):
+            return [self.light_group_entity_id]
+        return differing
+
+    def _light_targets(self, turn_on: bool) -> list[str]:
+        """Return the entities a turn on/off command is sent to."""
+        if not self.differential_light_commands:
+            return [self.light_group_entity_id]
+        return self._differing_lights(turn_on, DIFFERENTIAL_LIGHT_GROUP_RATIO)
+
+    async def _turn_lights_on(self, entity_ids: list[str] | None = None):
+        if not self._light_group_available():
+            return
+        if entity_ids is None:
+            entity_ids = self._light_targets(True)
+        if entity_ids and not await self._async_call_lights(
+            SERVICE_TURN_ON, entity_ids
+        ):
+            return
         self.lights_turned_on = True
 
-    async def _turn_lights_off(self):
+    async def _turn_lights_off(self, entity_ids: list[str] | None = None):
         if not self._light_group_available():
             return
-        self._auto_turning_off = True
-        try:
-            await self.hass.services.async_call(
-                LIGHT_DOMAIN,
-                SERVICE_TURN_OFF,
-                {ATTR_ENTITY_ID: self.light_group_entity_id},
-            )
-        finally:
-            self._auto_turning_off = False
+        if entity_ids is None:
+            entity_ids = self._light_targets(False)
+        if entity_ids:
+            self._auto_turning_off = True
+            try:
+                sent = await self._async_call_lights(SERVICE_TURN_OFF, entity_ids)
+            finally:
+                self._auto_turning_off = False
+            if not sent:
+                return
         self.lights_turned_on = False
 
-    async def handle_sleep_mode_state_change(self, event: Event[EventStateChangedData]):
-        """Handle changes in sleep mode."""
-
-        entity_id = event.data.get('entity_id')
-        from_state = event.data.get('old_state')
-        to_state = event.data.get('new_state')
-
-        previous_state = from_state.state if from_state else ""
-        current_state = to_state.state if to_state else ""
+    async def _async_call_lights(self, service: str, entity_ids: list[str]) -> bool:
+        """Send a light command, coalesced with other areas.
 
+        Return False if a later command for one of the lights superseded it.
+        """
+        self.metrics.count(f"light.{service}")
+        sent = await asyncio.gather(
+            *(
+                self.auto_area.light_commands.async_call(service, entity_id)
+                for entity_id in entity_ids
+            )
+        )
+        if all(sent_service == service for sent_service in sent):
+            return True
         LOGGER.debug(
-            "%s: State change of sleep mode %s -> %s",
-            entity_id,
-            previous_state,
-            current_state,
+            "%s: Light command %s superseded by %s",
+            self.auto_area.area_name,
+            service,
+            sent,
         )
+        return False
 
-        if previous_state == current_state:
-            return
+    @instrumented
+    async def handle_sleep_mode_change(self, enabled: bool | None):
+        """Handle changes in sleep mode."""
+        LOGGER.debug(
+            "%s: Sleep mode changed to %s",
+            self.auto_area.area_name,
+            enabled,
+        )
 
-        if current_state == STATE_ON:
+        if enabled:
             LOGGER.info(
                 "%s: Sleep mode enabled - turning lights off %s",
                 self.auto_area.area_name,
@@ -280,10 +327,7 @@ class AutoLights:
                 self.auto_area.area_name,
             )
             self.sleep_mode_enabled = False
-            has_presence = (
-                self.hass.states.get(self.presence_entity_id).state == STATE_ON
-            )
-            if has_presence:
+            if self.has_presence():
                 if not self.is_below_illuminance_threshold():
                     return
                 LOGGER.info(
@@ -293,11 +337,12 @@ class AutoLights:
                 )
                 await self._turn_lights_on()
 
-    async def handle_illuminance_change(self, _event: Event[EventStateChangedData]):
+    @instrumented
+    async def handle_illuminance_change(self, _illuminance: float | None):
         """Handle changes in illuminance."""
 
         # Check for presence
-        if self.hass.states.get(self.presence_entity_id).state != STATE_ON:
+        if not self.has_presence():
             return
 
         # Check for sleep mode
@@ -319,7 +364,9 @@ class AutoLights:
         )
         await self._turn_lights_on()
 
-    async def handle_light_group_state_change(self, event: Event[EventStateChangedData]):
+    @callback
+    @instrumented
+    def handle_light_group_state_change(self, event: Event[EventStateChangedData]):
         """Track manual light overrides by watching the light group state."""
         to_state = event.data.get("new_state")
         from_state = event.data.get("old_state")
@@ -332,9 +379,7 @@ class AutoLights:
             self.manually_turned_off = False
         else:
             # Lights turned off — detect manual action
-            presence_state = self.hass.states.get(self.presence_entity_id)
-            presence_on = presence_state and presence_state.state == STATE_ON
-            if presence_on and not self.sleep_mode_enabled and not self._auto_turning_off and self.lights_turned_on:
+            if self.has_presence() and not self.sleep_mode_enabled and not self._auto_turning_off and self.lights_turned_on:
                 self.manually_turned_off = True
                 LOGGER.debug(
                     "%s: Lights manually turned off while presence active — setting override",
@@ -358,14 +403,7 @@ class AutoLights:
 
     def get_current_illuminance(self) -> float | None:
         """Return current area illuminance."""
-        try:
-            current_illuminance = float(
-                self.hass.states.get(self.illuminance_entity_id).state
-            )
-        except (ValueError, AttributeError):
-            current_illuminance = None
-
-        return current_illuminance
+        return self.signals.async_get(SIGNAL_ILLUMINANCE)
 
     def cleanup(self):
         """Deinitialize this area."""
@@ -0,0 +1,212 @@
+"""Binary sensor that is on while any tracked entity is on."""
+
+from __future__ import annotations
+
+from typing import Any, Literal, override
+from homeassistant.core import Event, EventStateChangedData, State, callback
+from homeassistant.const import STATE_ON, STATE_OFF
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+from homeassistant.helpers.event import async_track_time_interval
+
+from custom_components.auto_areas.ha_helpers import (
+    get_active_entity_ids,
+    has_reported_state,
+    is_attribute_only_change,
+)
+from custom_components.auto_areas.auto_area import AutoArea
+from custom_components.auto_areas.auto_entity import AutoEntity
+from custom_components.auto_areas.metrics import instrumented
+from custom_components.auto_areas.const import (
+    LOGGER,
+    RECONCILE_INTERVAL,
+)
+
+
+class AnyOnBinarySensor(
+    AutoEntity[BinarySensorEntity, BinarySensorDeviceClass], BinarySensorEntity
+):
+    """Aggregated binary sensor that is on while any tracked entity is on.
+
+    Subclasses set the area bucket of the tracked entities, the attribute the
+    number of active entities is exposed as and the icons.
+    """
+
+    _bucket: str
+    _count_attribute: str
+    _icon_on: str
+    _icon_off: str
+
+    def __init__(
+        self,
+        hass,
+        auto_area: AutoArea,
+        device_class: BinarySensorDeviceClass,
+        name_prefix: str,
+        prefix: str,
+    ) -> None:
+        """Initialize binary sensor."""
+        super().__init__(hass, auto_area, device_class, name_prefix, prefix)
+        self.any_on: bool | None = None
+        # Tracked entities that are currently on
+        self._active: set[str] = set()
+
+    @override
+    @property
+    def icon(self) -> str:
+        """Return icon based on the state."""
+        return self._icon_on if self.any_on else self._icon_off
+
+    @override
+    @property
+    def state(self) -> Literal["on", "off"] | None:  # type: ignore
+        """Return the state of the binary sensor."""
+        if self.any_on is None:
+            return None
+
+        return STATE_ON if self.any_on else STATE_OFF
+
+    @override
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the number of active entities."""
+        return {self._count_attribute: len(self._active)}
+
+    @override
+    def _get_sensor_entities(self) -> list[str]:
+        """Collect the entities of the sensor's bucket."""
+        return self.auto_area.get_entity_ids(self._bucket)
+
+    @override
+    def _has_member_state(self) -> bool:
+        """Return whether any tracked entity has a usable state."""
+        return has_reported_state(self.hass, self.entity_ids)
+
+    @override
+    def _restore_state(self, last_state: State) -> None:
+        """Apply the restored state."""
+        self.any_on = last_state.state == STATE_ON
+
+    def _get_active(self) -> set[str]:
+        """Read the tracked entities that are on from the state machine."""
+        return get_active_entity_ids(self.hass, self.entity_ids, [STATE_ON])
+
+    @override
+    async def async_added_to_hass(self):
+        """Start tracking sensors."""
+        LOGGER.debug(
+            "%s (%s): Tracked entities %s",
+            self.auto_area.area_name,
+            self.device_class,
+            self.entity_ids,
+        )
+
+        # Set initial state
+        self._active = self._get_active()
+        self.any_on = bool(self._active)
+        await self._async_restore_state()
+        self.async_write_ha_state()
+
+        LOGGER.info(
+            "%s (%s): Initial state %s",
+            self.auto_area.area_name,
+            self.device_class,
+            self.any_on,
+        )
+
+        # Subscribe to state changes
+        self._async_subscribe_members()
+        self.async_on_remove(self.auto_area.async_register_rebind(self._async_rebind))
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass, self._async_reconcile, RECONCILE_INTERVAL
+            )
+        )
+
+    @override
+    @callback
+    def _async_members_changed(self, added: set[str], removed: set[str]) -> None:
+        """Re-evaluate after tracked entities were added or removed."""
+        self._active -= removed
+        self._active |= get_active_entity_ids(self.hass, list(added), [STATE_ON])
+        self._async_update_state()
+
+    @callback
+    def _async_reconcile(self, _now=None) -> None:
+        """Correct the active members if they drifted from the state machine."""
+        active = self._get_active()
+        if active == self._active:
+            return
+
+        LOGGER.debug(
+            "%s (%s): Correcting active entities %s -> %s",
+            self.auto_area.area_name,
+            self.device_class,
+            self._active,
+            active,
+        )
+        self._active = active
+        self._async_update_state()
+
+    @override
+    @callback
+    @instrumented
+    def _handle_state_change(self, event: Event[EventStateChangedData]) -> None:
+        """Handle state change of any tracked entity."""
+        if is_attribute_only_change(event):
+            return
+
+        entity_id = event.data.get('entity_id')
+        from_state = event.data.get('old_state')
+        to_state = event.data.get('new_state')
+
+        previous_state = from_state.state if from_state else ""
+        current_state = to_state.state if to_state else ""
+
+        if previous_state == current_state:
+            return
+
+        LOGGER.debug(
+            "%s: State change %s: %s -> %s",
+            self.auto_area.area_name,
+            entity_id,
+            previous_state,
+            current_state,
+        )
+
+        # Off, unknown and unavailable members do not count
+        was_active = entity_id in self._active
+        if current_state == STATE_ON:
+            self._active.add(entity_id)
+        else:
+            self._active.discard(entity_id)
+
+        if (
+            was_active != (entity_id in self._active)
+            or bool(self._active) != self.any_on
+        ):
+            self._async_schedule_evaluation()
+
+    @override
+    @callback
+    def _async_evaluate(self) -> None:
+        """Derive the state from the active members."""
+        if self._keeps_restored_state():
+            return
+        self._async_update_state()
+
+    @callback
+    def _async_update_state(self) -> None:
+        """Derive the aggregate from the active members and write it."""
+        any_on = bool(self._active)
+        if any_on != self.any_on:
+            LOGGER.debug(
+                "%s (%s): %s",
+                self.auto_area.area_name,
+                self.device_class,
+                "on" if any_on else "off",
+            )
+            self.any_on = any_on
+        self.async_write_ha_state()
@@ -3,26 +3,33 @@
 from __future__ import annotations
 
 from typing import Literal, override
-from homeassistant.core import Event, EventStateChangedData, CALLBACK_TYPE
+from homeassistant.core import Event, EventStateChangedData, State, callback
 from homeassistant.const import STATE_ON, STATE_OFF
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
-from homeassistant.helpers.event import async_track_state_change_event, async_call_later
+from homeassistant.helpers.event import async_track_time_interval
 
-from custom_components.auto_areas.ha_helpers import all_states_are_off
+from custom_components.auto_areas.ha_helpers import (
+    get_active_entity_ids,
+    has_reported_state,
+    is_attribute_only_change,
+)
 from custom_components.auto_areas.auto_area import AutoArea
 from custom_components.auto_areas.auto_entity import AutoEntity
+from custom_components.auto_areas.metrics import instrumented
 from custom_components.auto_areas.const import (
+    BUCKET_PRESENCE,
     CONFIG_PRESENCE_TIMEOUT,
-    DOMAIN,
     LOGGER,
-    PRESENCE_BINARY_SENSOR_DEVICE_CLASSES,
     PRESENCE_BINARY_SENSOR_ENTITY_PREFIX,
     PRESENCE_BINARY_SENSOR_PREFIX,
+    PRESENCE_HOLD_TIME_OPTIONS,
     PRESENCE_LOCK_SWITCH_ENTITY_PREFIX,
-    PRESENCE_ON_STATES
+    PRESENCE_ON_STATES,
+    RECONCILE_INTERVAL,
+    SIGNAL_PRESENCE,
 )
 
 
@@ -31,6 +38,8 @@ class PresenceBinarySensor(
 ):
     """Set up aggregated presence binary sensor."""
 
+    _signal = SIGNAL_PRESENCE
+
     def __init__(self, hass, auto_area: AutoArea) -> None:
         """Initialize presence binary sensor."""
         super().__init__(
@@ -44,7 +53,13 @@ class PresenceBinarySensor(
         self._presence_timeout: int = int(
             (auto_area.config_entry.options or {}).get(CONFIG_PRESENCE_TIMEOUT, 0) or 0
         )
-        self._timeout_cancel: CALLBACK_TYPE | None = None
+        self._presence_timers = auto_area.presence_timers
+        # Members whose device class has its own hold time -> seconds
+        self._holds: dict[str, float] = self._get_hold_times()
+        # Loop time until which presence is held after members turned off
+        self._hold_until: float = 0
+        # Tracked entities currently in a presence state
+        self._active: set[str] = set()
         LOGGER.debug("Presence entities %s", self.entity_ids)
 
     @override
@@ -62,23 +77,68 @@ class PresenceBinarySensor(
 
         return STATE_ON if self.presence else STATE_OFF
 
+    @override
+    @property
+    def _signal_value(self) -> bool | None:
+        """Publish presence as bool."""
+        return self.presence
+
+    @property
+    def _presence_lock_entity_id(self) -> str:
+        """Return the entity id of the presence lock switch of this area."""
+        return f"{PRESENCE_LOCK_SWITCH_ENTITY_PREFIX}{self.auto_area.slugified_area_name}"
+
     @override
     def _get_sensor_entities(self) -> list[str]:
         """Collect entities to be used for determining presence."""
-        entity_ids = [
-            f"{PRESENCE_LOCK_SWITCH_ENTITY_PREFIX}{
-                self.auto_area.slugified_area_name}"
-        ]
-
-        for entity in self.auto_area.get_valid_entities():
-            if (
-                entity.device_class in PRESENCE_BINARY_SENSOR_DEVICE_CLASSES
-                or entity.original_device_class in PRESENCE_BINARY_SENSOR_DEVICE_CLASSES
-            ) and entity.platform != DOMAIN:
-                entity_ids.append(entity.entity_id)
+        entity_ids = [self._presence_lock_entity_id]
+
+        entity_ids.extend(self.auto_area.get_entity_ids(BUCKET_PRESENCE))
 
         return entity_ids
 
+    def _get_hold_times(self) -> dict[str, float]:
+        """Return the members with a device class specific hold time."""
+        options = self.auto_area.config_entry.options or {}
+        holds_by_class = {
+            device_class: float(options[option])
+            for device_class, option in PRESENCE_HOLD_TIME_OPTIONS.items()
+            if options.get(option) is not None
+        }
+        if not holds_by_class:
+            return {}
+
+        holds: dict[str, float] = {}
+        for entity_id in self.entity_ids:
+            entry = self.auto_area.entity_registry.async_get(entity_id)
+            if entry is None:
+                continue
+            device_class = entry.device_class or entry.original_device_class
+            if device_class in holds_by_class:
+                holds[entity_id] = holds_by_class[device_class]
+        return holds
+
+    @override
+    def _has_member_state(self) -> bool:
+        """Return whether presence is known from live member states.
+
+        The presence lock is restored on its own and always has a state, so it
+        only counts while it is on.
+        """
+        return bool(self._active) or has_reported_state(
+            self.hass,
+            [
+                entity_id
+                for entity_id in self.entity_ids
+                if entity_id != self._presence_lock_entity_id
+            ],
+        )
+
+    @override
+    def _restore_state(self, last_state: State) -> None:
+        """Apply the restored presence."""
+        self.presence = last_state.state == STATE_ON
+
     @override
     async def async_added_to_hass(self):
         """Start tracking sensors."""
@@ -89,12 +149,12 @@ class PresenceBinarySensor(
         )
 
         # Set initial presence
-        self.presence = not all_states_are_off(
-            self.hass,
-            self.entity_ids,
-            PRESENCE_ON_STATES,
+        self._active = get_active_entity_ids(
+            self.hass, self.entity_ids, PRESENCE_ON_STATES
         )
-        self.async_write_ha_state()
+        self.presence = bool(self._active)
+        await self._async_restore_state()
+        self._async_write_state()
 
         LOGGER.info(
             "%s: Initial presence %s",
@@ -103,23 +163,65 @@ class PresenceBinarySensor(
         )
 
         # Subscribe to state changes
-        self.unsubscribe = async_track_state_change_event(
-            self.hass,
-            self.entity_ids,
-            self._handle_state_change,
+        self._async_subscribe_members()
+        self.async_on_remove(self.auto_area.async_register_rebind(self._async_rebind))
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass, self._async_reconcile, RECONCILE_INTERVAL
+            )
         )
 
+    @override
+    @callback
+    def _async_members_changed(self, added: set[str], removed: set[str]) -> None:
+        """Re-evaluate presence after tracked entities were added or removed."""
+        self._holds = self._get_hold_times()
+        self._active -= removed
+        self._active |= get_active_entity_ids(
+            self.hass, list(added), PRESENCE_ON_STATES
+        )
+        if self._active:
+            self._async_presence_on()
+        elif not self._keeps_restored_state():
+            self._async_hold(None)
+            self._async_presence_off()
+
+    @callback
+    def _async_reconcile(self, _now=None) -> None:
+        """Correct the active members if they drifted from the state machine."""
+        active = get_active_entity_ids(
+            self.hass, self.entity_ids, PRESENCE_ON_STATES
+        )
+        if active == self._active:
+            return
+
+        LOGGER.debug(
+            "%s: Correcting active presence entities %s -> %s",
+            self.auto_area.area_name,
+            self._active,
+            active,
+        )
+        self._active = active
+        if active:
+            self._async_presence_on()
+        elif not self._presence_timers.async_is_scheduled(self):
+            self._async_hold(None)
+            self._async_presence_off()
+
     @override
     async def async_will_remove_from_hass(self) -> None:
         """Clean up on removal."""
-        if self._timeout_cancel:
-            self._timeout_cancel()
-            self._timeout_cancel = None
+        self._presence_timers.async_cancel(self)
         await super().async_will_remove_from_hass()
 
     @override
-    async def _handle_state_change(self, event: Event[EventStateChangedData]) -> None:
+    @callback
+    @instrumented
+    def _handle_state_change(self, event: Event[EventStateChangedData]) -> None:
         """Handle state change of any tracked presence sensors."""
+        if is_attribute_only_change(event):
+            return
+
         entity_id = event.data.get('entity_id')
         from_state = event.data.get('old_state')
         to_state = event.data.get('new_state')
@@ -141,51 +243,74 @@ class PresenceBinarySensor(
         )
 
         if current_state in PRESENCE_ON_STATES:
-            # Cancel any pending timeout
-            if self._timeout_cancel:
-                self._timeout_cancel()
-                self._timeout_cancel = None
-            if not self.presence:
-                LOGGER.debug("%s: Presence detected", self.auto_area.area_name)
-                self.presence = True
-                self.async_write_ha_state()
+            self._active.add(entity_id)
+            self._async_presence_on()
         else:
-            if all_states_are_off(
-                self.hass,
-                self.entity_ids,
-                PRESENCE_ON_STATES,
-            ):
-                if self.presence:
-                    if self._presence_timeout > 0:
-                        # Schedule delayed clear (reset timer if already pending)
-                        if self._timeout_cancel:
-                            self._timeout_cancel()
-                        LOGGER.debug(
-                            "%s: All sensors off, starting presence timeout (%ss)",
-                            self.auto_area.area_name,
-                            self._presence_timeout,
-                        )
-                        self._timeout_cancel = async_call_later(
-                            self.hass,
-                            self._presence_timeout,
-                            self._handle_timeout,
-                        )
-                    else:
-                        LOGGER.debug(
-                            "%s: Presence cleared",
-                            self.auto_area.area_name
-                        )
-                        self.presence = False
-                        self.async_write_ha_state()
-
-    async def _handle_timeout(self, _now) -> None:
-        """Clear presence after timeout expires if no sensors are still active."""
-        self._timeout_cancel = None
-        if not any(
-            state.state in PRESENCE_ON_STATES
-            for entity_id in self.entity_ids
-            if (state := self.hass.states.get(entity_id)) is not None
-        ):
+            self._active.discard(entity_id)
+            # The presence lock alone does not replace a restored presence
+            if self._keeps_restored_state():
+                return
+            self._async_hold(entity_id)
+            if not self._active:
+                # Only clearing presence is coalesced, detecting it is not
+                self._async_schedule_evaluation()
+
+    @override
+    @callback
+    def _async_evaluate(self) -> None:
+        """Clear presence if no member turned on again in the meantime."""
+        if not self._active:
+            self._async_presence_off()
+
+    @callback
+    def _async_presence_on(self) -> None:
+        """Set presence immediately."""
+        # Drop any pending timeout, the hold times stay in effect
+        self._presence_timers.async_cancel(self)
+        if not self.presence:
+            LOGGER.debug("%s: Presence detected", self.auto_area.area_name)
+            self.presence = True
+            self._async_write_state()
+
+    @callback
+    def _async_hold(self, entity_id: str | None) -> None:
+        """Hold presence for the hold time of a member that turned off.
+
+        Members without a device class specific hold time (and removed
+        members, None) use the presence timeout of the area.
+        """
+        hold = self._presence_timeout
+        if entity_id is not None:
+            hold = self._holds.get(entity_id, hold)
+        if hold > 0:
+            self._hold_until = max(self._hold_until, self.hass.loop.time() + hold)
+
+    @callback
+    def _async_presence_off(self) -> None:
+        """Clear presence, once the hold times of all members have passed."""
+        if not self.presence:
+            return
+        if self._hold_until and self._hold_until > self.hass.loop.time():
+            LOGGER.debug(
+                "%s: All sensors off, holding presence until %s",
+                self.auto_area.area_name,
+                self._hold_until,
+            )
+            self._presence_timers.async_schedule(
+                self, self._hold_until, self._async_handle_timeout
+            )
+        else:
+            LOGGER.debug(
+                "%s: Presence cleared",
+                self.auto_area.area_name
+            )
+            self.presence = False
+            self._async_write_state()
+
+    @callback
+    def _async_handle_timeout(self) -> None:
+        """Clear presence after the hold time if no sensors are active again."""
+        if not self._active and self.presence:
             self.presence = False
-            self.async_write_ha_state()
+            self._async_write_state()
             LOGGER.debug("%s: Presence cleared after timeout", self.auto_area.area_name)
@@ -1,5 +1,8 @@
 """Perform calculations based on entity states."""
 from __future__ import annotations
+from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from datetime import datetime
 from statistics import mean, median
 from collections.abc import Callable
 from typing import Any
@@ -12,8 +15,14 @@ from homeassistant.const import STATE_UNKNOWN, STATE_UNAVAILABLE
 
 from custom_components.auto_areas.const import (
     CONFIG_HUMIDITY_CALCULATION,
+    CONFIG_HUMIDITY_DEADBAND,
+    CONFIG_HUMIDITY_DEADBAND_MODE,
     CONFIG_ILLUMINANCE_CALCULATION,
-    CONFIG_TEMPERATURE_CALCULATION
+    CONFIG_ILLUMINANCE_DEADBAND,
+    CONFIG_ILLUMINANCE_DEADBAND_MODE,
+    CONFIG_TEMPERATURE_CALCULATION,
+    CONFIG_TEMPERATURE_DEADBAND,
+    CONFIG_TEMPERATURE_DEADBAND_MODE,
 )
 
 CALCULATE_MAX = "max"
@@ -25,6 +34,9 @@ CALCULATE_ALL = "all"
 CALCULATE_ONE = "one"
 CALCULATE_NONE = "none"
 
+DEADBAND_ABSOLUTE = "absolute"
+DEADBAND_RELATIVE = "relative"
+
 
 def is_float(state: State) -> bool:
     """Check if state is a float."""
@@ -119,36 +131,254 @@ CALCULATE = {
     CALCULATE_LAST: calculate_last,
 }
 
+
+class Aggregator(ABC):
+    """Incrementally maintained aggregate over numeric entity values.
+
+    Values are fed one entity at a time, so a state change costs O(log n)
+    (O(1) for mean) instead of recalculating over all states.
+    """
+
+    @abstractmethod
+    def update(self, entity_id: str, value: float, last_updated: datetime) -> None:
+        """Set the current value of an entity."""
+
+    @abstractmethod
+    def remove(self, entity_id: str) -> None:
+        """Forget an entity."""
+
+    @property
+    @abstractmethod
+    def value(self) -> StateType:
+        """Return the aggregated value."""
+
+
+class MeanAggregator(Aggregator):
+    """Running sum and count."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._values: dict[str, float] = {}
+        self._sum = 0.0
+
+    def update(self, entity_id: str, value: float, last_updated: datetime) -> None:
+        """Set the current value of an entity."""
+        self._sum += value - self._values.get(entity_id, 0.0)
+        self._values[entity_id] = value
+
+    def remove(self, entity_id: str) -> None:
+        """Forget an entity."""
+        if (value := self._values.pop(entity_id, None)) is None:
+            return
+        # Reset when empty so float rounding errors do not accumulate forever
+        self._sum = self._sum - value if self._values else 0.0
+
+    @property
+    def value(self) -> StateType:
+        """Return the mean."""
+        if not self._values:
+            return STATE_UNKNOWN
+        return self._sum / len(self._values)
+
+
+class SortedAggregator(Aggregator):
+    """Keep all values sorted, for order statistics."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._values: dict[str, float] = {}
+        self._sorted: list[float] = []
+
+    def update(self, entity_id: str, value: float, last_updated: datetime) -> None:
+        """Set the current value of an entity."""
+        old_value = self._values.get(entity_id)
+        if old_value == value:
+            return
+        if old_value is not None:
+            del self._sorted[bisect_left(self._sorted, old_value)]
+        self._values[entity_id] = value
+        insort(self._sorted, value)
+
+    def remove(self, entity_id: str) -> None:
+        """Forget an entity."""
+        if (value := self._values.pop(entity_id, None)) is not None:
+            del self._sorted[bisect_left(self._sorted, value)]
+
+
+class MinAggregator(SortedAggregator):
+    """Smallest value."""
+
+    @property
+    def value(self) -> StateType:
+        """Return the min."""
+        return self._sorted[0] if self._sorted else STATE_UNKNOWN
+
+
+class MaxAggregator(SortedAggregator):
+    """Largest value."""
+
+    @property
+    def value(self) -> StateType:
+        """Return the max."""
+        return self._sorted[-1] if self._sorted else STATE_UNKNOWN
+
+
+class MedianAggregator(SortedAggregator):
+    """Middle value."""
+
+    @property
+    def value(self) -> StateType:
+        """Return the median."""
+        count = len(self._sorted)
+        if count == 0:
+            return STATE_UNKNOWN
+        middle = count // 2
+        if count % 2:
+            return self._sorted[middle]
+        return (self._sorted[middle - 1] + self._sorted[middle]) / 2
+
+
+class LastAggregator(Aggregator):
+    """Value of the most recently updated entity."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._values: dict[str, tuple[datetime, float]] = {}
+        self._last: str | None = None
+
+    def update(self, entity_id: str, value: float, last_updated: datetime) -> None:
+        """Set the current value of an entity."""
+        self._values[entity_id] = (last_updated, value)
+        if self._last is None or last_updated >= self._values[self._last][0]:
+            self._last = entity_id
+        elif entity_id == self._last:
+            # Only if a timestamp moves backwards
+            self._find_last()
+
+    def remove(self, entity_id: str) -> None:
+        """Forget an entity."""
+        if self._values.pop(entity_id, None) is not None and entity_id == self._last:
+            self._find_last()
+
+    def _find_last(self) -> None:
+        """Scan for the most recently updated entity."""
+        self._last = max(
+            self._values,
+            key=lambda entity_id: self._values[entity_id][0],
+            default=None,
+        )
+
+    @property
+    def value(self) -> StateType:
+        """Return the last value."""
+        if self._last is None:
+            return STATE_UNKNOWN
+        return self._values[self._last][1]
+
+
+AGGREGATORS: dict[str, type[Aggregator]] = {
+    CALCULATE_MAX: MaxAggregator,
+    CALCULATE_MEAN: MeanAggregator,
+    CALCULATE_MIN: MinAggregator,
+    CALCULATE_MEDIAN: MedianAggregator,
+    CALCULATE_LAST: LastAggregator,
+}
+
 # Default calculation methods
 DEFAULT_CALCULATION_ILLUMINANCE = CALCULATE_LAST
 DEFAULT_CALCULATION_TEMPERATURE = CALCULATE_MEAN
 DEFAULT_CALCULATION_HUMIDITY = CALCULATE_MAX
 
 
-def get_calculation(
+def get_calculation_name(
     config_options: Mapping[str, Any],
     sensor_type: SensorDeviceClass | BinarySensorDeviceClass
-) -> Callable[[list[State]], StateType] | None:
-    """Get the configured calculation for the sensor provided."""
+) -> str | None:
+    """Get the name of the configured calculation for the sensor provided."""
     if sensor_type == SensorDeviceClass.ILLUMINANCE:
-        return CALCULATE.get(
-            config_options.get(
-                CONFIG_ILLUMINANCE_CALCULATION,
-                DEFAULT_CALCULATION_ILLUMINANCE),
-        )
+        return config_options.get(
+            CONFIG_ILLUMINANCE_CALCULATION,
+            DEFAULT_CALCULATION_ILLUMINANCE)
 
     if sensor_type == SensorDeviceClass.TEMPERATURE:
-        return CALCULATE.get(
-            config_options.get(
-                CONFIG_TEMPERATURE_CALCULATION,
-                DEFAULT_CALCULATION_TEMPERATURE),
-        )
+        return config_options.get(
+            CONFIG_TEMPERATURE_CALCULATION,
+            DEFAULT_CALCULATION_TEMPERATURE)
 
     if sensor_type == SensorDeviceClass.HUMIDITY:
-        return CALCULATE.get(
-            config_options.get(
-                CONFIG_HUMIDITY_CALCULATION,
-                DEFAULT_CALCULATION_HUMIDITY),
-        )
+        return config_options.get(
+            CONFIG_HUMIDITY_CALCULATION,
+            DEFAULT_CALCULATION_HUMIDITY)
 
     return None
+
+
+def get_calculation(
+    config_options: Mapping[str, Any],
+    sensor_type: SensorDeviceClass | BinarySensorDeviceClass
+) -> Callable[[list[State]], StateType] | None:
+    """Get the configured calculation for the sensor provided."""
+    name = get_calculation_name(config_options, sensor_type)
+    return CALCULATE.get(name) if name is not None else None
+
+
+def get_aggregator(
+    config_options: Mapping[str, Any],
+    sensor_type: SensorDeviceClass | BinarySensorDeviceClass
+) -> Aggregator | None:
+    """Create an incremental aggregator for the configured calculation."""
+    name = get_calculation_name(config_options, sensor_type)
+    aggregator = AGGREGATORS.get(name) if name is not None else None
+    return aggregator() if aggregator is not None else None
+
+
+# Default deadband modes
+DEFAULT_DEADBAND_MODE_ILLUMINANCE = DEADBAND_RELATIVE
+DEFAULT_DEADBAND_MODE_TEMPERATURE = DEADBAND_ABSOLUTE
+DEFAULT_DEADBAND_MODE_HUMIDITY = DEADBAND_ABSOLUTE
+
+# Deadband option, mode option and default mode per sensor type
+DEADBANDS: dict[str, tuple[str, str, str]] = {
+    SensorDeviceClass.ILLUMINANCE: (
+        CONFIG_ILLUMINANCE_DEADBAND,
+        CONFIG_ILLUMINANCE_DEADBAND_MODE,
+        DEFAULT_DEADBAND_MODE_ILLUMINANCE,
+    ),
+    SensorDeviceClass.TEMPERATURE: (
+        CONFIG_TEMPERATURE_DEADBAND,
+        CONFIG_TEMPERATURE_DEADBAND_MODE,
+        DEFAULT_DEADBAND_MODE_TEMPERATURE,
+    ),
+    SensorDeviceClass.HUMIDITY: (
+        CONFIG_HUMIDITY_DEADBAND,
+        CONFIG_HUMIDITY_DEADBAND_MODE,
+        DEFAULT_DEADBAND_MODE_HUMIDITY,
+    ),
+}
+
+
+def get_deadband(
+    config_options: Mapping[str, Any],
+    sensor_type: SensorDeviceClass | BinarySensorDeviceClass
+) -> tuple[float, bool]:
+    """Get the configured deadband and whether it is relative (in percent)."""
+    if (deadband := DEADBANDS.get(sensor_type)) is None:
+        return 0.0, False
+
+    option, mode_option, default_mode = deadband
+    mode = config_options.get(mode_option) or default_mode
+    return float(config_options.get(option) or 0), mode == DEADBAND_RELATIVE
+
+
+def is_significant_change(
+    previous: StateType,
+    value: StateType,
+    deadband: float = 0,
+    relative: bool = False,
+) -> bool:
+    """Check whether a new aggregate differs from the last one by more than the deadband."""
+    if not isinstance(previous, int | float) or not isinstance(value, int | float):
+        return previous != value
+
+    threshold = abs(previous) * deadband / 100 if relative else deadband
+    return abs(value - previous) > threshold
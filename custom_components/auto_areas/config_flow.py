@@ -8,11 +8,7 @@ from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.components.light import DOMAIN as LIGHT_DOMAIN
 from homeassistant.helpers.area_registry import AreaRegistry, AreaEntry
-from homeassistant.helpers import (
-    area_registry as ar,
-    device_registry as dr,
-    entity_registry as er,
-)
+from homeassistant.helpers import area_registry as ar
 
 import homeassistant.helpers.selector as selector
 from homeassistant.config_entries import ConfigFlowResult
@@ -24,26 +20,50 @@ from custom_components.auto_areas.calculations import (
     CALCULATE_MEAN,
     CALCULATE_MEDIAN,
     CALCULATE_MIN,
+    DEADBAND_ABSOLUTE,
+    DEADBAND_RELATIVE,
 )
 
-from .ha_helpers import get_all_entities
+from .area_index import async_get_area_index
 
 from .auto_area import AutoAreasError, AutoArea
 
 from .const import (
     CONFIG_AREA,
+    CONFIG_COALESCE_UPDATES,
+    CONFIG_COALESCE_WINDOW,
+    CONFIG_COLLECT_METRICS,
+    CONFIG_COVER_CONCURRENCY,
+    CONFIG_COVER_STAGGER,
     CONFIG_HUMIDITY_CALCULATION,
+    CONFIG_HUMIDITY_DEADBAND,
+    CONFIG_HUMIDITY_DEADBAND_MODE,
     CONFIG_ILLUMINANCE_CALCULATION,
+    CONFIG_ILLUMINANCE_DEADBAND,
+    CONFIG_ILLUMINANCE_DEADBAND_MODE,
     CONFIG_IS_SLEEPING_AREA,
     CONFIG_EXCLUDED_LIGHT_ENTITIES,
+    CONFIG_FAST_LIGHT_GROUP,
+    CONFIG_DIFFERENTIAL_LIGHT_COMMANDS,
     CONFIG_AUTO_LIGHTS_MAX_ILLUMINANCE,
+    CONFIG_MAX_PUBLISH_INTERVAL,
+    CONFIG_MIN_PUBLISH_INTERVAL,
+    CONFIG_MOTION_HOLD_TIME,
+    CONFIG_OCCUPANCY_HOLD_TIME,
+    CONFIG_PRESENCE_HOLD_TIME,
     CONFIG_PRESENCE_TIMEOUT,
     CONFIG_TEMPERATURE_CALCULATION,
+    CONFIG_TRACK_ATTRIBUTE_UPDATES,
+    CONFIG_TEMPERATURE_DEADBAND,
+    CONFIG_TEMPERATURE_DEADBAND_MODE,
     DOMAIN,
     LOGGER,
 )
 
 from .calculations import (
+    DEFAULT_DEADBAND_MODE_HUMIDITY,
+    DEFAULT_DEADBAND_MODE_ILLUMINANCE,
+    DEFAULT_DEADBAND_MODE_TEMPERATURE,
     DEFAULT_CALCULATION_ILLUMINANCE,
     DEFAULT_CALCULATION_TEMPERATURE,
     DEFAULT_CALCULATION_HUMIDITY,
@@ -107,6 +127,8 @@ class ConfigFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         existing_configs: dict[str, AutoArea] = self.hass.data.get(DOMAIN) or {
         }
         for auto_area in existing_configs.values():
+            if not isinstance(auto_area, AutoArea):
+                continue
             existing_area_id = auto_area.config_entry.data.get("area")
             if existing_area_id == area_id:
                 raise AutoAreasError("This area is already managed")
@@ -161,6 +183,51 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                             mode=selector.NumberSelectorMode.BOX,
                         )
                     ),
+                    vol.Optional(
+                        CONFIG_MOTION_HOLD_TIME,
+                        description={
+                            "suggested_value": (self.config_entry.options or {}).get(
+                                CONFIG_MOTION_HOLD_TIME
+                            )
+                        },
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=3600,
+                            unit_of_measurement="s",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Optional(
+                        CONFIG_OCCUPANCY_HOLD_TIME,
+                        description={
+                            "suggested_value": (self.config_entry.options or {}).get(
+                                CONFIG_OCCUPANCY_HOLD_TIME
+                            )
+                        },
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=3600,
+                            unit_of_measurement="s",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Optional(
+                        CONFIG_PRESENCE_HOLD_TIME,
+                        description={
+                            "suggested_value": (self.config_entry.options or {}).get(
+                                CONFIG_PRESENCE_HOLD_TIME
+                            )
+                        },
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=3600,
+                            unit_of_measurement="s",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
                     vol.Optional(
                         CONFIG_EXCLUDED_LIGHT_ENTITIES,
                         default=(self.config_entry.options or {}).get(
@@ -174,6 +241,47 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                             multiple=True,
                         )
                     ),
+                    vol.Optional(
+                        CONFIG_FAST_LIGHT_GROUP,
+                        default=(self.config_entry.options or {}).get(
+                            CONFIG_FAST_LIGHT_GROUP
+                        )
+                        or False,  # type: ignore
+                    ): bool,
+                    vol.Optional(
+                        CONFIG_DIFFERENTIAL_LIGHT_COMMANDS,
+                        default=(self.config_entry.options or {}).get(
+                            CONFIG_DIFFERENTIAL_LIGHT_COMMANDS
+                        )
+                        or False,  # type: ignore
+                    ): bool,
+                    vol.Optional(
+                        CONFIG_COVER_CONCURRENCY,
+                        default=(self.config_entry.options or {}).get(
+                            CONFIG_COVER_CONCURRENCY, 0
+                        )
+                        or 0,  # type: ignore
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=50,
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Optional(
+                        CONFIG_COVER_STAGGER,
+                        default=(self.config_entry.options or {}).get(
+                            CONFIG_COVER_STAGGER, 0
+                        )
+                        or 0,  # type: ignore
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=10000,
+                            unit_of_measurement="ms",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
                     vol.Optional(
                         CONFIG_AUTO_LIGHTS_MAX_ILLUMINANCE,
                         default=(self.config_entry.options or {}).get(
@@ -200,27 +308,145 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         CONFIG_HUMIDITY_CALCULATION,
                         default=DEFAULT_CALCULATION_HUMIDITY,  # type: ignore
                     ): self.sensor_selector,
+                    vol.Optional(
+                        CONFIG_ILLUMINANCE_DEADBAND,
+                        default=(self.config_entry.options or {}).get(
+                            CONFIG_ILLUMINANCE_DEADBAND, 0
+                        )
+                        or 0,  # type: ignore
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=1000,
+                            step=1,
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Optional(
+                        CONFIG_ILLUMINANCE_DEADBAND_MODE,
+                        default=(self.config_entry.options or {}).get(
+                            CONFIG_ILLUMINANCE_DEADBAND_MODE
+                        )
+                        or DEFAULT_DEADBAND_MODE_ILLUMINANCE,  # type: ignore
+                    ): self.deadband_mode_selector,
+                    vol.Optional(
+                        CONFIG_TEMPERATURE_DEADBAND,
+                        default=(self.config_entry.options or {}).get(
+                            CONFIG_TEMPERATURE_DEADBAND, 0
+                        )
+                        or 0,  # type: ignore
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=100,
+                            step=0.1,
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Optional(
+                        CONFIG_TEMPERATURE_DEADBAND_MODE,
+                        default=(self.config_entry.options or {}).get(
+                            CONFIG_TEMPERATURE_DEADBAND_MODE
+                        )
+                        or DEFAULT_DEADBAND_MODE_TEMPERATURE,  # type: ignore
+                    ): self.deadband_mode_selector,
+                    vol.Optional(
+                        CONFIG_HUMIDITY_DEADBAND,
+                        default=(self.config_entry.options or {}).get(
+                            CONFIG_HUMIDITY_DEADBAND, 0
+                        )
+                        or 0,  # type: ignore
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=100,
+                            step=0.1,
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Optional(
+                        CONFIG_HUMIDITY_DEADBAND_MODE,
+                        default=(self.config_entry.options or {}).get(
+                            CONFIG_HUMIDITY_DEADBAND_MODE
+                        )
+                        or DEFAULT_DEADBAND_MODE_HUMIDITY,  # type: ignore
+                    ): self.deadband_mode_selector,
+                    vol.Optional(
+                        CONFIG_MIN_PUBLISH_INTERVAL,
+                        default=(self.config_entry.options or {}).get(
+                            CONFIG_MIN_PUBLISH_INTERVAL, 0
+                        )
+                        or 0,  # type: ignore
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=3600,
+                            unit_of_measurement="s",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Optional(
+                        CONFIG_MAX_PUBLISH_INTERVAL,
+                        default=(self.config_entry.options or {}).get(
+                            CONFIG_MAX_PUBLISH_INTERVAL, 0
+                        )
+                        or 0,  # type: ignore
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=86400,
+                            unit_of_measurement="s",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Optional(
+                        CONFIG_COALESCE_UPDATES,
+                        default=(self.config_entry.options or {}).get(
+                            CONFIG_COALESCE_UPDATES
+                        )
+                        or False,  # type: ignore
+                    ): bool,
+                    vol.Optional(
+                        CONFIG_COALESCE_WINDOW,
+                        default=(self.config_entry.options or {}).get(
+                            CONFIG_COALESCE_WINDOW, 0
+                        )
+                        or 0,  # type: ignore
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=1000,
+                            unit_of_measurement="ms",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Optional(
+                        CONFIG_TRACK_ATTRIBUTE_UPDATES,
+                        default=(self.config_entry.options or {}).get(
+                            CONFIG_TRACK_ATTRIBUTE_UPDATES
+                        )
+                        or False,  # type: ignore
+                    ): bool,
+                    vol.Optional(
+                        CONFIG_COLLECT_METRICS,
+                        default=(self.config_entry.options or {}).get(
+                            CONFIG_COLLECT_METRICS
+                        )
+                        or False,  # type: ignore
+                    ): bool,
                 }
             ),
         )
 
     def get_light_entities(self) -> list[str]:
         """Return a list of selectable light entities."""
-        device_registry = dr.async_get(self.hass)
-        entity_registry = er.async_get(self.hass)
         area_id = self.config_entry.data.get(CONFIG_AREA)
         if area_id is None:
             raise ValueError(f"Missing {CONFIG_AREA} configruation value.")
-        entities = [
-            entity.entity_id
-            for entity in get_all_entities(
-                entity_registry,
-                device_registry,
-                area_id,
-                [LIGHT_DOMAIN],
-            )
-        ]
-        return entities
+        return async_get_area_index(self.hass).async_get_entity_ids(
+            area_id,
+            [LIGHT_DOMAIN],
+        )
 
     @property
     def sensor_selector(self) -> selector.Selector:
@@ -238,3 +464,17 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 mode=selector.SelectSelectorMode.DROPDOWN,
             )
         )
+
+    @property
+    def deadband_mode_selector(self) -> selector.Selector:
+        """Get the deadband mode selector configuration."""
+        return selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=[
+                    DEADBAND_ABSOLUTE,
+                    DEADBAND_RELATIVE,
+                ],
+                multiple=False,
+                mode=selector.SelectSelectorMode.DROPDOWN,
+            )
+        )
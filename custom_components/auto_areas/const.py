@@ -1,4 +1,5 @@
 """Constants for Auto Areas."""
+from datetime import timedelta
 from logging import Logger, getLogger
 
 from homeassistant.components.binary_sensor import (
@@ -9,6 +10,7 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.components.light import DOMAIN as LIGHT_DOMAIN
 from homeassistant.components.sensor.const import DOMAIN as SENSOR_DOMAIN
+from homeassistant.components.sensor.const import SensorDeviceClass
 from homeassistant.components.group.const import DOMAIN as GROUP_DOMAIN
 from homeassistant.components.switch.const import DOMAIN as SWITCH_DOMAIN
 from homeassistant.components.cover import DOMAIN as COVER_DOMAIN
@@ -27,6 +29,42 @@ VERSION = "2.7.0"
 ISSUE_TYPE_YAML_DETECTED = "issue_yaml_detected"
 ISSUE_TYPE_INVALID_AREA = "invalid_area_config"
 #
+# Shared data (stored in hass.data[DOMAIN] next to the AutoArea instances)
+#
+DATA_AREA_INDEX = "area_index"
+DATA_COVER_COMMANDS = "cover_commands"
+DATA_LIGHT_COMMANDS = "light_commands"
+DATA_PRESENCE_TIMERS = "presence_timers"
+DATA_STATE_ROUTER = "state_router"
+#
+# Startup
+#
+# Max. seconds to wait for the states of area members before setting up
+STARTUP_MEMBER_TIMEOUT = 10
+#
+# Interval to check tracked member states against the state machine
+RECONCILE_INTERVAL = timedelta(minutes=5)
+#
+# Seconds to collect light commands of all areas into one service call
+LIGHT_COMMAND_WINDOW = 0.05
+#
+# Max. cover commands in flight across all areas
+COVER_COMMAND_MAX_CONCURRENT = 4
+#
+# Share of differing members above which the whole light group is commanded
+DIFFERENTIAL_LIGHT_GROUP_RATIO = 0.5
+#
+# Seconds presence deadlines are rounded up to, so that they expire together
+PRESENCE_TIMER_RESOLUTION = 1.0
+#
+# Number of recent handler durations kept for percentiles
+METRICS_SAMPLES = 1000
+#
+# In-process area signals (see signals.AreaSignals)
+SIGNAL_PRESENCE = "presence"
+SIGNAL_ILLUMINANCE = "illuminance"
+SIGNAL_SLEEP_MODE = "sleep_mode"
+#
 PRESENCE_LOCK_SWITCH_PREFIX = "Area Presence Lock "
 PRESENCE_LOCK_SWITCH_ENTITY_PREFIX = "switch.area_presence_lock_"
 
@@ -59,11 +97,30 @@ LIGHT_GROUP_ENTITY_PREFIX = "light.area_lights_"
 CONFIG_AREA = "area"
 CONFIG_IS_SLEEPING_AREA = "is_sleeping_area"
 CONFIG_EXCLUDED_LIGHT_ENTITIES = "excluded_light_entities"
+CONFIG_FAST_LIGHT_GROUP = "fast_light_group"
+CONFIG_DIFFERENTIAL_LIGHT_COMMANDS = "differential_light_commands"
+CONFIG_COVER_CONCURRENCY = "cover_concurrency"
+CONFIG_COVER_STAGGER = "cover_stagger"
 CONFIG_PRESENCE_TIMEOUT = "presence_timeout"
+CONFIG_MOTION_HOLD_TIME = "motion_hold_time"
+CONFIG_OCCUPANCY_HOLD_TIME = "occupancy_hold_time"
+CONFIG_PRESENCE_HOLD_TIME = "presence_hold_time"
 CONFIG_AUTO_LIGHTS_MAX_ILLUMINANCE = "auto_lights_illuminance_threshold"
 CONFIG_HUMIDITY_CALCULATION = "humidity_calculation"
 CONFIG_TEMPERATURE_CALCULATION = "temperature_calculation"
 CONFIG_ILLUMINANCE_CALCULATION = "illuminance_calculation"
+CONFIG_COLLECT_METRICS = "collect_metrics"
+CONFIG_HUMIDITY_DEADBAND = "humidity_deadband"
+CONFIG_TEMPERATURE_DEADBAND = "temperature_deadband"
+CONFIG_ILLUMINANCE_DEADBAND = "illuminance_deadband"
+CONFIG_HUMIDITY_DEADBAND_MODE = "humidity_deadband_mode"
+CONFIG_TEMPERATURE_DEADBAND_MODE = "temperature_deadband_mode"
+CONFIG_ILLUMINANCE_DEADBAND_MODE = "illuminance_deadband_mode"
+CONFIG_MIN_PUBLISH_INTERVAL = "min_publish_interval"
+CONFIG_MAX_PUBLISH_INTERVAL = "max_publish_interval"
+CONFIG_COALESCE_UPDATES = "coalesce_updates"
+CONFIG_COALESCE_WINDOW = "coalesce_window"
+CONFIG_TRACK_ATTRIBUTE_UPDATES = "track_attribute_updates"
 
 
 # Fetch entities from these domains:
@@ -87,6 +144,13 @@ PRESENCE_BINARY_SENSOR_DEVICE_CLASSES = (
     BinarySensorDeviceClass.PRESENCE,
 )
 
+# Options overriding the presence timeout per device class
+PRESENCE_HOLD_TIME_OPTIONS = {
+    BinarySensorDeviceClass.MOTION: CONFIG_MOTION_HOLD_TIME,
+    BinarySensorDeviceClass.OCCUPANCY: CONFIG_OCCUPANCY_HOLD_TIME,
+    BinarySensorDeviceClass.PRESENCE: CONFIG_PRESENCE_HOLD_TIME,
+}
+
 # Presence states
 PRESENCE_ON_STATES = [
     STATE_ON,
@@ -107,6 +171,7 @@ SAFETY_BINARY_SENSOR_DEVICE_CLASSES = (
 # Open/closed entities
 OPEN_BINARY_SENSOR_PREFIX = "Area Open "
 OPEN_BINARY_SENSOR_ENTITY_PREFIX = "binary_sensor.area_open_"
+ATTR_OPEN_COUNT = "open_count"
 OPEN_BINARY_SENSOR_DEVICE_CLASSES = (
     BinarySensorDeviceClass.DOOR,
     BinarySensorDeviceClass.WINDOW,
@@ -118,6 +183,7 @@ OPEN_BINARY_SENSOR_DEVICE_CLASSES = (
 # Safety entities
 SAFETY_BINARY_SENSOR_PREFIX = "Area Safety "
 SAFETY_BINARY_SENSOR_ENTITY_PREFIX = "binary_sensor.area_safety_"
+ATTR_ALERT_COUNT = "alert_count"
 SAFETY_BINARY_SENSOR_DEVICE_CLASSES = (
     BinarySensorDeviceClass.SMOKE,
     BinarySensorDeviceClass.CO,
@@ -126,3 +192,22 @@ SAFETY_BINARY_SENSOR_DEVICE_CLASSES = (
     BinarySensorDeviceClass.HEAT,
     BinarySensorDeviceClass.SAFETY,
 )
+
+# Entity classification buckets, filled in a single pass over an area
+BUCKET_PRESENCE = "presence"
+BUCKET_SAFETY = "safety"
+BUCKET_OPEN = "open"
+BUCKET_ILLUMINANCE = SensorDeviceClass.ILLUMINANCE.value
+BUCKET_TEMPERATURE = SensorDeviceClass.TEMPERATURE.value
+BUCKET_HUMIDITY = SensorDeviceClass.HUMIDITY.value
+BUCKET_LIGHT = LIGHT_DOMAIN
+BUCKET_COVER = COVER_DOMAIN
+
+DEVICE_CLASS_BUCKETS: dict[str, str] = {
+    **dict.fromkeys(PRESENCE_BINARY_SENSOR_DEVICE_CLASSES, BUCKET_PRESENCE),
+    **dict.fromkeys(SAFETY_BINARY_SENSOR_DEVICE_CLASSES, BUCKET_SAFETY),
+    **dict.fromkeys(OPEN_BINARY_SENSOR_DEVICE_CLASSES, BUCKET_OPEN),
+    BUCKET_ILLUMINANCE: BUCKET_ILLUMINANCE,
+    BUCKET_TEMPERATURE: BUCKET_TEMPERATURE,
+    BUCKET_HUMIDITY: BUCKET_HUMIDITY,
+}
@@ -1,13 +1,40 @@
 """Cover group."""
 
+import asyncio
+from collections.abc import Iterable
+from typing import Any, override
+
+from homeassistant.core import Event, EventStateChangedData, State, callback
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    SERVICE_CLOSE_COVER,
+    SERVICE_CLOSE_COVER_TILT,
+    SERVICE_OPEN_COVER,
+    SERVICE_OPEN_COVER_TILT,
+    SERVICE_SET_COVER_POSITION,
+    SERVICE_SET_COVER_TILT_POSITION,
+    SERVICE_STOP_COVER,
+    SERVICE_STOP_COVER_TILT,
+)
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.components.group.cover import CoverGroup
+from homeassistant.components.group.cover import (
+    KEY_OPEN_CLOSE,
+    KEY_POSITION,
+    KEY_STOP,
+    CoverGroup,
+)
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.components.cover import CoverDeviceClass
+from homeassistant.components.cover import (
+    ATTR_POSITION,
+    ATTR_TILT_POSITION,
+    CoverDeviceClass,
+)
 
 from custom_components.auto_areas.auto_area import AutoArea
-from custom_components.auto_areas.ha_helpers import get_all_entities, is_valid_entity
+from custom_components.auto_areas.state_router import StateSubscription
 from custom_components.auto_areas.const import (
+    CONFIG_COVER_CONCURRENCY,
+    CONFIG_COVER_STAGGER,
     COVER_GROUP_ENTITY_PREFIX,
     COVER_GROUP_PREFIX,
     DOMAIN,
@@ -19,16 +46,7 @@ async def async_setup_entry(hass, entry, async_add_entities: AddEntitiesCallback
     """Set up the cover platform."""
     auto_area: AutoArea = hass.data[DOMAIN][entry.entry_id]
 
-    cover_entity_ids: list[str] = [
-        entity.entity_id
-        for entity in get_all_entities(
-            auto_area.entity_registry,
-            auto_area.device_registry,
-            auto_area.area_id or "",
-            domains=["cover"],
-        )
-        if is_valid_entity(auto_area.hass, entity)
-    ]
+    cover_entity_ids: list[str] = auto_area.get_cover_entity_ids()
     if not cover_entity_ids:
         LOGGER.info(
             "%s: No covers found in area. Not creating cover group.",
@@ -53,6 +71,13 @@ class AutoCoverGroup(CoverGroup):
         self._name_prefix = COVER_GROUP_PREFIX
         self._prefix = COVER_GROUP_ENTITY_PREFIX
         self.entity_ids: list[str] = entity_ids
+        # CoverGroup subscribes to its initial members only
+        self._initial_entity_ids = set(entity_ids)
+        self._added_subscription: StateSubscription | None = None
+        # Commands are sent through the cover command scheduler if limited
+        options = self.auto_area.config_entry.options
+        self._concurrency = int(options.get(CONFIG_COVER_CONCURRENCY) or 0)
+        self._stagger = (options.get(CONFIG_COVER_STAGGER) or 0) / 1000
 
         CoverGroup.__init__(
             self,
@@ -67,6 +92,171 @@ class AutoCoverGroup(CoverGroup):
             self.entity_ids
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Register listeners."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.auto_area.async_register_rebind(self._async_rebind))
+        self._added_subscription = self.auto_area.state_router.async_subscribe(
+            (), self._async_added_member_changed
+        )
+        self.async_on_remove(self._added_subscription.async_unsubscribe)
+
+    @override
+    async def async_open_cover(self, **kwargs: Any) -> None:
+        """Open the covers."""
+        if not self._scheduled:
+            await super().async_open_cover(**kwargs)
+            return
+        await self._async_schedule(SERVICE_OPEN_COVER, self._covers[KEY_OPEN_CLOSE])
+
+    @override
+    async def async_close_cover(self, **kwargs: Any) -> None:
+        """Close the covers."""
+        if not self._scheduled:
+            await super().async_close_cover(**kwargs)
+            return
+        await self._async_schedule(SERVICE_CLOSE_COVER, self._covers[KEY_OPEN_CLOSE])
+
+    @override
+    async def async_stop_cover(self, **kwargs: Any) -> None:
+        """Stop the covers."""
+        if not self._scheduled:
+            await super().async_stop_cover(**kwargs)
+            return
+        await self._async_schedule(SERVICE_STOP_COVER, self._covers[KEY_STOP])
+
+    @override
+    async def async_set_cover_position(self, **kwargs: Any) -> None:
+        """Set the position of the covers."""
+        if not self._scheduled:
+            await super().async_set_cover_position(**kwargs)
+            return
+        await self._async_schedule(
+            SERVICE_SET_COVER_POSITION,
+            self._covers[KEY_POSITION],
+            {ATTR_POSITION: kwargs[ATTR_POSITION]},
+        )
+
+    @override
+    async def async_open_cover_tilt(self, **kwargs: Any) -> None:
+        """Tilt the covers open."""
+        if not self._scheduled:
+            await super().async_open_cover_tilt(**kwargs)
+            return
+        await self._async_schedule(SERVICE_OPEN_COVER_TILT, self._tilts[KEY_OPEN_CLOSE])
+
+    @override
+    async def async_close_cover_tilt(self, **kwargs: Any) -> None:
+        """Tilt the covers closed."""
+        if not self._scheduled:
+            await super().async_close_cover_tilt(**kwargs)
+            return
+        await self._async_schedule(
+            SERVICE_CLOSE_COVER_TILT, self._tilts[KEY_OPEN_CLOSE]
+        )
+
+    @override
+    async def async_stop_cover_tilt(self, **kwargs: Any) -> None:
+        """Stop the cover tilts."""
+        if not self._scheduled:
+            await super().async_stop_cover_tilt(**kwargs)
+            return
+        await self._async_schedule(SERVICE_STOP_COVER_TILT, self._tilts[KEY_STOP])
+
+    @override
+    async def async_set_cover_tilt_position(self, **kwargs: Any) -> None:
+        """Set the tilt position of the covers."""
+        if not self._scheduled:
+            await super().async_set_cover_tilt_position(**kwargs)
+            return
+        await self._async_schedule(
+            SERVICE_SET_COVER_TILT_POSITION,
+            self._tilts[KEY_POSITION],
+            {ATTR_TILT_POSITION: kwargs[ATTR_TILT_POSITION]},
+        )
+
+    @property
+    def _scheduled(self) -> bool:
+        """Return True if commands are limited per area."""
+        return bool(self._concurrency or self._stagger)
+
+    async def _async_schedule(
+        self,
+        service: str,
+        entity_ids: Iterable[str],
+        data: dict[str, Any] | None = None,
+    ) -> None:
+        """Send a command to each cover through the cover command scheduler."""
+        await asyncio.gather(
+            *(
+                self.auto_area.cover_commands.async_call(
+                    self.auto_area.config_entry.entry_id,
+                    service,
+                    entity_id,
+                    data,
+                    concurrency=self._concurrency,
+                    stagger=self._stagger,
+                    context=self._context,
+                )
+                for entity_id in sorted(entity_ids)
+            )
+        )
+
+    @callback
+    def async_update_supported_features(
+        self,
+        entity_id: str,
+        new_state: State | None,
+    ) -> None:
+        """Update supported features, ignoring covers that left the area."""
+        if new_state is not None and entity_id not in self._entity_ids:
+            return
+        super().async_update_supported_features(entity_id, new_state)
+
+    @callback
+    def _async_rebind(self) -> None:
+        """Update group members in place."""
+        entity_ids = self.auto_area.get_cover_entity_ids()
+        if entity_ids == self._entity_ids:
+            return
+
+        removed = set(self._entity_ids) - set(entity_ids)
+        added = set(entity_ids) - set(self._entity_ids)
+        LOGGER.info(
+            "%s: Cover group members changed. Added: %s, removed: %s",
+            self.auto_area.area_name,
+            added,
+            removed,
+        )
+        self.entity_ids = self._entity_ids = entity_ids
+        self._attr_extra_state_attributes = {ATTR_ENTITY_ID: entity_ids}
+
+        for entity_id in removed:
+            self.async_update_supported_features(entity_id, None)
+        for entity_id in added:
+            self.async_update_supported_features(
+                entity_id, self.hass.states.get(entity_id)
+            )
+
+        if self._added_subscription is not None:
+            self._added_subscription.async_set_entity_ids(
+                entity_id
+                for entity_id in entity_ids
+                if entity_id not in self._initial_entity_ids
+            )
+
+        self.async_update_group_state()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_added_member_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Handle state changes of covers added after setup."""
+        self.async_set_context(event.context)
+        self.async_update_supported_features(
+            event.data["entity_id"], event.data["new_state"]
+        )
+        self.async_defer_or_update_ha_state()
+
     @property
     def name(self):
         """Name of this entity."""
@@ -0,0 +1,231 @@
+"""Integration-wide scheduling of cover service calls."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any
+
+from homeassistant.components.cover import DOMAIN as COVER_DOMAIN
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    SERVICE_CLOSE_COVER_TILT,
+    SERVICE_OPEN_COVER_TILT,
+    SERVICE_SET_COVER_TILT_POSITION,
+    SERVICE_STOP_COVER_TILT,
+)
+from homeassistant.core import Context, HomeAssistant, callback
+
+from .const import COVER_COMMAND_MAX_CONCURRENT, DATA_COVER_COMMANDS, DOMAIN, LOGGER
+
+# Tilt commands do not supersede open/close/position commands and vice versa
+TILT_SERVICES = frozenset(
+    (
+        SERVICE_OPEN_COVER_TILT,
+        SERVICE_CLOSE_COVER_TILT,
+        SERVICE_STOP_COVER_TILT,
+        SERVICE_SET_COVER_TILT_POSITION,
+    )
+)
+
+
+@dataclass
+class _CoverCommand:
+    """A cover service call for a single entity."""
+
+    entity_id: str
+    service: str
+    data: dict[str, Any]
+    context: Context | None
+    future: asyncio.Future
+
+    @property
+    def key(self) -> tuple[str, bool]:
+        """Return the key of the commands this one supersedes."""
+        return (self.entity_id, self.service in TILT_SERVICES)
+
+
+@dataclass
+class _AreaQueue:
+    """Pending commands and limits of one area."""
+
+    concurrency: int = 0
+    stagger: float = 0.0
+    active: int = 0
+    next_start: float = 0.0
+    pending: dict[tuple[str, bool], _CoverCommand] = field(default_factory=dict)
+
+
+class CoverCommandScheduler:
+    """Send the cover commands of all areas without flooding the radios.
+
+    Group commands are split into one service call per cover. Each area sends
+    at most ``concurrency`` of them at a time (0 is unlimited), starting one
+    every ``stagger`` seconds, and no more than ``max_concurrent`` are in
+    flight across all areas. Areas take turns, so a large area cannot hold up
+    the others. A queued command is replaced by a newer one for the same
+    cover, and a cover never has more than one command in flight. Callers
+    wait until their command has been sent or superseded.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, max_concurrent: int = COVER_COMMAND_MAX_CONCURRENT
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._max_concurrent = max_concurrent
+        self._active = 0
+        self._in_flight: set[tuple[str, bool]] = set()
+        self._queues: dict[str, _AreaQueue] = {}
+        self._wakeup: asyncio.TimerHandle | None = None
+
+    async def async_call(
+        self,
+        area: str,
+        service: str,
+        entity_id: str,
+        data: dict[str, Any] | None = None,
+        *,
+        concurrency: int = 0,
+        stagger: float = 0.0,
+        context: Context | None = None,
+    ) -> None:
+        """Queue a cover service call for an entity and wait until it is sent."""
+        queue = self._queues.get(area)
+        if queue is None:
+            queue = self._queues[area] = _AreaQueue()
+        queue.concurrency = concurrency
+        queue.stagger = stagger
+
+        command = _CoverCommand(
+            entity_id,
+            service,
+            data or {},
+            context,
+            asyncio.get_running_loop().create_future(),
+        )
+        if (superseded := queue.pending.pop(command.key, None)) is not None:
+            LOGGER.debug(
+                "%s: %s superseded by %s", entity_id, superseded.service, service
+            )
+            if not superseded.future.done():
+                superseded.future.set_result(None)
+        queue.pending[command.key] = command
+
+        self._async_dispatch()
+        await command.future
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop all queued commands."""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        for queue in self._queues.values():
+            for command in queue.pending.values():
+                command.future.cancel()
+        self._queues.clear()
+
+    @callback
+    def _async_dispatch(self) -> None:
+        """Start as many queued commands as the limits allow."""
+        now = self.hass.loop.time()
+        wakeup: float | None = None
+        started = True
+        while started and self._active < self._max_concurrent:
+            started = False
+            # One command per area and round, so that areas take turns
+            for area, queue in list(self._queues.items()):
+                if self._active >= self._max_concurrent:
+                    break
+                if not queue.pending or (
+                    queue.concurrency and queue.active >= queue.concurrency
+                ):
+                    continue
+                if queue.next_start > now:
+                    if wakeup is None or queue.next_start < wakeup:
+                        wakeup = queue.next_start
+                    continue
+                command = next(
+                    (
+                        command
+                        for key, command in queue.pending.items()
+                        if key not in self._in_flight
+                    ),
+                    None,
+                )
+                if command is None:
+                    continue
+                del queue.pending[command.key]
+                # The next command starts with the other areas
+                self._queues[area] = self._queues.pop(area)
+                self._async_start(queue, command, now)
+                started = True
+
+        for area in [
+            area
+            for area, queue in self._queues.items()
+            if not queue.pending and not queue.active and queue.next_start <= now
+        ]:
+            del self._queues[area]
+
+        if wakeup is not None and (
+            self._wakeup is None or wakeup < self._wakeup.when()
+        ):
+            if self._wakeup is not None:
+                self._wakeup.cancel()
+            self._wakeup = self.hass.loop.call_at(wakeup, self._async_wake_up)
+
+    @callback
+    def _async_wake_up(self) -> None:
+        """Continue dispatching once a stagger delay has passed."""
+        self._wakeup = None
+        self._async_dispatch()
+
+    @callback
+    def _async_start(
+        self, queue: _AreaQueue, command: _CoverCommand, now: float
+    ) -> None:
+        """Send a command in the background."""
+        queue.active += 1
+        queue.next_start = now + queue.stagger
+        self._active += 1
+        self._in_flight.add(command.key)
+        self.hass.async_create_background_task(
+            self._async_send(queue, command),
+            f"auto_areas cover command {command.service} {command.entity_id}",
+        )
+
+    async def _async_send(self, queue: _AreaQueue, command: _CoverCommand) -> None:
+        """Send a command and start the next ones once it is done."""
+        LOGGER.debug(
+            "Sending cover command %s to %s", command.service, command.entity_id
+        )
+        try:
+            await self.hass.services.async_call(
+                COVER_DOMAIN,
+                command.service,
+                {ATTR_ENTITY_ID: command.entity_id, **command.data},
+                blocking=True,
+                context=command.context,
+            )
+        except Exception as err:
+            # Raised to the caller, the other commands are not affected
+            if not command.future.done():
+                command.future.set_exception(err)
+        else:
+            if not command.future.done():
+                command.future.set_result(None)
+        finally:
+            queue.active -= 1
+            self._active -= 1
+            self._in_flight.discard(command.key)
+            self._async_dispatch()
+
+
+@callback
+def async_get_cover_commands(hass: HomeAssistant) -> CoverCommandScheduler:
+    """Return the shared cover command scheduler, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (cover_commands := domain_data.get(DATA_COVER_COMMANDS)) is None:
+        cover_commands = domain_data[DATA_COVER_COMMANDS] = CoverCommandScheduler(hass)
+    return cover_commands
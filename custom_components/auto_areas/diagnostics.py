@@ -0,0 +1,23 @@
+"""Diagnostics support for Auto Areas."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .auto_area import AutoArea
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    auto_area: AutoArea = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "area": auto_area.area_name,
+        "options": dict(entry.options),
+        "members": auto_area.get_member_entity_ids(),
+        "metrics": auto_area.metrics.as_dict(),
+    }
@@ -1,30 +1,12 @@
 """Collection of utility methods for dealing with HomeAssistant."""
 
-from homeassistant.core import HomeAssistant
-from homeassistant.const import STATE_UNAVAILABLE
-from homeassistant.helpers.device_registry import DeviceRegistry
-from homeassistant.helpers.entity_registry import EntityRegistry, RegistryEntry
-
-
-def get_all_entities(
-    entity_registry: EntityRegistry,
-    device_registry: DeviceRegistry,
-    area_id: str,
-    domains: list[str] | None = None,
-) -> list[RegistryEntry]:
-    """Return all entities from an area."""
-    entities: list[RegistryEntry] = []
-
-    for _entity_id, entity in entity_registry.entities.items():
-        if get_area_id(entity, device_registry) != area_id:
-            continue
-
-        if domains is None or entity.domain not in domains:
-            continue
-
-        entities.append(entity)
+import asyncio
 
-    return entities
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.device_registry import DeviceRegistry
+from homeassistant.helpers.entity_registry import RegistryEntry
 
 
 def get_area_id(
@@ -45,25 +27,85 @@ def get_area_id(
     return None
 
 
-def all_states_are_off(
+def get_active_entity_ids(
     hass: HomeAssistant,
-    presence_indicating_entity_ids: list[str],
+    entity_ids: list[str],
     on_states: list[str],
-) -> bool:
-    """Make sure that none of the entities is in any on state."""
-    all_states = [
-        hass.states.get(entity_id) for entity_id in presence_indicating_entity_ids
-    ]
-    return all(state.state not in on_states for state in filter(None, all_states))
-
-
-def is_valid_entity(hass: HomeAssistant, entity: RegistryEntry) -> bool:
-    """Check whether an entity should be included."""
-    if entity.disabled:
-        return False
-
-    entity_state = hass.states.get(entity.entity_id)
-    if entity_state and entity_state.state == STATE_UNAVAILABLE:
-        return False
-
-    return True
+) -> set[str]:
+    """Return the entities that are currently in any on state."""
+    return {
+        entity_id
+        for entity_id in entity_ids
+        if (state := hass.states.get(entity_id)) is not None
+        and state.state in on_states
+    }
+
+
+def is_attribute_only_change(event: Event[EventStateChangedData]) -> bool:
+    """Return whether only the attributes of an entity changed, not its state.
+
+    Cheap enough to run first in every state change handler, so frequent
+    battery, linkquality or last_seen updates are dropped before any work.
+    """
+    data = event.data
+    old_state = data["old_state"]
+    new_state = data["new_state"]
+    return (
+        old_state is not None
+        and new_state is not None
+        and old_state.state == new_state.state
+    )
+
+
+def has_reported_state(hass: HomeAssistant, entity_ids: list[str]) -> bool:
+    """Return whether any of the entities has a known and available state."""
+    return any(
+        (state := hass.states.get(entity_id)) is not None
+        and state.state not in (STATE_UNKNOWN, STATE_UNAVAILABLE)
+        for entity_id in entity_ids
+    )
+
+
+def is_valid_entity(entity: RegistryEntry) -> bool:
+    """Check whether an entity should be included.
+
+    Availability is not checked here: unavailable members are tracked anyway
+    and left out of the calculation by the entities until they come back.
+    """
+    return not entity.disabled
+
+
+async def async_wait_for_states(
+    hass: HomeAssistant,
+    entity_ids: list[str],
+    timeout: float,
+) -> set[str]:
+    """Wait until all entities have a state. Return those still missing."""
+    missing = {
+        entity_id for entity_id in entity_ids if hass.states.get(entity_id) is None
+    }
+    if not missing:
+        return missing
+
+    ready = hass.loop.create_future()
+
+    @callback
+    def _async_state_changed(event: Event[EventStateChangedData]) -> None:
+        if event.data["new_state"] is None:
+            return
+        missing.discard(event.data["entity_id"])
+        if not missing and not ready.done():
+            ready.set_result(None)
+
+    unsubscribe = async_track_state_change_event(
+        hass, list(missing), _async_state_changed
+    )
+    try:
+        async with asyncio.timeout(timeout):
+            await ready
+    except TimeoutError:
+        pass
+    finally:
+        unsubscribe()
+
+    return missing
@@ -1,48 +1,52 @@
 """Light group."""
 
+from typing import Any
+
+from homeassistant.core import Event, EventStateChangedData, State, callback
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    SERVICE_TURN_OFF,
+    SERVICE_TURN_ON,
+    STATE_ON,
+    STATE_UNAVAILABLE,
+)
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.components.group.light import LightGroup
+from homeassistant.components.light import (
+    DOMAIN as LIGHT_DOMAIN,
+    ColorMode,
+    LightEntity,
+    LightEntityFeature,
+)
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.components.light import DOMAIN as LIGHT_DOMAIN
 
 from custom_components.auto_areas.auto_area import AutoArea
+from custom_components.auto_areas.state_router import StateSubscription
 from custom_components.auto_areas.const import (
-    CONFIG_EXCLUDED_LIGHT_ENTITIES,
+    CONFIG_FAST_LIGHT_GROUP,
     DOMAIN,
-    EXCLUDED_DOMAINS,
     LIGHT_GROUP_ENTITY_PREFIX,
     LIGHT_GROUP_PREFIX,
     LOGGER
 )
 
-from .ha_helpers import get_all_entities
-
 
 async def async_setup_entry(hass, entry, async_add_entities: AddEntitiesCallback):
     """Set up the light platform."""
     auto_area: AutoArea = hass.data[DOMAIN][entry.entry_id]
-    excluded_light_entities = excluded_light_entities = (
-        auto_area.config_entry.options.get(
-            CONFIG_EXCLUDED_LIGHT_ENTITIES)
-        or []
-    )
-    light_entity_ids = [
-        entity.entity_id
-        for entity in get_all_entities(
-            auto_area.entity_registry,
-            auto_area.device_registry,
-            auto_area.area_id,
-            [LIGHT_DOMAIN],
-        )
-        if entity.entity_id not in excluded_light_entities
-        and entity.platform not in EXCLUDED_DOMAINS
-    ]
+    light_entity_ids = auto_area.get_light_entity_ids()
 
     if not light_entity_ids:
         LOGGER.info(
             "%s: No lights found in area. Not creating light group.",
             auto_area.area_name,
         )
+    elif auto_area.config_entry.options.get(CONFIG_FAST_LIGHT_GROUP):
+        async_add_entities([AutoFastLightGroup(
+            hass,
+            auto_area,
+            entity_ids=light_entity_ids
+        )])
     else:
         async_add_entities([AutoLightGroup(
             hass,
@@ -61,6 +65,9 @@ class AutoLightGroup(LightGroup):
         self._name_prefix = LIGHT_GROUP_PREFIX
         self._prefix = LIGHT_GROUP_ENTITY_PREFIX
         self.entity_ids: list[str] = entity_ids
+        # LightGroup subscribes to its initial members only
+        self._initial_entity_ids = set(entity_ids)
+        self._added_subscription: StateSubscription | None = None
 
         LightGroup.__init__(
             self,
@@ -76,6 +83,185 @@ class AutoLightGroup(LightGroup):
             self.entity_ids
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Register listeners."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.auto_area.async_register_rebind(self._async_rebind))
+        self._added_subscription = self.auto_area.state_router.async_subscribe(
+            (), self._async_added_member_changed
+        )
+        self.async_on_remove(self._added_subscription.async_unsubscribe)
+
+    @callback
+    def _async_rebind(self) -> None:
+        """Update group members in place."""
+        entity_ids = self.auto_area.get_light_entity_ids()
+        if entity_ids == self._entity_ids:
+            return
+
+        LOGGER.info(
+            "%s: Light group members changed: %s",
+            self.auto_area.area_name,
+            entity_ids,
+        )
+        self.entity_ids = self._entity_ids = entity_ids
+        self._attr_extra_state_attributes = {ATTR_ENTITY_ID: entity_ids}
+
+        if self._added_subscription is not None:
+            self._added_subscription.async_set_entity_ids(
+                entity_id
+                for entity_id in entity_ids
+                if entity_id not in self._initial_entity_ids
+            )
+
+        self.async_update_group_state()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_added_member_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Handle state changes of lights added after setup."""
+        self.async_set_context(event.context)
+        self.async_defer_or_update_ha_state()
+
+    @property
+    def name(self):
+        """Name of this entity."""
+        return f"{self._name_prefix}{self.auto_area.area_name}"
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Information about this device."""
+        return self.auto_area.device_info
+
+    @property
+    def unique_id(self) -> str | None:
+        """Return a unique ID."""
+        return f"{self.auto_area.config_entry.entry_id}_light_group"
+
+
+class AutoFastLightGroup(LightEntity):
+    """On/off-only light group for areas with many lights.
+
+    Unlike LightGroup, member updates do not merge brightness, colors,
+    effects and features of all members. The group only keeps the sets of
+    members that are on and unavailable, which are updated per changed
+    member, and writes its state only when it changes.
+
+    Transition and flash are passed on to the members. Brightness and colors
+    are not supported, as the group has no brightness or color to report.
+    """
+
+    _attr_should_poll = False
+    _attr_color_mode = ColorMode.ONOFF
+    _attr_supported_color_modes = {ColorMode.ONOFF}
+    _attr_supported_features = LightEntityFeature.TRANSITION | LightEntityFeature.FLASH
+
+    def __init__(self, hass, auto_area: AutoArea, entity_ids: list[str]) -> None:
+        """Initialize light group."""
+        self.hass = hass
+        self.auto_area = auto_area
+        self._name_prefix = LIGHT_GROUP_PREFIX
+        self._prefix = LIGHT_GROUP_ENTITY_PREFIX
+        self.entity_ids: list[str] = entity_ids
+        self._on: set[str] = set()
+        self._unavailable: set[str] = set()
+        self._subscription: StateSubscription | None = None
+        LOGGER.info(
+            "%s: Initialized fast light group. Entities: %s",
+            self.auto_area.area_name,
+            self.entity_ids
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Register listeners."""
+        await super().async_added_to_hass()
+        for entity_id in self.entity_ids:
+            self._update_member(entity_id, self.hass.states.get(entity_id))
+        self._subscription = self.auto_area.state_router.async_subscribe(
+            self.entity_ids, self._async_member_changed
+        )
+        self.async_on_remove(self._subscription.async_unsubscribe)
+        self.async_on_remove(self.auto_area.async_register_rebind(self._async_rebind))
+
+    @callback
+    def _async_rebind(self) -> None:
+        """Update group members in place."""
+        entity_ids = self.auto_area.get_light_entity_ids()
+        if entity_ids == self.entity_ids:
+            return
+
+        removed = set(self.entity_ids) - set(entity_ids)
+        added = set(entity_ids) - set(self.entity_ids)
+        LOGGER.info(
+            "%s: Light group members changed. Added: %s, removed: %s",
+            self.auto_area.area_name,
+            added,
+            removed,
+        )
+        self.entity_ids = entity_ids
+        for entity_id in removed:
+            self._on.discard(entity_id)
+            self._unavailable.discard(entity_id)
+        for entity_id in added:
+            self._update_member(entity_id, self.hass.states.get(entity_id))
+        if self._subscription is not None:
+            self._subscription.async_set_entity_ids(entity_ids)
+        self.async_write_ha_state()
+
+    def _update_member(self, entity_id: str, state: State | None) -> None:
+        """Sort a member into the on and unavailable sets."""
+        if state is None or state.state == STATE_UNAVAILABLE:
+            self._unavailable.add(entity_id)
+        else:
+            self._unavailable.discard(entity_id)
+        if state is not None and state.state == STATE_ON:
+            self._on.add(entity_id)
+        else:
+            self._on.discard(entity_id)
+
+    @callback
+    def _async_member_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Update the group from a single member change."""
+        was_on = self.is_on
+        was_available = self.available
+        self._update_member(event.data["entity_id"], event.data["new_state"])
+        if self.is_on != was_on or self.available != was_available:
+            self.async_set_context(event.context)
+            self.async_write_ha_state()
+
+    @property
+    def is_on(self) -> bool:
+        """Return whether any member is on."""
+        return bool(self._on)
+
+    @property
+    def available(self) -> bool:
+        """Return whether any member is available."""
+        return len(self._unavailable) < len(self.entity_ids)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the members, like a light group does."""
+        return {ATTR_ENTITY_ID: self.entity_ids}
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn on all members."""
+        await self._async_call_members(SERVICE_TURN_ON, kwargs)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn off all members."""
+        await self._async_call_members(SERVICE_TURN_OFF, kwargs)
+
+    async def _async_call_members(self, service: str, data: dict[str, Any]) -> None:
+        """Forward a service call and its data to all members."""
+        await self.hass.services.async_call(
+            LIGHT_DOMAIN,
+            service,
+            {ATTR_ENTITY_ID: self.entity_ids, **data},
+            blocking=True,
+            context=self._context,
+        )
+
     @property
     def name(self):
         """Name of this entity."""
@@ -0,0 +1,85 @@
+"""Integration-wide batching of light service calls."""
+from __future__ import annotations
+
+import asyncio
+
+from homeassistant.components.light import DOMAIN as LIGHT_DOMAIN
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_LIGHT_COMMANDS, DOMAIN, LIGHT_COMMAND_WINDOW, LOGGER
+
+
+class LightCommandCoalescer:
+    """Collect light commands of all areas and send them together.
+
+    The first command starts a short window. All commands arriving within it
+    are sent as one service call per service (turn_on, turn_off, ...) with all
+    their entities. If an entity is commanded more than once, the last command
+    wins. Callers wait until their batch has been sent and get the service that
+    was actually sent for their entity, to notice when they were superseded.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, window: float = LIGHT_COMMAND_WINDOW
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._window = window
+        # entity_id -> service
+        self._pending: dict[str, str] = {}
+        self._flush: asyncio.Task[dict[str, str]] | None = None
+
+    async def async_call(self, service: str, entity_id: str) -> str:
+        """Queue a light service call for an entity and wait until it is sent.
+
+        Return the service sent for the entity, which differs from the given
+        one if another command for the entity arrived later in the window.
+        """
+        self._pending[entity_id] = service
+        if self._flush is None:
+            self._flush = self.hass.async_create_background_task(
+                self._async_flush(), "auto_areas light commands"
+            )
+        # A cancelled caller must not cancel the batch of the other areas
+        commands = await asyncio.shield(self._flush)
+        return commands[entity_id]
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop the commands that have not been sent yet."""
+        if self._flush is not None:
+            self._flush.cancel()
+            self._flush = None
+        self._pending = {}
+
+    async def _async_flush(self) -> dict[str, str]:
+        """Send all commands collected within the window and return them."""
+        await asyncio.sleep(self._window)
+        commands, self._pending, self._flush = self._pending, {}, None
+
+        entity_ids_by_service: dict[str, list[str]] = {}
+        for entity_id, service in commands.items():
+            entity_ids_by_service.setdefault(service, []).append(entity_id)
+
+        LOGGER.debug("Sending light commands %s", entity_ids_by_service)
+        calls = []
+        for service, entity_ids in entity_ids_by_service.items():
+            # A single entity is passed as is, like a direct call would
+            target = entity_ids if len(entity_ids) > 1 else entity_ids[0]
+            calls.append(
+                self.hass.services.async_call(
+                    LIGHT_DOMAIN, service, {ATTR_ENTITY_ID: target}
+                )
+            )
+        await asyncio.gather(*calls)
+        return commands
+
+
+@callback
+def async_get_light_commands(hass: HomeAssistant) -> LightCommandCoalescer:
+    """Return the shared light command coalescer, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (light_commands := domain_data.get(DATA_LIGHT_COMMANDS)) is None:
+        light_commands = domain_data[DATA_LIGHT_COMMANDS] = LightCommandCoalescer(hass)
+    return light_commands
@@ -0,0 +1,123 @@
+"""Lightweight timing and counters for the hot paths of an area."""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+import functools
+import inspect
+import time
+from typing import Any
+
+from .const import METRICS_SAMPLES
+
+
+class HandlerMetrics:
+    """Call count and latency of a single handler."""
+
+    __slots__ = ("calls", "max", "samples", "total")
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        # Most recent durations, for percentiles
+        self.samples: deque[float] = deque(maxlen=METRICS_SAMPLES)
+
+    def add(self, seconds: float) -> None:
+        """Record one call."""
+        self.calls += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.samples.append(seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics in milliseconds."""
+        samples = sorted(self.samples)
+        p99 = 0.0
+        if samples:
+            p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+        return {
+            "calls": self.calls,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.total / self.calls * 1000 if self.calls else 0.0,
+            "p99_ms": p99 * 1000,
+            "max_ms": self.max * 1000,
+        }
+
+
+class AreaMetrics:
+    """Collect handler timings and counters of an area, if enabled."""
+
+    def __init__(self, enabled: bool = False) -> None:
+        """Initialize."""
+        self.enabled = enabled
+        self._handlers: dict[str, HandlerMetrics] = {}
+        self._counters: dict[str, int] = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record the duration of a handler call."""
+        if (handler := self._handlers.get(name)) is None:
+            handler = self._handlers[name] = HandlerMetrics()
+        handler.add(seconds)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increase a counter."""
+        if self.enabled:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all metrics."""
+        return {
+            "enabled": self.enabled,
+            "handlers": {
+                name: handler.as_dict() for name, handler in self._handlers.items()
+            },
+            "counters": dict(self._counters),
+        }
+
+
+def _handler_name(owner: Any, name: str) -> str:
+    """Return the metrics key of a handler, per entity if it is one."""
+    if (entity_id := getattr(owner, "entity_id", None)) is None:
+        return name
+    return f"{name} ({entity_id})"
+
+
+def instrumented(func: Callable) -> Callable:
+    """Time calls of a method of an object with a `metrics` attribute.
+
+    When metrics are disabled, the only overhead is checking the flag.
+    Coroutines are timed until they return, including awaited calls.
+    Methods of entities are recorded per entity, as several entities of
+    an area share the same handler.
+    """
+    name = func.__qualname__
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            metrics: AreaMetrics = self.metrics
+            if not metrics.enabled:
+                return await func(self, *args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return await func(self, *args, **kwargs)
+            finally:
+                metrics.record(_handler_name(self, name), time.perf_counter() - start)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        metrics: AreaMetrics = self.metrics
+        if not metrics.enabled:
+            return func(self, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            metrics.record(_handler_name(self, name), time.perf_counter() - start)
+
+    return wrapper
@@ -0,0 +1,135 @@
+"""Integration-wide scheduling of presence timeouts."""
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from datetime import datetime
+import heapq
+from itertools import count
+import math
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_at
+
+from .const import DATA_PRESENCE_TIMERS, DOMAIN, LOGGER, PRESENCE_TIMER_RESOLUTION
+
+
+class PresenceTimers:
+    """Keep the presence deadlines of all areas in one heap.
+
+    Only the earliest deadline is armed as a loop timer. Deadlines are rounded
+    up to the resolution, so timeouts ending close to each other expire in one
+    batch. Cancelling or moving a deadline only updates a dict; outdated heap
+    entries are skipped when they come up, and an armed timer that fires too
+    early just arms the next deadline.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, resolution: float = PRESENCE_TIMER_RESOLUTION
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._resolution = resolution
+        # key -> (deadline, action)
+        self._deadlines: dict[Hashable, tuple[float, Callable[[], None]]] = {}
+        # (deadline, sequence, key), may contain outdated entries
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._sequence = count()
+        self._armed_at: float | None = None
+        self._cancel: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_schedule(
+        self, key: Hashable, deadline: float, action: Callable[[], None]
+    ) -> None:
+        """Call action at deadline (loop time), replacing any deadline of key."""
+        if self._resolution > 0:
+            deadline = math.ceil(deadline / self._resolution) * self._resolution
+        current = self._deadlines.get(key)
+        self._deadlines[key] = (deadline, action)
+        if current is not None and current[0] == deadline:
+            return
+
+        heapq.heappush(self._heap, (deadline, next(self._sequence), key))
+        if len(self._heap) > 2 * len(self._deadlines) + 16:
+            self._compact()
+        self._async_arm()
+
+    @callback
+    def async_cancel(self, key: Hashable) -> None:
+        """Drop the deadline of key, if any."""
+        self._deadlines.pop(key, None)
+
+    @callback
+    def async_is_scheduled(self, key: Hashable) -> bool:
+        """Return whether key has a pending deadline."""
+        return key in self._deadlines
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop all deadlines and the armed timer."""
+        if self._cancel is not None:
+            self._cancel()
+        self._cancel = None
+        self._armed_at = None
+        self._deadlines.clear()
+        self._heap.clear()
+
+    def _is_current(self, entry: tuple[float, int, Hashable]) -> bool:
+        """Return whether a heap entry is still the deadline of its key."""
+        current = self._deadlines.get(entry[2])
+        return current is not None and current[0] == entry[0]
+
+    def _compact(self) -> None:
+        """Remove outdated entries from the heap."""
+        self._heap = [entry for entry in self._heap if self._is_current(entry)]
+        heapq.heapify(self._heap)
+
+    @callback
+    def _async_arm(self) -> None:
+        """Make sure a loop timer is armed for the earliest deadline."""
+        while self._heap and not self._is_current(self._heap[0]):
+            heapq.heappop(self._heap)
+        if not self._heap:
+            return
+
+        deadline = self._heap[0][0]
+        if self._armed_at is not None and self._armed_at <= deadline:
+            # Fires earlier or in time and arms the next deadline then
+            return
+        if self._cancel is not None:
+            self._cancel()
+        self._armed_at = deadline
+        self._cancel = async_call_at(self.hass, self._async_fire, deadline)
+
+    @callback
+    def _async_fire(self, _now: datetime) -> None:
+        """Run the actions of all expired deadlines."""
+        # The loop may run a timer slightly before its time
+        expired_at = max(self.hass.loop.time(), self._armed_at or 0)
+        self._armed_at = None
+        self._cancel = None
+
+        actions = []
+        while self._heap and self._heap[0][0] <= expired_at:
+            entry = heapq.heappop(self._heap)
+            if self._is_current(entry):
+                actions.append(self._deadlines.pop(entry[2])[1])
+        self._async_arm()
+
+        if actions:
+            LOGGER.debug("%s presence timeouts expired", len(actions))
+        for action in actions:
+            try:
+                action()
+            except Exception:
+                # One area must not keep the others from clearing
+                LOGGER.exception("Error in presence timeout")
+
+
+@callback
+def async_get_presence_timers(hass: HomeAssistant) -> PresenceTimers:
+    """Return the shared presence timers, creating them on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (presence_timers := domain_data.get(DATA_PRESENCE_TIMERS)) is None:
+        presence_timers = domain_data[DATA_PRESENCE_TIMERS] = PresenceTimers(hass)
+    return presence_timers
@@ -114,6 +114,8 @@ class InvalidAreaConfigRepairFlow(RepairsFlow):
         if area is None:
             raise AutoAreasError("Area is not defined")
         for auto_area in existing_configs.values():
+            if not isinstance(auto_area, AutoArea):
+                continue
             existing_area_id = auto_area.config_entry.data.get("area")
             if existing_area_id == area_id:
                 raise AutoAreasError("This area is already managed")
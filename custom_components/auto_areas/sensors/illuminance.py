@@ -10,7 +10,8 @@ from custom_components.auto_areas.auto_area import AutoArea
 from custom_components.auto_areas.auto_entity import AutoEntity
 from custom_components.auto_areas.const import (
     ILLUMINANCE_SENSOR_ENTITY_PREFIX,
-    ILLUMINANCE_SENSOR_PREFIX
+    ILLUMINANCE_SENSOR_PREFIX,
+    SIGNAL_ILLUMINANCE,
 )
 
 
@@ -19,6 +20,8 @@ class IlluminanceSensor(
 ):
     """Set up aggregated illuminance sensor."""
 
+    _signal = SIGNAL_ILLUMINANCE
+
     def __init__(self, hass, auto_area: AutoArea) -> None:
         """Initialize sensor."""
         super().__init__(
@@ -0,0 +1,57 @@
+"""In-process signals between the entities of an area."""
+from __future__ import annotations
+
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+
+from .const import LOGGER
+
+SignalListener = Callable[[Any], Coroutine[Any, Any, None] | None]
+
+
+class AreaSignals:
+    """Publish aggregate values of an area directly to their consumers.
+
+    Entities push typed values (e.g. presence as bool, illuminance as float)
+    and AutoLights receives them without a round trip through the state
+    machine, and without having to know any entity ids. The last value of each
+    signal is kept, so late subscribers can read the current state. Publishing
+    an unchanged value does not notify anyone.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._values: dict[str, Any] = {}
+        self._listeners: dict[str, list[HassJob[[Any], Any]]] = {}
+
+    @callback
+    def async_get(self, signal: str, default: Any = None) -> Any:
+        """Return the last published value of a signal."""
+        return self._values.get(signal, default)
+
+    @callback
+    def async_publish(self, signal: str, value: Any) -> None:
+        """Store a new value and notify the listeners if it changed."""
+        if signal in self._values and self._values[signal] == value:
+            return
+
+        LOGGER.debug("Signal %s: %s -> %s", signal, self._values.get(signal), value)
+        self._values[signal] = value
+        for job in list(self._listeners.get(signal, ())):
+            self.hass.async_run_hass_job(job, value)
+
+    @callback
+    def async_subscribe(self, signal: str, listener: SignalListener) -> CALLBACK_TYPE:
+        """Call listener with every new value of a signal."""
+        job = HassJob(listener, f"auto_areas signal {signal}")
+        listeners = self._listeners.setdefault(signal, [])
+        listeners.append(job)
+
+        @callback
+        def _async_unsubscribe() -> None:
+            listeners.remove(job)
+
+        return _async_unsubscribe
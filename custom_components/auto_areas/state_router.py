@@ -0,0 +1,128 @@
+"""Integration-wide routing of member state changes."""
+from __future__ import annotations
+
+from collections.abc import Callable, Coroutine, Iterable
+from typing import Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HassJob,
+    HomeAssistant,
+    callback,
+)
+
+from .const import DATA_STATE_ROUTER, DOMAIN, LOGGER
+
+StateChangeHandler = Callable[
+    [Event[EventStateChangedData]], Coroutine[Any, Any, None] | None
+]
+
+
+class StateSubscription:
+    """The entities a single handler is subscribed to."""
+
+    def __init__(self, router: StateChangeRouter, job: HassJob) -> None:
+        """Initialize."""
+        self._router = router
+        self._job = job
+        self.entity_ids: set[str] = set()
+
+    @callback
+    def async_set_entity_ids(self, entity_ids: Iterable[str]) -> None:
+        """Change the tracked entities, touching only the added and removed ones."""
+        entity_ids = set(entity_ids)
+        for entity_id in self.entity_ids - entity_ids:
+            self._router.async_remove(entity_id, self._job)
+        for entity_id in entity_ids - self.entity_ids:
+            self._router.async_add(entity_id, self._job)
+        self.entity_ids = entity_ids
+
+    @callback
+    def async_unsubscribe(self) -> None:
+        """Stop tracking all entities."""
+        self.async_set_entity_ids(())
+
+
+class StateChangeRouter:
+    """Dispatch state changes of all areas from a single bus listener.
+
+    Handlers are kept in one entity_id -> jobs table. Events of untracked
+    entities are dropped by the event filter before a job is created, and
+    callback handlers run synchronously within the dispatch, so the cost of an
+    event depends on the handlers of that entity only, not on the number of
+    areas or aggregate entities.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._jobs: dict[str, list[HassJob]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self, entity_ids: Iterable[str], handler: StateChangeHandler
+    ) -> StateSubscription:
+        """Call handler with state changes of the given entities."""
+        subscription = StateSubscription(
+            self, HassJob(handler, f"auto_areas state change {handler.__qualname__}")
+        )
+        subscription.async_set_entity_ids(entity_ids)
+        return subscription
+
+    @callback
+    def async_add(self, entity_id: str, job: HassJob) -> None:
+        """Route state changes of an entity to a job."""
+        self._jobs.setdefault(entity_id, []).append(job)
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_dispatch,
+                event_filter=self._async_filter,
+            )
+
+    @callback
+    def async_remove(self, entity_id: str, job: HassJob) -> None:
+        """Stop routing state changes of an entity to a job."""
+        jobs = self._jobs.get(entity_id)
+        if jobs is None or job not in jobs:
+            return
+        jobs.remove(job)
+        if not jobs:
+            del self._jobs[entity_id]
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop listening to state changes."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        self._jobs.clear()
+
+    @callback
+    def _async_filter(self, event_data: EventStateChangedData) -> bool:
+        """Only let state changes of tracked entities through."""
+        return event_data["entity_id"] in self._jobs
+
+    @callback
+    def _async_dispatch(self, event: Event[EventStateChangedData]) -> None:
+        """Run the handlers of the changed entity."""
+        entity_id = event.data["entity_id"]
+        for job in list(self._jobs.get(entity_id, ())):
+            try:
+                self.hass.async_run_hass_job(job, event)
+            except Exception:
+                # One handler must not keep the others from running
+                LOGGER.exception("Error handling state change of %s", entity_id)
+
+
+@callback
+def async_get_state_router(hass: HomeAssistant) -> StateChangeRouter:
+    """Return the shared state change router, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (state_router := domain_data.get(DATA_STATE_ROUTER)) is None:
+        state_router = domain_data[DATA_STATE_ROUTER] = StateChangeRouter(hass)
+    return state_router
@@ -4,7 +4,9 @@ from homeassistant.components.switch import (
     SwitchEntity,
     SwitchDeviceClass,
 )
+from homeassistant.const import STATE_ON
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.typing import UndefinedType
 
 from custom_components.auto_areas.auto_area import AutoArea
@@ -14,7 +16,7 @@ from custom_components.auto_areas.const import (
 )
 
 
-class PresenceLockSwitch(SwitchEntity):
+class PresenceLockSwitch(SwitchEntity, RestoreEntity):
     """Set up a presence lock switch."""
 
     _attr_should_poll: bool = False
@@ -54,14 +56,25 @@ class PresenceLockSwitch(SwitchEntity):
         """Return the state of the switch."""
         return self._is_on
 
-    def turn_on(self, **kwargs) -> None:
+    async def async_added_to_hass(self) -> None:
+        """Restore the last state."""
+        await super().async_added_to_hass()
+        if (last_state := await self.async_get_last_state()) is not None:
+            self._is_on = last_state.state == STATE_ON
+            LOGGER.debug(
+                "%s: Presence lock restored (%s)",
+                self.auto_area.area_name,
+                last_state.state
+            )
+
+    async def async_turn_on(self, **kwargs) -> None:
         """Turn on switch."""
         LOGGER.info("%s: Presence lock turned on", self.auto_area.area_name)
         self._is_on = True
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
-    def turn_off(self, **kwargs):
+    async def async_turn_off(self, **kwargs) -> None:
         """Turn off switch."""
         LOGGER.info("%s: Presence lock turned off", self.auto_area.area_name)
         self._is_on = False
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
@@ -4,17 +4,20 @@ from homeassistant.components.switch import (
     SwitchEntity,
     SwitchDeviceClass,
 )
+from homeassistant.const import STATE_ON
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.typing import UndefinedType
 
 from custom_components.auto_areas.auto_area import AutoArea
 from custom_components.auto_areas.const import (
     LOGGER,
-    SLEEP_MODE_SWITCH_PREFIX
+    SIGNAL_SLEEP_MODE,
+    SLEEP_MODE_SWITCH_PREFIX,
 )
 
 
-class SleepModeSwitch(SwitchEntity):
+class SleepModeSwitch(SwitchEntity, RestoreEntity):
     """Set up a sleep mode switch."""
 
     _attr_should_poll = False
@@ -54,14 +57,28 @@ class SleepModeSwitch(SwitchEntity):
         """Return the state of the switch."""
         return self._is_on
 
-    def turn_on(self, **kwargs) -> None:
+    async def async_added_to_hass(self) -> None:
+        """Restore the last state."""
+        await super().async_added_to_hass()
+        if (last_state := await self.async_get_last_state()) is not None:
+            self._is_on = last_state.state == STATE_ON
+            LOGGER.debug(
+                "%s: Sleep mode restored (%s)",
+                self.auto_area.area_name,
+                last_state.state
+            )
+        self.auto_area.signals.async_publish(SIGNAL_SLEEP_MODE, self._is_on)
+
+    async def async_turn_on(self, **kwargs) -> None:
         """Turn on switch."""
         LOGGER.info("%s: Sleep mode turned on", self.auto_area.area_name)
         self._is_on = True
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
+        self.auto_area.signals.async_publish(SIGNAL_SLEEP_MODE, True)
 
-    def turn_off(self, **kwargs):
+    async def async_turn_off(self, **kwargs) -> None:
         """Turn off switch."""
         LOGGER.info("%s: Sleep mode turned off", self.auto_area.area_name)
         self._is_on = False
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
+        self.auto_area.signals.async_publish(SIGNAL_SLEEP_MODE, False)
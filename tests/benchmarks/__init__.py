@@ -0,0 +1 @@
+"""Benchmarks for auto_areas."""
@@ -0,0 +1,177 @@
+"""Fixtures for benchmarks.
+
+Benchmarks are skipped by a normal test run. Run them with::
+
+    pytest -m perf tests/benchmarks
+
+The size of the synthetic home is set by AUTO_AREAS_BENCH_AREAS,
+AUTO_AREAS_BENCH_ENTITIES (per area and domain) and AUTO_AREAS_BENCH_EVENTS.
+Results are written as JSON to AUTO_AREAS_BENCH_OUTPUT (default:
+bench_results.json, relative paths are resolved against the pytest root
+directory) to compare them between versions.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+import os
+import platform
+import time
+
+import pytest
+
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import area_registry as ar, entity_registry as er
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.auto_areas.const import CONFIG_AREA, DOMAIN, VERSION
+
+AREAS = int(os.environ.get("AUTO_AREAS_BENCH_AREAS", "20"))
+ENTITIES_PER_DOMAIN = int(os.environ.get("AUTO_AREAS_BENCH_ENTITIES", "5"))
+EVENTS = int(os.environ.get("AUTO_AREAS_BENCH_EVENTS", "1000"))
+OUTPUT = os.environ.get("AUTO_AREAS_BENCH_OUTPUT", "bench_results.json")
+
+# (domain, device class, initial state) of the generated members
+MEMBER_TYPES = [
+    ("binary_sensor", "motion", STATE_OFF),
+    ("binary_sensor", "door", STATE_OFF),
+    ("binary_sensor", "smoke", STATE_OFF),
+    ("sensor", "temperature", "21.0"),
+    ("sensor", "humidity", "45.0"),
+    ("sensor", "illuminance", "120.0"),
+    ("light", None, STATE_OFF),
+    ("cover", "blind", "open"),
+]
+
+_RESULTS: dict[str, dict] = {}
+
+
+@dataclass
+class SyntheticArea:
+    """An area of the synthetic home and its members."""
+
+    area: ar.AreaEntry
+    entity_ids: dict[str | None, list[str]] = field(default_factory=dict)
+    config_entry: MockConfigEntry | None = None
+
+
+@dataclass
+class SyntheticHome:
+    """A generated home with AREAS areas."""
+
+    areas: list[SyntheticArea]
+
+    @property
+    def entity_count(self) -> int:
+        """Return the number of generated members."""
+        return sum(
+            len(entity_ids)
+            for area in self.areas
+            for entity_ids in area.entity_ids.values()
+        )
+
+
+class Timer:
+    """Measure wall clock time of a block."""
+
+    def __enter__(self) -> Timer:
+        """Start."""
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Stop."""
+        self.seconds = time.perf_counter() - self.start
+
+
+def record(name: str, **values) -> None:
+    """Store the result of a benchmark."""
+    _RESULTS[name] = values
+
+
+def pytest_sessionfinish(session, exitstatus) -> None:
+    """Write the collected results."""
+    if not _RESULTS:
+        return
+    output = session.config.rootpath / OUTPUT
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(
+            {
+                "version": VERSION,
+                "python": platform.python_version(),
+                "areas": AREAS,
+                "entities_per_domain": ENTITIES_PER_DOMAIN,
+                "events": EVENTS,
+                "results": _RESULTS,
+            },
+            file,
+            indent=2,
+        )
+
+
+@pytest.fixture
+async def synthetic_home(hass: HomeAssistant) -> SyntheticHome:
+    """Create AREAS areas with ENTITIES_PER_DOMAIN members of each type."""
+    area_registry = ar.async_get(hass)
+    entity_registry = er.async_get(hass)
+
+    areas = []
+    for area_number in range(AREAS):
+        synthetic_area = SyntheticArea(
+            area_registry.async_create(f"Bench Room {area_number}")
+        )
+        for domain, device_class, initial_state in MEMBER_TYPES:
+            for number in range(ENTITIES_PER_DOMAIN):
+                entry = entity_registry.async_get_or_create(
+                    domain=domain,
+                    platform="bench",
+                    unique_id=f"{area_number}_{domain}_{device_class}_{number}",
+                    suggested_object_id=(
+                        f"bench_{area_number}_{device_class or domain}_{number}"
+                    ),
+                    original_device_class=device_class,
+                )
+                entity_registry.async_update_entity(
+                    entry.entity_id, area_id=synthetic_area.area.id
+                )
+                hass.states.async_set(entry.entity_id, initial_state)
+                synthetic_area.entity_ids.setdefault(device_class, []).append(
+                    entry.entity_id
+                )
+        areas.append(synthetic_area)
+
+    await hass.async_block_till_done()
+    return SyntheticHome(areas)
+
+
+async def async_setup_home(hass: HomeAssistant, home: SyntheticHome) -> float:
+    """Set up a config entry per area, return the elapsed seconds."""
+    with Timer() as timer:
+        for synthetic_area in home.areas:
+            entry = MockConfigEntry(
+                domain=DOMAIN,
+                data={CONFIG_AREA: synthetic_area.area.id},
+                options={},
+                title=synthetic_area.area.name,
+            )
+            entry.add_to_hass(hass)
+            synthetic_area.config_entry = entry
+            await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    return timer.seconds
+
+
+@pytest.fixture
+async def loaded_home(
+    hass: HomeAssistant, synthetic_home: SyntheticHome
+) -> SyntheticHome:
+    """Return the synthetic home with all areas set up."""
+    await async_setup_home(hass, synthetic_home)
+    return synthetic_home
+
+
+def toggle(state: str) -> str:
+    """Return the opposite binary state."""
+    return STATE_OFF if state == STATE_ON else STATE_ON
@@ -0,0 +1,161 @@
+"""Benchmarks for setup time, lookups and event throughput."""
+from __future__ import annotations
+
+import pytest
+
+from homeassistant.const import STATE_OFF
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.auto_areas.area_index import AreaIndex
+from custom_components.auto_areas.const import RELEVANT_DOMAINS
+
+from .conftest import (
+    EVENTS,
+    SyntheticHome,
+    Timer,
+    async_setup_home,
+    record,
+    toggle,
+)
+
+pytestmark = pytest.mark.perf
+
+
+async def test_setup_time(hass: HomeAssistant, synthetic_home: SyntheticHome):
+    """Measure config entry setup of all areas."""
+    seconds = await async_setup_home(hass, synthetic_home)
+
+    record(
+        "setup",
+        areas=len(synthetic_home.areas),
+        entities=synthetic_home.entity_count,
+        total_seconds=seconds,
+        seconds_per_area=seconds / len(synthetic_home.areas),
+    )
+    assert hass.states.get(
+        f"binary_sensor.area_presence_bench_room_{len(synthetic_home.areas) - 1}"
+    )
+
+
+async def test_area_lookup_latency(
+    hass: HomeAssistant, synthetic_home: SyntheticHome
+):
+    """Measure building the area index and looking up areas in it."""
+    entity_registry = er.async_get(hass)
+    area_ids = [synthetic_area.area.id for synthetic_area in synthetic_home.areas]
+
+    with Timer() as build:
+        area_index = AreaIndex(hass)
+    with Timer() as index:
+        for area_id in area_ids:
+            area_index.async_get_entities(area_id, RELEVANT_DOMAINS)
+    area_index.async_shutdown()
+
+    record(
+        "area_lookup",
+        registry_entities=len(entity_registry.entities),
+        index_build_ms=build.seconds * 1000,
+        area_index_ms=index.seconds / len(area_ids) * 1000,
+    )
+
+
+async def test_registry_event_fan_out(
+    hass: HomeAssistant, loaded_home: SyntheticHome
+):
+    """Measure the cost of entity registry updates with all areas loaded."""
+    entity_registry = er.async_get(hass)
+    first, second = loaded_home.areas[0], loaded_home.areas[-1]
+    entity_id = first.entity_ids["motion"][0]
+    updates = min(EVENTS, 200)
+
+    with Timer() as timer:
+        for number in range(updates):
+            target = second if number % 2 == 0 else first
+            entity_registry.async_update_entity(entity_id, area_id=target.area.id)
+            await hass.async_block_till_done()
+
+    record(
+        "registry_fan_out",
+        areas=len(loaded_home.areas),
+        updates=updates,
+        ms_per_update=timer.seconds / updates * 1000,
+    )
+
+
+async def test_presence_throughput(
+    hass: HomeAssistant, loaded_home: SyntheticHome
+):
+    """Measure motion events per second through the presence sensors."""
+    motion_ids = [
+        entity_id
+        for synthetic_area in loaded_home.areas
+        for entity_id in synthetic_area.entity_ids["motion"]
+    ]
+    states = dict.fromkeys(motion_ids, STATE_OFF)
+
+    with Timer() as timer:
+        for number in range(EVENTS):
+            entity_id = motion_ids[number % len(motion_ids)]
+            states[entity_id] = toggle(states[entity_id])
+            hass.states.async_set(entity_id, states[entity_id])
+        await hass.async_block_till_done()
+
+    record(
+        "presence_events",
+        events=EVENTS,
+        events_per_second=EVENTS / timer.seconds,
+    )
+    assert hass.states.get("binary_sensor.area_presence_bench_room_0") is not None
+
+
+@pytest.mark.parametrize("device_class", ["temperature", "humidity", "illuminance"])
+async def test_aggregate_sensor_throughput(
+    hass: HomeAssistant, loaded_home: SyntheticHome, device_class: str
+):
+    """Measure state changes per second through the AutoEntity sensors."""
+    sensor_ids = [
+        entity_id
+        for synthetic_area in loaded_home.areas
+        for entity_id in synthetic_area.entity_ids[device_class]
+    ]
+
+    with Timer() as timer:
+        for number in range(EVENTS):
+            hass.states.async_set(
+                sensor_ids[number % len(sensor_ids)], str(15 + number % 100 / 10)
+            )
+        await hass.async_block_till_done()
+
+    record(
+        f"{device_class}_events",
+        events=EVENTS,
+        events_per_second=EVENTS / timer.seconds,
+    )
+    assert hass.states.get(f"sensor.area_{device_class}_bench_room_0") is not None
+
+
+async def test_light_group_throughput(
+    hass: HomeAssistant, loaded_home: SyntheticHome
+):
+    """Measure light member changes per second through the light groups."""
+    light_ids = [
+        entity_id
+        for synthetic_area in loaded_home.areas
+        for entity_id in synthetic_area.entity_ids[None]
+    ]
+    states = dict.fromkeys(light_ids, STATE_OFF)
+
+    with Timer() as timer:
+        for number in range(EVENTS):
+            entity_id = light_ids[number % len(light_ids)]
+            states[entity_id] = toggle(states[entity_id])
+            hass.states.async_set(entity_id, states[entity_id])
+        await hass.async_block_till_done()
+
+    record(
+        "light_group_events",
+        events=EVENTS,
+        events_per_second=EVENTS / timer.seconds,
+    )
+    assert hass.states.get("light.area_lights_bench_room_0") is not None
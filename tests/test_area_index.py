@@ -0,0 +1,182 @@
+"""Tests for the shared area index."""
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+)
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.auto_areas.area_index import async_get_area_index
+from custom_components.auto_areas.const import DATA_AREA_INDEX, DOMAIN
+
+
+def _create_entity(hass, unique_id, domain="binary_sensor", device_class=None, **kwargs):
+    """Create a registry entry."""
+    entity_registry = er.async_get(hass)
+    return entity_registry.async_get_or_create(
+        domain=domain,
+        platform="test",
+        unique_id=unique_id,
+        original_device_class=device_class,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_index_is_shared(hass: HomeAssistant):
+    """The index is created once and stored in hass.data."""
+    area_index = async_get_area_index(hass)
+
+    assert async_get_area_index(hass) is area_index
+    assert hass.data[DOMAIN][DATA_AREA_INDEX] is area_index
+
+
+@pytest.mark.asyncio
+async def test_lookup_by_domain_and_device_class(
+    hass: HomeAssistant, test_area: ar.AreaEntry
+):
+    """Entities are found by area, domain and device class."""
+    entity_registry = er.async_get(hass)
+    motion = _create_entity(hass, "motion", device_class="motion")
+    door = _create_entity(hass, "door", device_class="door")
+    light = _create_entity(hass, "lamp", domain="light")
+    for entry in (motion, door, light):
+        entity_registry.async_update_entity(entry.entity_id, area_id=test_area.id)
+    await hass.async_block_till_done()
+
+    area_index = async_get_area_index(hass)
+
+    assert area_index.async_get_entity_ids(
+        test_area.id, ["binary_sensor"], ["motion"]
+    ) == [motion.entity_id]
+    assert set(area_index.async_get_entity_ids(test_area.id, ["binary_sensor"])) == {
+        motion.entity_id,
+        door.entity_id,
+    }
+    assert [
+        entry.entity_id
+        for entry in area_index.async_get_entities(test_area.id, ["light"])
+    ] == [light.entity_id]
+    assert area_index.async_get_entity_ids("unknown_area") == []
+
+
+@pytest.mark.asyncio
+async def test_entity_area_changes_are_applied(
+    hass: HomeAssistant, test_area: ar.AreaEntry
+):
+    """Moving, renaming and removing entities updates the index."""
+    entity_registry = er.async_get(hass)
+    other_area = ar.async_get(hass).async_create("Other Room")
+    area_index = async_get_area_index(hass)
+
+    motion = _create_entity(hass, "motion", device_class="motion")
+    entity_registry.async_update_entity(motion.entity_id, area_id=test_area.id)
+    await hass.async_block_till_done()
+    assert area_index.async_get_entity_ids(test_area.id) == [motion.entity_id]
+
+    entity_registry.async_update_entity(motion.entity_id, area_id=other_area.id)
+    await hass.async_block_till_done()
+    assert area_index.async_get_entity_ids(test_area.id) == []
+    assert area_index.async_get_entity_ids(other_area.id) == [motion.entity_id]
+
+    entity_registry.async_update_entity(
+        motion.entity_id, new_entity_id="binary_sensor.renamed_motion"
+    )
+    await hass.async_block_till_done()
+    assert area_index.async_get_entity_ids(other_area.id) == [
+        "binary_sensor.renamed_motion"
+    ]
+
+    entity_registry.async_remove("binary_sensor.renamed_motion")
+    await hass.async_block_till_done()
+    assert area_index.async_get_entity_ids(other_area.id) == []
+    assert area_index.async_get_area_id("binary_sensor.renamed_motion") is None
+
+
+@pytest.mark.asyncio
+async def test_area_inherited_from_device(
+    hass: HomeAssistant, test_area: ar.AreaEntry
+):
+    """Entities follow the area of their device."""
+    config_entry = MockConfigEntry(domain="test")
+    config_entry.add_to_hass(hass)
+    device_registry = dr.async_get(hass)
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        identifiers={("test", "device")},
+    )
+    sensor = _create_entity(
+        hass, "temp", domain="sensor", device_class="temperature", device_id=device.id
+    )
+    area_index = async_get_area_index(hass)
+    assert area_index.async_get_entity_ids(test_area.id) == []
+
+    device_registry.async_update_device(device.id, area_id=test_area.id)
+    await hass.async_block_till_done()
+
+    assert area_index.async_get_entity_ids(
+        test_area.id, ["sensor"], ["temperature"]
+    ) == [sensor.entity_id]
+    assert area_index.async_get_area_id(sensor.entity_id) == test_area.id
+
+
+@pytest.mark.asyncio
+async def test_dispatch_only_to_affected_areas(
+    hass: HomeAssistant, test_area: ar.AreaEntry
+):
+    """Registry events only reach the listeners of the old and new area."""
+    entity_registry = er.async_get(hass)
+    area_registry = ar.async_get(hass)
+    other_area = area_registry.async_create("Other Room")
+    unrelated_area = area_registry.async_create("Unrelated Room")
+    area_index = async_get_area_index(hass)
+
+    calls: dict[str, list] = {test_area.id: [], other_area.id: [], unrelated_area.id: []}
+    for area_id, area_calls in calls.items():
+        area_index.async_subscribe(area_id, area_calls.append)
+
+    motion = _create_entity(hass, "motion", device_class="motion")
+    entity_registry.async_update_entity(motion.entity_id, area_id=test_area.id)
+    await hass.async_block_till_done()
+    assert calls[test_area.id] == [motion.entity_id]
+
+    entity_registry.async_update_entity(motion.entity_id, area_id=other_area.id)
+    await hass.async_block_till_done()
+    assert calls[test_area.id] == [motion.entity_id, motion.entity_id]
+    assert calls[other_area.id] == [motion.entity_id]
+
+    area_registry.async_update(other_area.id, name="Renamed Room")
+    await hass.async_block_till_done()
+    assert calls[other_area.id] == [motion.entity_id, None]
+    assert calls[unrelated_area.id] == []
+
+
+@pytest.mark.asyncio
+async def test_own_entities_do_not_dispatch(
+    hass: HomeAssistant, test_area: ar.AreaEntry
+):
+    """Changes of auto_areas entities are indexed but not dispatched."""
+    entity_registry = er.async_get(hass)
+    area_index = async_get_area_index(hass)
+    calls: list = []
+    unsubscribe = area_index.async_subscribe(test_area.id, calls.append)
+
+    own = entity_registry.async_get_or_create(
+        domain="binary_sensor", platform=DOMAIN, unique_id="own_presence"
+    )
+    entity_registry.async_update_entity(own.entity_id, area_id=test_area.id)
+    await hass.async_block_till_done()
+
+    assert calls == []
+    assert area_index.async_get_entity_ids(test_area.id) == [own.entity_id]
+
+    unsubscribe()
+    motion = _create_entity(hass, "motion", device_class="motion")
+    entity_registry.async_update_entity(motion.entity_id, area_id=test_area.id)
+    await hass.async_block_till_done()
+    assert calls == []
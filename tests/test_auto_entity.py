@@ -41,7 +41,7 @@ def _make_auto_area(area_name="test_area", entry_id="test_entry"):
         "identifiers": {("auto_areas", entry_id)},
         "name": "Auto Areas",
     }
-    auto_area.get_valid_entities.return_value = []
+    auto_area.get_entity_ids.return_value = []
     return auto_area
 
 
@@ -110,7 +110,7 @@ class TestAutoEntityUnknownUnavailable:
         event = _make_event("sensor.temp1", valid_state, unknown_state)
 
         with patch.object(entity, 'async_write_ha_state'):
-            await entity._handle_state_change(event)
+            entity._handle_state_change(event)
 
         assert "sensor.temp1" not in entity.entity_states
         assert "sensor.temp1" not in entity.entity_float_values
@@ -129,10 +129,368 @@ class TestAutoEntityUnknownUnavailable:
         event = _make_event("sensor.temp1", valid_state, unavailable_state)
 
         with patch.object(entity, 'async_write_ha_state'):
-            await entity._handle_state_change(event)
+            entity._handle_state_change(event)
 
         assert "sensor.temp1" not in entity.entity_states
 
+    @pytest.mark.asyncio
+    async def test_unavailable_member_is_included_again(self):
+        """A member that was unavailable at setup counts once it comes back."""
+        hass = _make_hass()
+        auto_area = _make_auto_area()
+        entity = _create_auto_entity(hass, auto_area)
+        entity.entity_ids = ["sensor.temp1", "sensor.temp2"]
+
+        entity._update_entity_state(_make_state("sensor.temp1", STATE_UNAVAILABLE))
+        entity._update_entity_state(_make_state("sensor.temp2", "20.0"))
+        assert entity._get_state() == 20.0
+
+        available_state = _make_state("sensor.temp1", "22.0")
+        event = _make_event("sensor.temp1", None, available_state)
+
+        with patch.object(entity, 'async_write_ha_state'):
+            entity._handle_state_change(event)
+
+        assert entity._aggregated_state == 21.0
+
+
+class TestAutoEntityChangeSuppression:
+    """Test that unchanged aggregates are not written."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_value_not_written(self):
+        """A member update that does not change the aggregate is not written."""
+        hass = _make_hass()
+        auto_area = _make_auto_area()
+        entity = _create_auto_entity(hass, auto_area)
+        entity._update_entity_state(_make_state("sensor.temp1", "21.0"))
+        entity._update_entity_state(_make_state("sensor.temp2", "21.0"))
+        entity._aggregated_state = 21.0
+
+        new_state = _make_state("sensor.temp1", "21.0")
+        event = _make_event("sensor.temp1", None, new_state)
+
+        with patch.object(entity, 'async_write_ha_state') as write_state:
+            entity._handle_state_change(event)
+
+        write_state.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_changes_within_deadband_not_written(self):
+        """Changes are only written once they exceed the deadband."""
+        from custom_components.auto_areas.const import CONFIG_TEMPERATURE_DEADBAND
+
+        hass = _make_hass()
+        auto_area = _make_auto_area()
+        auto_area.config_entry.options = {CONFIG_TEMPERATURE_DEADBAND: 0.5}
+        entity = _create_auto_entity(hass, auto_area)
+        entity._update_entity_state(_make_state("sensor.temp1", "21.0"))
+        entity._aggregated_state = 21.0
+
+        with patch.object(entity, 'async_write_ha_state') as write_state:
+            for value in ("21.2", "21.4"):
+                new_state = _make_state("sensor.temp1", value)
+                entity._handle_state_change(
+                    _make_event("sensor.temp1", None, new_state)
+                )
+            write_state.assert_not_called()
+            assert entity._aggregated_state == 21.0
+
+            new_state = _make_state("sensor.temp1", "21.6")
+            entity._handle_state_change(
+                _make_event("sensor.temp1", None, new_state)
+            )
+
+        write_state.assert_called_once()
+        assert entity._aggregated_state == 21.6
+
+
+    @pytest.mark.asyncio
+    async def test_relative_deadband_mode(self):
+        """A relative deadband compares with a percentage of the last value."""
+        from custom_components.auto_areas.const import (
+            CONFIG_TEMPERATURE_DEADBAND,
+            CONFIG_TEMPERATURE_DEADBAND_MODE,
+        )
+
+        hass = _make_hass()
+        auto_area = _make_auto_area()
+        auto_area.config_entry.options = {
+            CONFIG_TEMPERATURE_DEADBAND: 10,
+            CONFIG_TEMPERATURE_DEADBAND_MODE: "relative",
+        }
+        entity = _create_auto_entity(hass, auto_area)
+        entity._update_entity_state(_make_state("sensor.temp1", "20.0"))
+        entity._aggregated_state = 20.0
+
+        with patch.object(entity, 'async_write_ha_state') as write_state:
+            entity._handle_state_change(
+                _make_event("sensor.temp1", None, _make_state("sensor.temp1", "21.5"))
+            )
+            write_state.assert_not_called()
+
+            entity._handle_state_change(
+                _make_event("sensor.temp1", None, _make_state("sensor.temp1", "22.5"))
+            )
+
+        write_state.assert_called_once()
+        assert entity._aggregated_state == 22.5
+
+
+class TestAutoEntityAttributeOnlyChanges:
+    """Test that attribute-only updates are dropped early."""
+
+    @pytest.mark.asyncio
+    async def test_attribute_only_change_ignored(self):
+        """An update with an unchanged state string does nothing."""
+        hass = _make_hass()
+        auto_area = _make_auto_area()
+        entity = _create_auto_entity(hass, auto_area)
+
+        old_state = _make_state("sensor.temp1", "21.5")
+        new_state = _make_state("sensor.temp1", "21.5")
+
+        with patch.object(entity, '_update_entity_state') as update, \
+             patch.object(entity, 'async_write_ha_state') as write_state:
+            entity._handle_state_change(
+                _make_event("sensor.temp1", old_state, new_state)
+            )
+
+        update.assert_not_called()
+        write_state.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_attribute_only_change_ignored_for_last_by_default(self):
+        """The last calculation drops attribute-only updates unless opted in."""
+        from custom_components.auto_areas.calculations import CALCULATE_LAST
+        from custom_components.auto_areas.const import CONFIG_TEMPERATURE_CALCULATION
+
+        hass = _make_hass()
+        auto_area = _make_auto_area()
+        auto_area.config_entry.options = {CONFIG_TEMPERATURE_CALCULATION: CALCULATE_LAST}
+        entity = _create_auto_entity(hass, auto_area)
+
+        old_state = _make_state("sensor.temp1", "21.5")
+        new_state = _make_state("sensor.temp1", "21.5")
+
+        with patch.object(entity, '_update_entity_state') as update:
+            entity._handle_state_change(
+                _make_event("sensor.temp1", old_state, new_state)
+            )
+
+        update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_attribute_only_change_kept_for_last(self):
+        """With the option set, attribute-only updates are processed."""
+        from custom_components.auto_areas.calculations import CALCULATE_LAST
+        from custom_components.auto_areas.const import (
+            CONFIG_TEMPERATURE_CALCULATION,
+            CONFIG_TRACK_ATTRIBUTE_UPDATES,
+        )
+
+        hass = _make_hass()
+        auto_area = _make_auto_area()
+        auto_area.config_entry.options = {
+            CONFIG_TEMPERATURE_CALCULATION: CALCULATE_LAST,
+            CONFIG_TRACK_ATTRIBUTE_UPDATES: True,
+        }
+        entity = _create_auto_entity(hass, auto_area)
+
+        old_state = _make_state("sensor.temp1", "21.5")
+        new_state = _make_state("sensor.temp1", "21.5")
+
+        with patch.object(entity, '_update_entity_state') as update, \
+             patch.object(entity, 'async_write_ha_state'):
+            entity._handle_state_change(
+                _make_event("sensor.temp1", old_state, new_state)
+            )
+
+        update.assert_called_once_with(new_state)
+
+
+class TestAutoEntityRestoredState:
+    """Test that a restored value is kept until members report."""
+
+    def _create_restored(self):
+        hass = _make_hass()
+        hass.loop.time = MagicMock(return_value=100.0)
+        entity = _create_auto_entity(hass, _make_auto_area())
+        entity._aggregated_state = 21.5
+        entity._restored = True
+        return entity
+
+    def test_unavailable_member_keeps_restored_value(self):
+        """An unusable member state does not replace the restored value."""
+        entity = self._create_restored()
+
+        with patch.object(entity, 'async_write_ha_state') as write_state:
+            entity._handle_state_change(
+                _make_event(
+                    "sensor.temp1", None, _make_state("sensor.temp1", STATE_UNAVAILABLE)
+                )
+            )
+
+        write_state.assert_not_called()
+        assert entity._aggregated_state == 21.5
+
+    def test_heartbeat_keeps_restored_value(self):
+        """The heartbeat does not publish before a member reported."""
+        entity = self._create_restored()
+
+        with patch.object(entity, 'async_write_ha_state') as write_state:
+            entity._async_heartbeat(None)
+
+        write_state.assert_not_called()
+        assert entity._aggregated_state == 21.5
+
+    def test_live_value_replaces_restored_value(self):
+        """The first usable member state is published."""
+        entity = self._create_restored()
+
+        with patch.object(entity, 'async_write_ha_state') as write_state:
+            entity._handle_state_change(
+                _make_event("sensor.temp1", None, _make_state("sensor.temp1", "19.0"))
+            )
+
+        write_state.assert_called_once()
+        assert entity._aggregated_state == 19.0
+
+
+class TestAutoEntityPublishIntervals:
+    """Test rate-limited publishing of aggregates."""
+
+    def _create(self, options):
+        hass = _make_hass()
+        hass.loop.time = MagicMock(return_value=100.0)
+        auto_area = _make_auto_area()
+        auto_area.config_entry.options = options
+        entity = _create_auto_entity(hass, auto_area)
+        return hass, entity
+
+    def test_updates_within_min_interval_are_published_trailing(self):
+        """Early updates are held back and the latest value is published later."""
+        from custom_components.auto_areas.const import CONFIG_MIN_PUBLISH_INTERVAL
+
+        hass, entity = self._create({CONFIG_MIN_PUBLISH_INTERVAL: 10})
+
+        with patch.object(entity, 'async_write_ha_state') as write_state, \
+             patch('custom_components.auto_areas.auto_entity.async_call_later') as call_later:
+            entity._update_entity_state(_make_state("sensor.temp1", "20.0"))
+            entity._async_update_aggregate()
+            assert write_state.call_count == 1
+
+            hass.loop.time.return_value = 104.0
+            entity._update_entity_state(_make_state("sensor.temp1", "21.0"))
+            entity._async_update_aggregate()
+            entity._update_entity_state(_make_state("sensor.temp1", "22.0"))
+            entity._async_update_aggregate()
+
+            assert write_state.call_count == 1
+            assert entity._aggregated_state == 20.0
+            call_later.assert_called_once_with(
+                hass, 6.0, entity._async_publish_pending
+            )
+
+            hass.loop.time.return_value = 110.0
+            entity._async_publish_pending(None)
+
+        assert write_state.call_count == 2
+        assert entity._aggregated_state == 22.0
+
+    def test_heartbeat_publishes_after_max_interval(self):
+        """The heartbeat publishes values held back by the deadband."""
+        from custom_components.auto_areas.const import (
+            CONFIG_MAX_PUBLISH_INTERVAL,
+            CONFIG_TEMPERATURE_DEADBAND,
+        )
+
+        hass, entity = self._create(
+            {CONFIG_MAX_PUBLISH_INTERVAL: 60, CONFIG_TEMPERATURE_DEADBAND: 1}
+        )
+
+        with patch.object(entity, 'async_write_ha_state') as write_state:
+            entity._update_entity_state(_make_state("sensor.temp1", "20.0"))
+            entity._async_update_aggregate()
+            entity._update_entity_state(_make_state("sensor.temp1", "20.5"))
+            entity._async_update_aggregate()
+            assert write_state.call_count == 1
+
+            hass.loop.time.return_value = 130.0
+            entity._async_heartbeat(None)
+            assert write_state.call_count == 1
+
+            hass.loop.time.return_value = 160.0
+            entity._async_heartbeat(None)
+
+        assert write_state.call_count == 2
+        assert entity._aggregated_state == 20.5
+
+
+class TestAutoEntityCoalescing:
+    """Test coalescing of member update bursts."""
+
+    def _create(self, options):
+        hass = _make_hass()
+        auto_area = _make_auto_area()
+        auto_area.config_entry.options = options
+        entity = _create_auto_entity(hass, auto_area)
+        return hass, entity
+
+    def test_burst_is_evaluated_once(self):
+        """A burst of member updates results in one evaluation with the final values."""
+        from custom_components.auto_areas.const import CONFIG_COALESCE_UPDATES
+
+        hass, entity = self._create({CONFIG_COALESCE_UPDATES: True})
+
+        with patch.object(entity, 'async_write_ha_state') as write_state:
+            for value in ("20.0", "21.0", "22.0"):
+                entity._handle_state_change(_make_event(
+                    "sensor.temp1", None, _make_state("sensor.temp1", value)
+                ))
+
+            write_state.assert_not_called()
+            hass.loop.call_soon.assert_called_once_with(entity._async_run_evaluation)
+
+            entity._async_run_evaluation()
+
+        write_state.assert_called_once()
+        assert entity._aggregated_state == 22.0
+        assert entity._evaluate_handle is None
+
+    def test_window_in_milliseconds(self):
+        """With a window, the evaluation is scheduled after it."""
+        from custom_components.auto_areas.const import (
+            CONFIG_COALESCE_UPDATES,
+            CONFIG_COALESCE_WINDOW,
+        )
+
+        hass, entity = self._create(
+            {CONFIG_COALESCE_UPDATES: True, CONFIG_COALESCE_WINDOW: 5}
+        )
+
+        with patch.object(entity, 'async_write_ha_state'):
+            entity._handle_state_change(_make_event(
+                "sensor.temp1", None, _make_state("sensor.temp1", "20.0")
+            ))
+
+        hass.loop.call_later.assert_called_once_with(
+            0.005, entity._async_run_evaluation
+        )
+        hass.loop.call_soon.assert_not_called()
+
+    def test_disabled_by_default(self):
+        """Without the option every member update is evaluated right away."""
+        hass, entity = self._create({})
+
+        with patch.object(entity, 'async_write_ha_state') as write_state:
+            entity._handle_state_change(_make_event(
+                "sensor.temp1", None, _make_state("sensor.temp1", "20.0")
+            ))
+
+        write_state.assert_called_once()
+        hass.loop.call_soon.assert_not_called()
+
 
 class TestAutoEntityStateMutation:
     """Test that the state mutation bug is fixed."""
@@ -150,7 +508,7 @@ class TestAutoEntityStateMutation:
         event = _make_event("sensor.temp1", None, new_state)
 
         with patch.object(entity, 'async_write_ha_state'):
-            await entity._handle_state_change(event)
+            entity._handle_state_change(event)
 
         # The original state object should NOT have been mutated to a float
         assert new_state.state == original_state_value
@@ -172,7 +530,7 @@ class TestAutoEntityStateMutation:
         event = _make_event("sensor.temp1", _make_state("sensor.temp1", "21.0"), None)
 
         with patch.object(entity, 'async_write_ha_state'):
-            await entity._handle_state_change(event)
+            entity._handle_state_change(event)
 
         assert "sensor.temp1" in entity.entity_states
         assert entity.entity_float_values["sensor.temp1"] == 21.0
@@ -193,7 +551,7 @@ class TestAutoEntityStateMutation:
         event = _make_event("sensor.temp1", None, bad_state)
 
         with patch.object(entity, 'async_write_ha_state'):
-            await entity._handle_state_change(event)
+            entity._handle_state_change(event)
 
         assert "sensor.temp1" not in entity.entity_states
         assert "sensor.temp1" not in entity.entity_float_values
@@ -228,9 +586,69 @@ class TestAutoEntityAsyncAddedToHass:
             "sensor.temp2": state2,
         }.get(eid))
 
-        with patch.object(entity, 'async_write_ha_state'), \
-             patch('custom_components.auto_areas.auto_entity.async_track_state_change_event'):
+        with patch.object(entity, 'async_write_ha_state'):
             await entity.async_added_to_hass()
 
         assert "sensor.temp1" in entity.entity_states
         assert "sensor.temp2" in entity.entity_states
+        auto_area.state_router.async_subscribe.assert_called_once_with(
+            ["sensor.temp1", "sensor.temp2"], entity._handle_state_change
+        )
+
+
+class TestAutoEntityRebind:
+    """Test in-place rebinding after registry changes."""
+
+    def test_rebind_updates_members(self):
+        """Added entities are loaded and removed entities are dropped."""
+        hass = _make_hass()
+        auto_area = _make_auto_area()
+        entity = _create_auto_entity(hass, auto_area)
+        entity.entity_ids = ["sensor.temp1"]
+        entity.entity_states["sensor.temp1"] = _make_state("sensor.temp1", "20.0")
+        entity.entity_float_values["sensor.temp1"] = 20.0
+
+        state2 = _make_state("sensor.temp2", "22.0")
+        hass.states.get = MagicMock(side_effect=lambda eid: {
+            "sensor.temp2": state2,
+        }.get(eid))
+
+        with patch.object(entity, '_get_sensor_entities', return_value=["sensor.temp2"]), \
+             patch.object(entity, 'async_write_ha_state') as write_state:
+            entity._async_rebind()
+
+        assert entity.entity_ids == ["sensor.temp2"]
+        assert entity.entity_float_values == {"sensor.temp2": 22.0}
+        auto_area.state_router.async_subscribe.assert_called_once_with(
+            ["sensor.temp2"], entity._handle_state_change
+        )
+        write_state.assert_called_once()
+
+    def test_rebind_updates_existing_subscription(self):
+        """A second rebind only updates the entities of the subscription."""
+        hass = _make_hass()
+        auto_area = _make_auto_area()
+        entity = _create_auto_entity(hass, auto_area)
+        subscription = auto_area.state_router.async_subscribe.return_value
+
+        with patch.object(entity, 'async_write_ha_state'):
+            with patch.object(entity, '_get_sensor_entities', return_value=["sensor.temp1"]):
+                entity._async_rebind()
+            with patch.object(entity, '_get_sensor_entities', return_value=["sensor.temp2"]):
+                entity._async_rebind()
+
+        auto_area.state_router.async_subscribe.assert_called_once()
+        subscription.async_set_entity_ids.assert_called_once_with(["sensor.temp2"])
+
+    def test_rebind_without_changes_is_noop(self):
+        """Nothing is resubscribed if the tracked entities did not change."""
+        hass = _make_hass()
+        auto_area = _make_auto_area()
+        entity = _create_auto_entity(hass, auto_area)
+
+        with patch.object(entity, '_get_sensor_entities', return_value=[]), \
+             patch.object(entity, 'async_write_ha_state') as write_state:
+            entity._async_rebind()
+
+        auto_area.state_router.async_subscribe.assert_not_called()
+        write_state.assert_not_called()
@@ -1,8 +1,12 @@
 """Tests for AutoLights behavior."""
 
+import asyncio
+
 import pytest
 from unittest.mock import MagicMock, AsyncMock
 
+from custom_components.auto_areas.const import SIGNAL_ILLUMINANCE, SIGNAL_PRESENCE
+
 
 STATE_ON = "on"
 STATE_OFF = "off"
@@ -32,11 +36,19 @@ def _make_event(entity_id, old_state_value, new_state_value):
 
 def _make_auto_area(area_name="living_room", options=None):
     """Create a mock AutoArea for AutoLights."""
+    from custom_components.auto_areas.light_commands import LightCommandCoalescer
+    from custom_components.auto_areas.signals import AreaSignals
+
     auto_area = MagicMock()
     auto_area.area_name = area_name
     auto_area.config_entry.options = options or {}
     auto_area.hass = MagicMock()
     auto_area.hass.services.async_call = AsyncMock()
+    auto_area.hass.async_create_background_task = MagicMock(
+        side_effect=lambda target, name: asyncio.get_running_loop().create_task(target)
+    )
+    auto_area.light_commands = LightCommandCoalescer(auto_area.hass, window=0)
+    auto_area.signals = AreaSignals(auto_area.hass)
 
     states_map = {}
 
@@ -65,6 +77,15 @@ def _create_auto_lights(auto_area, with_light_group=True):
     return lights
 
 
+def _set_light_group(auto_area, lights, group_state, members):
+    """Register the light group and its members in the mock state map."""
+    group = _make_state(lights.light_group_entity_id, group_state)
+    group.attributes = {"entity_id": list(members)}
+    auto_area._states_map[lights.light_group_entity_id] = group
+    for entity_id, state_value in members.items():
+        auto_area._states_map[entity_id] = _make_state(entity_id, state_value)
+
+
 class TestAutoLightsPresence:
     """Test lights respond to presence changes."""
 
@@ -75,9 +96,7 @@ class TestAutoLightsPresence:
         lights = _create_auto_lights(auto_area)
         lights.sleep_mode_enabled = False
 
-        event = _make_event(lights.presence_entity_id, STATE_OFF, STATE_ON)
-
-        await lights.handle_presence_state_change(event)
+        await lights.handle_presence_change(True)
 
         auto_area.hass.services.async_call.assert_called_once_with(
             "light",
@@ -94,9 +113,7 @@ class TestAutoLightsPresence:
         lights.sleep_mode_enabled = False
         lights.lights_turned_on = True
 
-        event = _make_event(lights.presence_entity_id, STATE_ON, STATE_OFF)
-
-        await lights.handle_presence_state_change(event)
+        await lights.handle_presence_change(False)
 
         auto_area.hass.services.async_call.assert_called_once_with(
             "light",
@@ -115,26 +132,23 @@ class TestAutoLightsPresence:
         lights.sleep_mode_enabled = False
 
         # Set illuminance state above threshold
-        illuminance_state = _make_state(lights.illuminance_entity_id, "200")
-        auto_area._states_map[lights.illuminance_entity_id] = illuminance_state
-
-        event = _make_event(lights.presence_entity_id, STATE_OFF, STATE_ON)
+        auto_area.signals.async_publish(SIGNAL_ILLUMINANCE, 200.0)
 
-        await lights.handle_presence_state_change(event)
+        await lights.handle_presence_change(True)
 
         auto_area.hass.services.async_call.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_no_change_event_ignored(self):
-        """Test no change event ignored."""
+        """Test an unchanged presence value is not delivered again."""
         auto_area = _make_auto_area()
         lights = _create_auto_lights(auto_area)
+        auto_area.signals.async_subscribe(SIGNAL_PRESENCE, lights.handle_presence_change)
 
-        event = _make_event(lights.presence_entity_id, STATE_ON, STATE_ON)
+        auto_area.signals.async_publish(SIGNAL_PRESENCE, True)
+        auto_area.signals.async_publish(SIGNAL_PRESENCE, True)
 
-        await lights.handle_presence_state_change(event)
-
-        auto_area.hass.services.async_call.assert_not_called()
+        auto_area.hass.async_run_hass_job.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_none_new_state_ignored(self):
@@ -142,13 +156,40 @@ class TestAutoLightsPresence:
         auto_area = _make_auto_area()
         lights = _create_auto_lights(auto_area)
 
-        event = _make_event(lights.presence_entity_id, STATE_ON, None)
-
-        await lights.handle_presence_state_change(event)
+        await lights.handle_presence_change(None)
 
         auto_area.hass.services.async_call.assert_not_called()
 
 
+class TestAutoLightsSupersededCommands:
+    """Test commands that were overridden by a later command."""
+
+    @pytest.mark.asyncio
+    async def test_superseded_turn_on_is_not_recorded(self):
+        """A turn_on replaced by a turn_off does not mark the lights as on."""
+        from custom_components.auto_areas.light_commands import LightCommandCoalescer
+
+        auto_area = _make_auto_area()
+        auto_area.light_commands = LightCommandCoalescer(auto_area.hass, window=0.01)
+        lights = _create_auto_lights(auto_area)
+
+        turn_on = asyncio.ensure_future(lights._turn_lights_on())
+        for _ in range(3):
+            await asyncio.sleep(0)
+        # Another caller turns the same lights off within the window
+        await auto_area.light_commands.async_call(
+            "turn_off", lights.light_group_entity_id
+        )
+        await turn_on
+
+        auto_area.hass.services.async_call.assert_called_once_with(
+            "light",
+            "turn_off",
+            {"entity_id": lights.light_group_entity_id},
+        )
+        assert lights.lights_turned_on is None
+
+
 class TestAutoLightsNoLightGroup:
     """Areas without lights have no light group; AutoLights must not drive it.
 
@@ -166,9 +207,7 @@ class TestAutoLightsNoLightGroup:
         lights = _create_auto_lights(auto_area, with_light_group=False)
         lights.sleep_mode_enabled = False
 
-        event = _make_event(lights.presence_entity_id, STATE_OFF, STATE_ON)
-
-        await lights.handle_presence_state_change(event)
+        await lights.handle_presence_change(True)
 
         auto_area.hass.services.async_call.assert_not_called()
 
@@ -180,9 +219,7 @@ class TestAutoLightsNoLightGroup:
         lights.sleep_mode_enabled = False
         lights.lights_turned_on = True
 
-        event = _make_event(lights.presence_entity_id, STATE_ON, STATE_OFF)
-
-        await lights.handle_presence_state_change(event)
+        await lights.handle_presence_change(False)
 
         auto_area.hass.services.async_call.assert_not_called()
 
@@ -200,9 +237,7 @@ class TestAutoLightsNoLightGroup:
             lights.light_group_entity_id, "unavailable"
         )
 
-        event = _make_event(lights.presence_entity_id, STATE_OFF, STATE_ON)
-
-        await lights.handle_presence_state_change(event)
+        await lights.handle_presence_change(True)
 
         auto_area.hass.services.async_call.assert_not_called()
 
@@ -217,9 +252,7 @@ class TestAutoLightsNoLightGroup:
             lights.light_group_entity_id, "unknown"
         )
 
-        event = _make_event(lights.presence_entity_id, STATE_ON, STATE_OFF)
-
-        await lights.handle_presence_state_change(event)
+        await lights.handle_presence_change(False)
 
         auto_area.hass.services.async_call.assert_not_called()
 
@@ -238,24 +271,19 @@ class TestAutoLightsManualOverride:
         lights.lights_turned_on = True
 
         # Set presence on
-        auto_area._states_map[lights.presence_entity_id] = _make_state(
-            lights.presence_entity_id, STATE_ON
-        )
+        auto_area.signals.async_publish(SIGNAL_PRESENCE, True)
 
         # Simulate manual light off (light group changes from on to off while presence is on)
         light_off_event = _make_event(lights.light_group_entity_id, STATE_ON, STATE_OFF)
-        await lights.handle_light_group_state_change(light_off_event)
+        lights.handle_light_group_state_change(light_off_event)
 
         assert lights.manually_turned_off is True
 
         # Set illuminance below threshold
-        auto_area._states_map[lights.illuminance_entity_id] = _make_state(
-            lights.illuminance_entity_id, "50"
-        )
+        auto_area.signals.async_publish(SIGNAL_ILLUMINANCE, 50.0)
 
         # Illuminance change arrives — should NOT turn lights on
-        illuminance_event = _make_event(lights.illuminance_entity_id, "200", "50")
-        await lights.handle_illuminance_change(illuminance_event)
+        await lights.handle_illuminance_change(50.0)
 
         auto_area.hass.services.async_call.assert_not_called()
 
@@ -270,27 +298,21 @@ class TestAutoLightsManualOverride:
         lights.lights_turned_on = True
 
         # Set presence on and simulate manual off
-        auto_area._states_map[lights.presence_entity_id] = _make_state(
-            lights.presence_entity_id, STATE_ON
-        )
+        auto_area.signals.async_publish(SIGNAL_PRESENCE, True)
         light_off_event = _make_event(lights.light_group_entity_id, STATE_ON, STATE_OFF)
-        await lights.handle_light_group_state_change(light_off_event)
+        lights.handle_light_group_state_change(light_off_event)
         assert lights.manually_turned_off is True
 
         # Presence clears — should reset manual override
-        presence_off_event = _make_event(lights.presence_entity_id, STATE_ON, STATE_OFF)
-        await lights.handle_presence_state_change(presence_off_event)
+        await lights.handle_presence_change(False)
         assert lights.manually_turned_off is False
 
         # Reset mock for next assertion
         auto_area.hass.services.async_call.reset_mock()
 
         # Presence returns — lights should turn on normally
-        auto_area._states_map[lights.illuminance_entity_id] = _make_state(
-            lights.illuminance_entity_id, "50"
-        )
-        presence_on_event = _make_event(lights.presence_entity_id, STATE_OFF, STATE_ON)
-        await lights.handle_presence_state_change(presence_on_event)
+        auto_area.signals.async_publish(SIGNAL_ILLUMINANCE, 50.0)
+        await lights.handle_presence_change(True)
 
         auto_area.hass.services.async_call.assert_called_once_with(
             "light",
@@ -310,15 +332,10 @@ class TestAutoLightsManualOverride:
         lights.manually_turned_off = False
 
         # Presence on, illuminance below threshold
-        auto_area._states_map[lights.presence_entity_id] = _make_state(
-            lights.presence_entity_id, STATE_ON
-        )
-        auto_area._states_map[lights.illuminance_entity_id] = _make_state(
-            lights.illuminance_entity_id, "50"
-        )
+        auto_area.signals.async_publish(SIGNAL_PRESENCE, True)
+        auto_area.signals.async_publish(SIGNAL_ILLUMINANCE, 50.0)
 
-        illuminance_event = _make_event(lights.illuminance_entity_id, "200", "50")
-        await lights.handle_illuminance_change(illuminance_event)
+        await lights.handle_illuminance_change(50.0)
 
         auto_area.hass.services.async_call.assert_called_once_with(
             "light",
@@ -334,9 +351,7 @@ class TestAutoLightsManualOverride:
         lights.sleep_mode_enabled = False
         lights.lights_turned_on = True
 
-        auto_area._states_map[lights.presence_entity_id] = _make_state(
-            lights.presence_entity_id, STATE_ON
-        )
+        auto_area.signals.async_publish(SIGNAL_PRESENCE, True)
 
         # Simulate auto_areas turning off lights (via _turn_lights_off)
         await lights._turn_lights_off()
@@ -351,7 +366,7 @@ class TestAutoLightsManualOverride:
         lights.manually_turned_off = True
 
         light_on_event = _make_event(lights.light_group_entity_id, STATE_OFF, STATE_ON)
-        await lights.handle_light_group_state_change(light_on_event)
+        lights.handle_light_group_state_change(light_on_event)
 
         assert lights.manually_turned_off is False
 
@@ -369,11 +384,8 @@ class TestIlluminanceManualOverride:
         lights.sleep_mode_enabled = False
 
         # Presence on, illuminance below threshold → auto_areas turns lights on
-        auto_area._states_map[lights.illuminance_entity_id] = _make_state(
-            lights.illuminance_entity_id, "50"
-        )
-        presence_event = _make_event(lights.presence_entity_id, STATE_OFF, STATE_ON)
-        await lights.handle_presence_state_change(presence_event)
+        auto_area.signals.async_publish(SIGNAL_ILLUMINANCE, 50.0)
+        await lights.handle_presence_change(True)
 
         auto_area.hass.services.async_call.assert_called_once_with(
             "light", "turn_on", {"entity_id": lights.light_group_entity_id}
@@ -382,19 +394,14 @@ class TestIlluminanceManualOverride:
         auto_area.hass.services.async_call.reset_mock()
 
         # User manually turns lights off
-        auto_area._states_map[lights.presence_entity_id] = _make_state(
-            lights.presence_entity_id, STATE_ON
-        )
+        auto_area.signals.async_publish(SIGNAL_PRESENCE, True)
         light_off_event = _make_event(lights.light_group_entity_id, STATE_ON, STATE_OFF)
-        await lights.handle_light_group_state_change(light_off_event)
+        lights.handle_light_group_state_change(light_off_event)
         assert lights.manually_turned_off is True
 
         # Another illuminance drop event → lights should NOT turn on
-        auto_area._states_map[lights.illuminance_entity_id] = _make_state(
-            lights.illuminance_entity_id, "30"
-        )
-        illuminance_event = _make_event(lights.illuminance_entity_id, "50", "30")
-        await lights.handle_illuminance_change(illuminance_event)
+        auto_area.signals.async_publish(SIGNAL_ILLUMINANCE, 30.0)
+        await lights.handle_illuminance_change(30.0)
 
         auto_area.hass.services.async_call.assert_not_called()
 
@@ -409,25 +416,19 @@ class TestIlluminanceManualOverride:
 
         # Set up manual override state
         lights.lights_turned_on = True
-        auto_area._states_map[lights.presence_entity_id] = _make_state(
-            lights.presence_entity_id, STATE_ON
-        )
+        auto_area.signals.async_publish(SIGNAL_PRESENCE, True)
         light_off_event = _make_event(lights.light_group_entity_id, STATE_ON, STATE_OFF)
-        await lights.handle_light_group_state_change(light_off_event)
+        lights.handle_light_group_state_change(light_off_event)
         assert lights.manually_turned_off is True
 
         # Presence clears
-        presence_off_event = _make_event(lights.presence_entity_id, STATE_ON, STATE_OFF)
-        await lights.handle_presence_state_change(presence_off_event)
+        await lights.handle_presence_change(False)
         assert lights.manually_turned_off is False
         auto_area.hass.services.async_call.reset_mock()
 
         # Presence returns with illuminance below threshold → lights should turn on
-        auto_area._states_map[lights.illuminance_entity_id] = _make_state(
-            lights.illuminance_entity_id, "50"
-        )
-        presence_on_event = _make_event(lights.presence_entity_id, STATE_OFF, STATE_ON)
-        await lights.handle_presence_state_change(presence_on_event)
+        auto_area.signals.async_publish(SIGNAL_ILLUMINANCE, 50.0)
+        await lights.handle_presence_change(True)
 
         auto_area.hass.services.async_call.assert_called_once_with(
             "light", "turn_on", {"entity_id": lights.light_group_entity_id}
@@ -444,24 +445,19 @@ class TestIlluminanceManualOverride:
 
         # Set up manual override state
         lights.lights_turned_on = True
-        auto_area._states_map[lights.presence_entity_id] = _make_state(
-            lights.presence_entity_id, STATE_ON
-        )
+        auto_area.signals.async_publish(SIGNAL_PRESENCE, True)
         light_off_event = _make_event(lights.light_group_entity_id, STATE_ON, STATE_OFF)
-        await lights.handle_light_group_state_change(light_off_event)
+        lights.handle_light_group_state_change(light_off_event)
         assert lights.manually_turned_off is True
 
         # Lights turned back on (by user or scene)
         light_on_event = _make_event(lights.light_group_entity_id, STATE_OFF, STATE_ON)
-        await lights.handle_light_group_state_change(light_on_event)
+        lights.handle_light_group_state_change(light_on_event)
         assert lights.manually_turned_off is False
 
         # Another illuminance drop → lights should turn on
-        auto_area._states_map[lights.illuminance_entity_id] = _make_state(
-            lights.illuminance_entity_id, "50"
-        )
-        illuminance_event = _make_event(lights.illuminance_entity_id, "200", "50")
-        await lights.handle_illuminance_change(illuminance_event)
+        auto_area.signals.async_publish(SIGNAL_ILLUMINANCE, 50.0)
+        await lights.handle_illuminance_change(50.0)
 
         auto_area.hass.services.async_call.assert_called_with(
             "light", "turn_on", {"entity_id": lights.light_group_entity_id}
@@ -478,26 +474,163 @@ class TestIlluminanceManualOverride:
         lights.lights_turned_on = False  # auto_areas did NOT turn lights on
 
         # Presence on
-        auto_area._states_map[lights.presence_entity_id] = _make_state(
-            lights.presence_entity_id, STATE_ON
-        )
+        auto_area.signals.async_publish(SIGNAL_PRESENCE, True)
 
         # User turns lights off manually (but lights_turned_on is False, so no override)
         light_off_event = _make_event(lights.light_group_entity_id, STATE_ON, STATE_OFF)
-        await lights.handle_light_group_state_change(light_off_event)
+        lights.handle_light_group_state_change(light_off_event)
         assert lights.manually_turned_off is False  # not set because lights_turned_on was False
 
         # Illuminance drops → lights should turn on
-        auto_area._states_map[lights.illuminance_entity_id] = _make_state(
-            lights.illuminance_entity_id, "50"
+        auto_area.signals.async_publish(SIGNAL_ILLUMINANCE, 50.0)
+        await lights.handle_illuminance_change(50.0)
+
+        auto_area.hass.services.async_call.assert_called_once_with(
+            "light", "turn_on", {"entity_id": lights.light_group_entity_id}
+        )
+
+
+class TestAutoLightsReconcile:
+    """Test that startup reconciliation only commands differing lights."""
+
+    @pytest.mark.asyncio
+    async def test_no_commands_when_lights_already_off(self):
+        """No presence and all lights off sends nothing."""
+        auto_area = _make_auto_area()
+        lights = _create_auto_lights(auto_area)
+        _set_light_group(
+            auto_area, lights, STATE_OFF, {"light.a": STATE_OFF, "light.b": STATE_OFF}
+        )
+
+        await lights.reconcile_lights(False)
+
+        auto_area.hass.services.async_call.assert_not_called()
+        assert lights.lights_turned_on is False
+
+    @pytest.mark.asyncio
+    async def test_no_commands_when_lights_already_on(self):
+        """Presence with all lights on sends nothing."""
+        auto_area = _make_auto_area()
+        lights = _create_auto_lights(auto_area)
+        _set_light_group(
+            auto_area, lights, STATE_ON, {"light.a": STATE_ON, "light.b": STATE_ON}
+        )
+
+        await lights.reconcile_lights(True)
+
+        auto_area.hass.services.async_call.assert_not_called()
+        assert lights.lights_turned_on is True
+
+    @pytest.mark.asyncio
+    async def test_group_commanded_when_all_lights_differ(self):
+        """Presence with all lights off turns on the group."""
+        auto_area = _make_auto_area()
+        lights = _create_auto_lights(auto_area)
+        _set_light_group(
+            auto_area, lights, STATE_OFF, {"light.a": STATE_OFF, "light.b": STATE_OFF}
+        )
+
+        await lights.reconcile_lights(True)
+
+        auto_area.hass.services.async_call.assert_called_once_with(
+            "light", "turn_on", {"entity_id": lights.light_group_entity_id}
+        )
+
+    @pytest.mark.asyncio
+    async def test_only_differing_members_commanded(self):
+        """A mixed group only gets commands for the members that differ."""
+        auto_area = _make_auto_area()
+        lights = _create_auto_lights(auto_area)
+        _set_light_group(
+            auto_area,
+            lights,
+            STATE_ON,
+            {"light.a": STATE_ON, "light.b": STATE_OFF, "light.c": "unavailable"},
+        )
+
+        await lights.reconcile_lights(False)
+
+        auto_area.hass.services.async_call.assert_called_once_with(
+            "light", "turn_off", {"entity_id": "light.a"}
+        )
+        assert lights.lights_turned_on is False
+
+
+class TestAutoLightsDifferential:
+    """Test that differential commands skip lights already in the target state."""
+
+    OPTIONS = {"differential_light_commands": True}
+
+    @pytest.mark.asyncio
+    async def test_group_commanded_by_default(self):
+        """Without the option the whole group is commanded."""
+        auto_area = _make_auto_area()
+        lights = _create_auto_lights(auto_area)
+        _set_light_group(
+            auto_area,
+            lights,
+            STATE_ON,
+            {"light.a": STATE_ON, "light.b": STATE_ON, "light.c": STATE_OFF},
         )
-        illuminance_event = _make_event(lights.illuminance_entity_id, "200", "50")
-        await lights.handle_illuminance_change(illuminance_event)
+
+        await lights._turn_lights_on()
 
         auto_area.hass.services.async_call.assert_called_once_with(
             "light", "turn_on", {"entity_id": lights.light_group_entity_id}
         )
 
+    @pytest.mark.asyncio
+    async def test_only_differing_members_turned_on(self):
+        """Lights that are already on are not commanded."""
+        auto_area = _make_auto_area(options=self.OPTIONS)
+        lights = _create_auto_lights(auto_area)
+        _set_light_group(
+            auto_area,
+            lights,
+            STATE_ON,
+            {"light.a": STATE_ON, "light.b": STATE_ON, "light.c": STATE_OFF},
+        )
+
+        await lights._turn_lights_on()
+
+        auto_area.hass.services.async_call.assert_called_once_with(
+            "light", "turn_on", {"entity_id": "light.c"}
+        )
+        assert lights.lights_turned_on is True
+
+    @pytest.mark.asyncio
+    async def test_group_commanded_when_most_members_differ(self):
+        """The group is commanded if at least half of its members differ."""
+        auto_area = _make_auto_area(options=self.OPTIONS)
+        lights = _create_auto_lights(auto_area)
+        _set_light_group(
+            auto_area,
+            lights,
+            STATE_ON,
+            {"light.a": STATE_ON, "light.b": STATE_ON, "light.c": STATE_OFF},
+        )
+
+        await lights._turn_lights_off()
+
+        auto_area.hass.services.async_call.assert_called_once_with(
+            "light", "turn_off", {"entity_id": lights.light_group_entity_id}
+        )
+        assert lights.lights_turned_on is False
+
+    @pytest.mark.asyncio
+    async def test_nothing_sent_when_lights_match(self):
+        """No command is sent if all lights are already off."""
+        auto_area = _make_auto_area(options=self.OPTIONS)
+        lights = _create_auto_lights(auto_area)
+        _set_light_group(
+            auto_area, lights, STATE_OFF, {"light.a": STATE_OFF, "light.b": STATE_OFF}
+        )
+
+        await lights.handle_presence_change(False)
+
+        auto_area.hass.services.async_call.assert_not_called()
+        assert lights.lights_turned_on is False
+
 
 class TestAutoLightsCleanup:
     """Test cleanup unsubscribes all listeners."""
@@ -1,5 +1,6 @@
 """Tests for calculation functions."""
 
+import pytest
 from unittest.mock import MagicMock
 from datetime import datetime, timezone
 
@@ -319,3 +320,154 @@ class TestGetCalculation:
             SensorDeviceClass.TEMPERATURE,
         )
         assert fn is calculate_min
+
+
+class TestAggregators:
+    """Test incremental aggregators against the list calculations."""
+
+    def test_matches_calculations(self):
+        """Aggregators produce the same results after updates and removals."""
+        from statistics import mean, median
+        from custom_components.auto_areas.calculations import (
+            MaxAggregator, MeanAggregator, MedianAggregator, MinAggregator,
+        )
+
+        now = datetime.now(tz=timezone.utc)
+        expected = {
+            MaxAggregator: max,
+            MinAggregator: min,
+            MeanAggregator: mean,
+            MedianAggregator: median,
+        }
+        for aggregator_class, calculate in expected.items():
+            aggregator = aggregator_class()
+            values = {}
+            for entity_id, value in [
+                ("a", 20.0), ("b", 22.5), ("c", 19.0), ("a", 25.0), ("d", 22.5)
+            ]:
+                aggregator.update(entity_id, value, now)
+                values[entity_id] = value
+                assert aggregator.value == calculate(values.values())
+
+            for entity_id in ["b", "x", "a", "c"]:
+                aggregator.remove(entity_id)
+                values.pop(entity_id, None)
+                assert aggregator.value == calculate(values.values())
+
+            aggregator.remove("d")
+            assert aggregator.value == STATE_UNKNOWN
+
+    def test_last(self):
+        """The value of the most recently updated entity is used."""
+        from custom_components.auto_areas.calculations import LastAggregator
+
+        t1 = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        t2 = datetime(2024, 1, 1, 12, 0, 1, tzinfo=timezone.utc)
+        t3 = datetime(2024, 1, 1, 12, 0, 2, tzinfo=timezone.utc)
+
+        aggregator = LastAggregator()
+        assert aggregator.value == STATE_UNKNOWN
+        aggregator.update("a", 100.0, t2)
+        aggregator.update("b", 50.0, t1)
+        assert aggregator.value == 100.0
+        aggregator.update("b", 60.0, t3)
+        assert aggregator.value == 60.0
+        aggregator.remove("b")
+        assert aggregator.value == 100.0
+        aggregator.remove("a")
+        assert aggregator.value == STATE_UNKNOWN
+
+    def test_incomplete_aggregator_cannot_be_created(self):
+        """Aggregators must implement update, remove and value."""
+        from custom_components.auto_areas.calculations import SortedAggregator
+
+        with pytest.raises(TypeError):
+            SortedAggregator()
+
+    def test_get_aggregator(self):
+        """The configured calculation selects the aggregator."""
+        from custom_components.auto_areas.calculations import (
+            LastAggregator, MinAggregator, get_aggregator,
+        )
+        from custom_components.auto_areas.const import CONFIG_TEMPERATURE_CALCULATION
+        from homeassistant.components.sensor.const import SensorDeviceClass
+
+        assert isinstance(
+            get_aggregator({}, SensorDeviceClass.ILLUMINANCE), LastAggregator
+        )
+        assert isinstance(
+            get_aggregator(
+                {CONFIG_TEMPERATURE_CALCULATION: "min"},
+                SensorDeviceClass.TEMPERATURE,
+            ),
+            MinAggregator,
+        )
+        assert get_aggregator({}, SensorDeviceClass.PRESSURE) is None
+
+
+class TestDeadband:
+    """Test deadband configuration and change detection."""
+
+    def test_get_deadband(self):
+        """Illuminance deadbands are relative, the others absolute."""
+        from homeassistant.components.sensor.const import SensorDeviceClass
+        from custom_components.auto_areas.calculations import get_deadband
+        from custom_components.auto_areas.const import (
+            CONFIG_ILLUMINANCE_DEADBAND,
+            CONFIG_TEMPERATURE_DEADBAND,
+        )
+
+        options = {CONFIG_ILLUMINANCE_DEADBAND: 10, CONFIG_TEMPERATURE_DEADBAND: 0.2}
+        assert get_deadband(options, SensorDeviceClass.ILLUMINANCE) == (10.0, True)
+        assert get_deadband(options, SensorDeviceClass.TEMPERATURE) == (0.2, False)
+        assert get_deadband(options, SensorDeviceClass.HUMIDITY) == (0.0, False)
+
+    def test_get_deadband_mode(self):
+        """The deadband mode can be changed per sensor type."""
+        from homeassistant.components.sensor.const import SensorDeviceClass
+        from custom_components.auto_areas.calculations import (
+            DEADBAND_ABSOLUTE,
+            DEADBAND_RELATIVE,
+            get_deadband,
+        )
+        from custom_components.auto_areas.const import (
+            CONFIG_ILLUMINANCE_DEADBAND,
+            CONFIG_ILLUMINANCE_DEADBAND_MODE,
+            CONFIG_TEMPERATURE_DEADBAND,
+            CONFIG_TEMPERATURE_DEADBAND_MODE,
+        )
+
+        options = {
+            CONFIG_ILLUMINANCE_DEADBAND: 20,
+            CONFIG_ILLUMINANCE_DEADBAND_MODE: DEADBAND_ABSOLUTE,
+            CONFIG_TEMPERATURE_DEADBAND: 2,
+            CONFIG_TEMPERATURE_DEADBAND_MODE: DEADBAND_RELATIVE,
+        }
+        assert get_deadband(options, SensorDeviceClass.ILLUMINANCE) == (20.0, False)
+        assert get_deadband(options, SensorDeviceClass.TEMPERATURE) == (2.0, True)
+
+    def test_any_change_is_significant_without_deadband(self):
+        """Without a deadband every change counts."""
+        from custom_components.auto_areas.calculations import is_significant_change
+
+        assert is_significant_change(21.0, 21.01)
+        assert not is_significant_change(21.0, 21.0)
+        assert is_significant_change(None, 21.0)
+        assert is_significant_change(21.0, None)
+        assert not is_significant_change(None, None)
+
+    def test_absolute_deadband(self):
+        """Absolute deadbands compare the difference directly."""
+        from custom_components.auto_areas.calculations import is_significant_change
+
+        assert not is_significant_change(21.0, 21.3, 0.5)
+        assert not is_significant_change(21.0, 20.5, 0.5)
+        assert is_significant_change(21.0, 21.6, 0.5)
+
+    def test_relative_deadband(self):
+        """Relative deadbands are a percentage of the last value."""
+        from custom_components.auto_areas.calculations import is_significant_change
+
+        assert not is_significant_change(200.0, 215.0, 10, relative=True)
+        assert is_significant_change(200.0, 230.0, 10, relative=True)
+        assert is_significant_change(0.0, 1.0, 10, relative=True)
@@ -1,9 +1,10 @@
-"""Tests for cover group entity filtering."""
+"""Tests for cover group entity filtering and commands."""
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
-from custom_components.auto_areas.ha_helpers import get_all_entities
+from custom_components.auto_areas.auto_area import AutoArea
+from custom_components.auto_areas.const import BUCKET_COVER
 
 
 def _make_entity(entity_id, domain, device_class=None, area_id=None, device_id=None):
@@ -11,6 +12,7 @@ def _make_entity(entity_id, domain, device_class=None, area_id=None, device_id=N
     entity = MagicMock()
     entity.entity_id = entity_id
     entity.domain = domain
+    entity.platform = "test"
     entity.device_class = device_class
     entity.original_device_class = device_class
     entity.area_id = area_id
@@ -19,16 +21,23 @@ def _make_entity(entity_id, domain, device_class=None, area_id=None, device_id=N
     return entity
 
 
-def _make_registries(entities, area_id="test_area"):
-    """Create mock entity and device registries."""
-    entity_registry = MagicMock()
-    entity_registry.entities = {e.entity_id: e for e in entities}
-    device_registry = MagicMock()
-    # All entities are assigned to area directly
-    for e in entities:
-        if e.area_id is None:
-            e.area_id = area_id
-    return entity_registry, device_registry
+def _make_auto_area(entities, area_id="test_area"):
+    """Create an AutoArea whose area index holds the given entities."""
+    auto_area = AutoArea.__new__(AutoArea)
+    auto_area.area_id = area_id
+    auto_area.area = None
+    auto_area.config_entry = MagicMock()
+    auto_area.config_entry.options = {}
+    auto_area._buckets = None
+    auto_area.area_index = MagicMock()
+    auto_area.area_index.async_get_entities = MagicMock(
+        side_effect=lambda index_area_id, domains: [
+            e
+            for e in entities
+            if (e.area_id or area_id) == index_area_id and e.domain in domains
+        ]
+    )
+    return auto_area
 
 
 @pytest.mark.asyncio
@@ -56,16 +65,11 @@ async def test_cover_group_excludes_binary_sensor_with_door_device_class():
         ),
         _make_entity("cover.kitchen_shutter", "cover", "shutter", area_id=area_id),
     ]
-    entity_registry, device_registry = _make_registries(entities, area_id)
+    auto_area = _make_auto_area(entities, area_id)
 
-    result = get_all_entities(entity_registry, device_registry, area_id, domains=["cover"])
+    result = auto_area.get_entity_ids(BUCKET_COVER)
 
-    result_ids = [e.entity_id for e in result]
-    assert "cover.kitchen_blinds" in result_ids
-    assert "cover.kitchen_shutter" in result_ids
-    assert "binary_sensor.washing_machine_door" not in result_ids
-    assert "binary_sensor.window_contact" not in result_ids
-    assert len(result) == 2
+    assert result == ["cover.kitchen_blinds", "cover.kitchen_shutter"]
 
 
 @pytest.mark.asyncio
@@ -77,8 +81,71 @@ async def test_cover_group_empty_when_no_covers():
             "binary_sensor.dryer_door", "binary_sensor", "door", area_id=area_id
         ),
     ]
-    entity_registry, device_registry = _make_registries(entities, area_id)
+    auto_area = _make_auto_area(entities, area_id)
 
-    result = get_all_entities(entity_registry, device_registry, area_id, domains=["cover"])
+    assert auto_area.get_entity_ids(BUCKET_COVER) == []
 
-    assert result == []
+
+def _create_cover_group(options):
+    """Create a cover group with mocked dependencies."""
+    from custom_components.auto_areas.cover import AutoCoverGroup
+
+    hass = MagicMock()
+    hass.services.async_call = AsyncMock()
+    auto_area = MagicMock()
+    auto_area.area_name = "Living Room"
+    auto_area.config_entry.entry_id = "test_entry"
+    auto_area.config_entry.options = options
+    auto_area.cover_commands.async_call = AsyncMock()
+    group = AutoCoverGroup(hass, auto_area, entity_ids=["cover.a", "cover.b"])
+    group._covers["open_close"] = {"cover.a", "cover.b"}
+    return group
+
+
+@pytest.mark.asyncio
+async def test_cover_group_commands_all_covers_at_once_by_default():
+    """Without limits the group sends a single service call."""
+    group = _create_cover_group({})
+
+    await group.async_close_cover()
+
+    group.hass.services.async_call.assert_called_once()
+    group.auto_area.cover_commands.async_call.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cover_group_commands_are_scheduled_when_limited():
+    """With a concurrency limit each cover is commanded through the scheduler."""
+    group = _create_cover_group({"cover_concurrency": 2, "cover_stagger": 500})
+
+    await group.async_close_cover()
+
+    group.hass.services.async_call.assert_not_called()
+    calls = group.auto_area.cover_commands.async_call.call_args_list
+    assert [call.args for call in calls] == [
+        ("test_entry", "close_cover", "cover.a", None),
+        ("test_entry", "close_cover", "cover.b", None),
+    ]
+    assert calls[0].kwargs["concurrency"] == 2
+    assert calls[0].kwargs["stagger"] == 0.5
+
+
+def test_cover_group_rebind_updates_members():
+    """Rebinding updates the members and the group state once."""
+    from homeassistant.components.cover import CoverEntityFeature
+    from homeassistant.const import ATTR_SUPPORTED_FEATURES
+
+    group = _create_cover_group({})
+    state = MagicMock()
+    state.attributes = {
+        ATTR_SUPPORTED_FEATURES: CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE
+    }
+    group.hass.states.get = MagicMock(return_value=state)
+    group.auto_area.get_cover_entity_ids = MagicMock(return_value=["cover.a", "cover.c"])
+    group.async_update_group_state = MagicMock()
+    group.async_write_ha_state = MagicMock()
+
+    group._async_rebind()
+
+    assert group._covers["open_close"] == {"cover.a", "cover.c"}
+    group.async_update_group_state.assert_called_once()
@@ -0,0 +1,171 @@
+"""Tests for the cover command scheduler."""
+
+import asyncio
+
+import pytest
+from unittest.mock import MagicMock
+
+
+def _create_scheduler(max_concurrent=4):
+    """Create a scheduler whose service calls block until released."""
+    from custom_components.auto_areas.cover_commands import CoverCommandScheduler
+
+    hass = MagicMock()
+    hass.loop = asyncio.get_running_loop()
+    hass.async_create_background_task = MagicMock(
+        side_effect=lambda target, name: hass.loop.create_task(target)
+    )
+    hass.sent = []
+    hass.release = asyncio.Event()
+
+    async def _async_call(domain, service, data, blocking, context):
+        hass.sent.append((service, data["entity_id"]))
+        await hass.release.wait()
+
+    hass.services.async_call = _async_call
+    return CoverCommandScheduler(hass, max_concurrent=max_concurrent)
+
+
+async def _settle():
+    """Let queued tasks run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestCoverCommandScheduler:
+    """Test concurrency limits, staggering and deduplication."""
+
+    @pytest.mark.asyncio
+    async def test_area_concurrency(self):
+        """An area never has more than its limit of commands in flight."""
+        scheduler = _create_scheduler()
+
+        calls = asyncio.gather(
+            *(
+                scheduler.async_call(
+                    "kitchen", "open_cover", f"cover.{i}", concurrency=2
+                )
+                for i in range(5)
+            )
+        )
+        await _settle()
+        assert scheduler.hass.sent == [
+            ("open_cover", "cover.0"),
+            ("open_cover", "cover.1"),
+        ]
+
+        scheduler.hass.release.set()
+        await calls
+        assert len(scheduler.hass.sent) == 5
+
+    @pytest.mark.asyncio
+    async def test_global_cap_and_fairness(self):
+        """Areas take turns within the overall limit."""
+        scheduler = _create_scheduler(max_concurrent=1)
+
+        calls = asyncio.gather(
+            scheduler.async_call("hall", "close_cover", "cover.hall"),
+            *(
+                scheduler.async_call(
+                    area, "close_cover", f"cover.{area}_{i}", concurrency=4
+                )
+                for area in ("kitchen", "office")
+                for i in range(2)
+            ),
+        )
+        await _settle()
+        assert scheduler.hass.sent == [("close_cover", "cover.hall")]
+
+        scheduler.hass.release.set()
+        await calls
+        assert scheduler.hass.sent == [
+            ("close_cover", "cover.hall"),
+            ("close_cover", "cover.kitchen_0"),
+            ("close_cover", "cover.office_0"),
+            ("close_cover", "cover.kitchen_1"),
+            ("close_cover", "cover.office_1"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_queued_command_is_superseded(self):
+        """Only the last queued command for a cover is sent."""
+        scheduler = _create_scheduler()
+
+        calls = asyncio.gather(
+            scheduler.async_call("kitchen", "open_cover", "cover.a", concurrency=1),
+            scheduler.async_call("kitchen", "open_cover", "cover.b", concurrency=1),
+            scheduler.async_call("kitchen", "close_cover", "cover.b", concurrency=1),
+        )
+        scheduler.hass.release.set()
+        await calls
+
+        assert scheduler.hass.sent == [
+            ("open_cover", "cover.a"),
+            ("close_cover", "cover.b"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_one_command_in_flight_per_cover(self):
+        """A new command for a cover waits until the previous one is done."""
+        scheduler = _create_scheduler()
+
+        first = asyncio.ensure_future(
+            scheduler.async_call("kitchen", "open_cover", "cover.a")
+        )
+        await _settle()
+        second = asyncio.ensure_future(
+            scheduler.async_call("kitchen", "stop_cover", "cover.a")
+        )
+        await _settle()
+        assert scheduler.hass.sent == [("open_cover", "cover.a")]
+
+        scheduler.hass.release.set()
+        await asyncio.gather(first, second)
+        assert scheduler.hass.sent == [
+            ("open_cover", "cover.a"),
+            ("stop_cover", "cover.a"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stagger(self):
+        """Commands of an area start at least the stagger delay apart."""
+        scheduler = _create_scheduler()
+        scheduler.hass.release.set()
+        loop = asyncio.get_running_loop()
+        started = []
+
+        async def _async_call(domain, service, data, blocking, context):
+            started.append(loop.time())
+
+        scheduler.hass.services.async_call = _async_call
+        await asyncio.gather(
+            *(
+                scheduler.async_call(
+                    "kitchen", "open_cover", f"cover.{i}", stagger=0.02
+                )
+                for i in range(3)
+            )
+        )
+
+        assert len(started) == 3
+        assert started[1] - started[0] >= 0.015
+        assert started[2] - started[1] >= 0.015
+
+    @pytest.mark.asyncio
+    async def test_failed_command_is_raised(self):
+        """A failing command is raised to its caller only."""
+        scheduler = _create_scheduler()
+
+        async def _async_call(domain, service, data, blocking, context):
+            if data["entity_id"] == "cover.a":
+                raise ValueError
+
+        scheduler.hass.services.async_call = _async_call
+        results = await asyncio.gather(
+            scheduler.async_call("kitchen", "open_cover", "cover.a"),
+            scheduler.async_call("kitchen", "open_cover", "cover.b"),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[0], ValueError)
+        assert results[1] is None
@@ -1,11 +1,9 @@
 """Tests for ha_helpers utility functions."""
 
+import pytest
 from unittest.mock import MagicMock
 
 
-STATE_UNAVAILABLE = "unavailable"
-
-
 def _make_entity(entity_id, domain, area_id=None, device_id=None, disabled=False):
     """Create a mock RegistryEntry."""
     entity = MagicMock()
@@ -17,13 +15,6 @@ def _make_entity(entity_id, domain, area_id=None, device_id=None, disabled=False
     return entity
 
 
-def _make_entity_registry(entities):
-    """Create a mock EntityRegistry from a list of entities."""
-    registry = MagicMock()
-    registry.entities = {e.entity_id: e for e in entities}
-    return registry
-
-
 def _make_device_registry(devices=None):
     """Create a mock DeviceRegistry."""
     registry = MagicMock()
@@ -39,102 +30,44 @@ def _make_device(area_id=None):
     return device
 
 
-def _make_hass(states_map=None):
-    """Create a mock HomeAssistant."""
-    hass = MagicMock()
-    states_map = states_map or {}
-
-    def get_state(entity_id):
-        if entity_id in states_map:
-            state = MagicMock()
-            state.entity_id = entity_id
-            state.state = states_map[entity_id]
-            return state
-        return None
-
-    hass.states.get = MagicMock(side_effect=get_state)
-    return hass
-
+class TestGetAreaId:
+    """Test get_area_id."""
 
-class TestGetAllEntities:
-    """Test get_all_entities."""
+    def test_entity_area_id(self):
+        """The area of the entity takes precedence."""
+        from custom_components.auto_areas.ha_helpers import get_area_id
 
-    def test_domain_filter(self):
-        """Test domain filter."""
-        from custom_components.auto_areas.ha_helpers import get_all_entities
-
-        entities = [
-            _make_entity("sensor.temp", "sensor", area_id="living_room"),
-            _make_entity("light.lamp", "light", area_id="living_room"),
-            _make_entity("sensor.humidity", "sensor", area_id="living_room"),
-        ]
-        er = _make_entity_registry(entities)
-        dr = _make_device_registry()
-
-        result = get_all_entities(er, dr, "living_room", domains=["sensor"])
-        entity_ids = [e.entity_id for e in result]
-        assert "sensor.temp" in entity_ids
-        assert "sensor.humidity" in entity_ids
-        assert "light.lamp" not in entity_ids
-
-    def test_no_domain_filter_returns_none(self):
-        """Without domains filter, no entities match (domains=None means domain not in None → skip)."""
-        from custom_components.auto_areas.ha_helpers import get_all_entities
-
-        entities = [
-            _make_entity("sensor.temp", "sensor", area_id="living_room"),
-        ]
-        er = _make_entity_registry(entities)
-        dr = _make_device_registry()
-
-        # domains=None means the condition `entity.domain not in domains` raises TypeError
-        # Actually looking at the code: `if domains is None or entity.domain not in domains`
-        # When domains is None, the `or` short-circuits to True, so it skips (continues).
-        result = get_all_entities(er, dr, "living_room", domains=None)
-        assert result == []
-
-    def test_filters_by_entity_area_id(self):
-        """Test filters by entity area id."""
-        from custom_components.auto_areas.ha_helpers import get_all_entities
-
-        entities = [
-            _make_entity("sensor.temp", "sensor", area_id="living_room"),
-            _make_entity("sensor.temp2", "sensor", area_id="bedroom"),
-        ]
-        er = _make_entity_registry(entities)
-        dr = _make_device_registry()
+        device = _make_device(area_id="kitchen")
+        entity = _make_entity(
+            "sensor.temp", "sensor", area_id="living_room", device_id="dev1"
+        )
+        dr = _make_device_registry({"dev1": device})
 
-        result = get_all_entities(er, dr, "living_room", domains=["sensor"])
-        assert len(result) == 1
-        assert result[0].entity_id == "sensor.temp"
+        assert get_area_id(entity, dr) == "living_room"
 
     def test_falls_back_to_device_area_id(self):
         """Test falls back to device area id."""
-        from custom_components.auto_areas.ha_helpers import get_all_entities
+        from custom_components.auto_areas.ha_helpers import get_area_id
 
         device = _make_device(area_id="living_room")
-        entities = [
-            _make_entity("sensor.temp", "sensor", area_id=None, device_id="dev1"),
-        ]
-        er = _make_entity_registry(entities)
+        entity = _make_entity("sensor.temp", "sensor", device_id="dev1")
         dr = _make_device_registry({"dev1": device})
 
-        result = get_all_entities(er, dr, "living_room", domains=["sensor"])
-        assert len(result) == 1
-        assert result[0].entity_id == "sensor.temp"
+        assert get_area_id(entity, dr) == "living_room"
 
-    def test_excludes_entities_from_other_areas(self):
-        """Test excludes entities from other areas."""
-        from custom_components.auto_areas.ha_helpers import get_all_entities
+    def test_no_area(self):
+        """Entities without area and without known device have no area."""
+        from custom_components.auto_areas.ha_helpers import get_area_id
 
-        entities = [
-            _make_entity("sensor.temp", "sensor", area_id="kitchen"),
-        ]
-        er = _make_entity_registry(entities)
         dr = _make_device_registry()
 
-        result = get_all_entities(er, dr, "living_room", domains=["sensor"])
-        assert result == []
+        assert get_area_id(_make_entity("sensor.temp", "sensor"), dr) is None
+        assert (
+            get_area_id(
+                _make_entity("sensor.temp", "sensor", device_id="unknown"), dr
+            )
+            is None
+        )
 
 
 class TestIsValidEntity:
@@ -144,30 +77,88 @@ class TestIsValidEntity:
         """Test disabled entity."""
         from custom_components.auto_areas.ha_helpers import is_valid_entity
 
-        hass = _make_hass()
         entity = _make_entity("sensor.temp", "sensor", disabled=True)
-        assert is_valid_entity(hass, entity) is False
+        assert is_valid_entity(entity) is False
 
     def test_unavailable_entity(self):
-        """Test unavailable entity."""
+        """Unavailable entities are tracked, availability is checked at runtime."""
         from custom_components.auto_areas.ha_helpers import is_valid_entity
 
-        hass = _make_hass({"sensor.temp": STATE_UNAVAILABLE})
         entity = _make_entity("sensor.temp", "sensor", disabled=False)
-        assert is_valid_entity(hass, entity) is False
+        assert is_valid_entity(entity) is True
 
     def test_valid_entity(self):
         """Test valid entity."""
         from custom_components.auto_areas.ha_helpers import is_valid_entity
 
-        hass = _make_hass({"sensor.temp": "21.5"})
         entity = _make_entity("sensor.temp", "sensor", disabled=False)
-        assert is_valid_entity(hass, entity) is True
+        assert is_valid_entity(entity) is True
 
     def test_entity_with_no_state(self):
         """Entity with no state object (not yet loaded) should be valid."""
         from custom_components.auto_areas.ha_helpers import is_valid_entity
 
-        hass = _make_hass()  # states.get returns None
         entity = _make_entity("sensor.temp", "sensor", disabled=False)
-        assert is_valid_entity(hass, entity) is True
+        assert is_valid_entity(entity) is True
+
+
+class TestIsAttributeOnlyChange:
+    """Test is_attribute_only_change."""
+
+    def _event(self, old_state_value, new_state_value):
+        event = MagicMock()
+        event.data = {
+            "entity_id": "sensor.temp",
+            "old_state": MagicMock(state=old_state_value) if old_state_value else None,
+            "new_state": MagicMock(state=new_state_value) if new_state_value else None,
+        }
+        return event
+
+    def test_attribute_only_change(self):
+        """Same state string means only attributes changed."""
+        from custom_components.auto_areas.ha_helpers import is_attribute_only_change
+
+        assert is_attribute_only_change(self._event("21.5", "21.5")) is True
+
+    def test_state_change(self):
+        """A different state string is a real change."""
+        from custom_components.auto_areas.ha_helpers import is_attribute_only_change
+
+        assert is_attribute_only_change(self._event("21.5", "22.0")) is False
+
+    def test_added_or_removed_entity(self):
+        """Added and removed entities are never attribute-only changes."""
+        from custom_components.auto_areas.ha_helpers import is_attribute_only_change
+
+        assert is_attribute_only_change(self._event(None, "21.5")) is False
+        assert is_attribute_only_change(self._event("21.5", None)) is False
+
+
+class TestAsyncWaitForStates:
+    """Test async_wait_for_states."""
+
+    @pytest.mark.asyncio
+    async def test_returns_when_all_states_present(self, hass):
+        """Return immediately if all entities already have a state."""
+        from custom_components.auto_areas.ha_helpers import async_wait_for_states
+
+        hass.states.async_set("sensor.temp", "21.5")
+        assert await async_wait_for_states(hass, ["sensor.temp"], 10) == set()
+
+    @pytest.mark.asyncio
+    async def test_waits_for_missing_states(self, hass):
+        """Return as soon as the missing entities report a state."""
+        from custom_components.auto_areas.ha_helpers import async_wait_for_states
+
+        hass.loop.call_soon(hass.states.async_set, "sensor.temp", "21.5")
+        assert await async_wait_for_states(hass, ["sensor.temp"], 10) == set()
+
+    @pytest.mark.asyncio
+    async def test_timeout_returns_missing(self, hass):
+        """Return the entities still missing after the timeout."""
+        from custom_components.auto_areas.ha_helpers import async_wait_for_states
+
+        hass.states.async_set("sensor.temp", "21.5")
+        assert await async_wait_for_states(
+            hass, ["sensor.temp", "sensor.humidity"], 0.01
+        ) == {"sensor.humidity"}
@@ -7,7 +7,14 @@ from homeassistant.helpers import area_registry as ar
 
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.auto_areas.const import DOMAIN
+from custom_components.auto_areas.const import (
+    BUCKET_COVER,
+    BUCKET_LIGHT,
+    BUCKET_OPEN,
+    BUCKET_PRESENCE,
+    BUCKET_SAFETY,
+    DOMAIN,
+)
 
 
 @pytest.mark.asyncio
@@ -169,3 +176,29 @@ async def test_config_entry_unloads_cleanly(
     assert (
         config_entry.entry_id not in hass.data.get(DOMAIN, {})
     ), "Entry should be removed from domain data"
+
+
+@pytest.mark.asyncio
+async def test_area_entities_are_classified_once(
+    hass: HomeAssistant,
+    test_area: ar.AreaEntry,
+    cover_entity: str,
+    light_entity: str,
+    binary_sensor_door: str,
+    motion_sensor: str,
+    config_entry: MockConfigEntry,
+):
+    """Test that all platforms read their members from the shared buckets."""
+    await hass.async_block_till_done()
+    auto_area = hass.data[DOMAIN][config_entry.entry_id]
+
+    assert auto_area.get_entity_ids(BUCKET_COVER) == [cover_entity]
+    assert auto_area.get_entity_ids(BUCKET_LIGHT) == [light_entity]
+    assert auto_area.get_entity_ids(BUCKET_OPEN) == [binary_sensor_door]
+    assert auto_area.get_entity_ids(BUCKET_PRESENCE) == [motion_sensor]
+    assert auto_area.get_entity_ids(BUCKET_SAFETY) == []
+
+    # Our own aggregates live in the area too, but are never members
+    presence = hass.states.get("binary_sensor.area_presence_test_room")
+    assert presence is not None
+    assert presence.entity_id not in auto_area.get_entity_ids(BUCKET_PRESENCE)
@@ -0,0 +1,129 @@
+"""Tests for the light groups."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.const import STATE_OFF, STATE_ON, STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import area_registry as ar
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.auto_areas.const import (
+    CONFIG_AREA,
+    CONFIG_FAST_LIGHT_GROUP,
+    DOMAIN,
+)
+
+LIGHT_GROUP = "light.area_lights_test_room"
+
+
+def _make_state(entity_id, state_value):
+    """Create a mock HA State object."""
+    state = MagicMock()
+    state.entity_id = entity_id
+    state.state = state_value
+    return state
+
+
+def _make_event(entity_id, new_state_value):
+    """Create a mock state change event."""
+    event = MagicMock()
+    event.data = {
+        "entity_id": entity_id,
+        "old_state": None,
+        "new_state": _make_state(entity_id, new_state_value),
+    }
+    return event
+
+
+def _create_fast_group(entity_ids):
+    """Create a fast light group with mocked dependencies."""
+    from custom_components.auto_areas.light import AutoFastLightGroup
+
+    hass = MagicMock()
+    hass.services.async_call = AsyncMock()
+    auto_area = MagicMock()
+    auto_area.area_name = "Test Room"
+    auto_area.config_entry.entry_id = "test_entry"
+    return AutoFastLightGroup(hass, auto_area, entity_ids=entity_ids)
+
+
+@pytest.mark.asyncio
+async def test_fast_light_group_follows_members(
+    hass: HomeAssistant, test_area: ar.AreaEntry, light_entity: str
+):
+    """The fast group is on while any member is on."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONFIG_AREA: test_area.id},
+        options={CONFIG_FAST_LIGHT_GROUP: True},
+        title="Test Room",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    state = hass.states.get(LIGHT_GROUP)
+    assert state.state == STATE_ON
+    assert state.attributes["entity_id"] == [light_entity]
+
+    hass.states.async_set(light_entity, STATE_OFF)
+    await hass.async_block_till_done()
+    assert hass.states.get(LIGHT_GROUP).state == STATE_OFF
+
+    hass.states.async_set(light_entity, STATE_UNAVAILABLE)
+    await hass.async_block_till_done()
+    assert hass.states.get(LIGHT_GROUP).state == STATE_UNAVAILABLE
+
+
+class TestAutoFastLightGroup:
+    """Test the incremental updates of the fast light group."""
+
+    def test_state_only_written_on_change(self):
+        """Member changes that do not change the group are not written."""
+        group = _create_fast_group(["light.one", "light.two"])
+
+        with patch.object(group, 'async_write_ha_state') as write_state, \
+             patch.object(group, 'async_set_context'):
+            group._async_member_changed(_make_event("light.one", STATE_ON))
+            group._async_member_changed(_make_event("light.two", STATE_ON))
+            group._async_member_changed(_make_event("light.one", STATE_OFF))
+            assert group.is_on is True
+            group._async_member_changed(_make_event("light.two", STATE_OFF))
+
+        assert group.is_on is False
+        # Turned on, then off
+        assert write_state.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_turn_on_and_off_are_forwarded(self):
+        """Turning the group on or off calls the members."""
+        group = _create_fast_group(["light.one", "light.two"])
+
+        await group.async_turn_on()
+        await group.async_turn_off()
+
+        calls = group.hass.services.async_call.call_args_list
+        assert [call.args for call in calls] == [
+            ("light", "turn_on", {"entity_id": ["light.one", "light.two"]}),
+            ("light", "turn_off", {"entity_id": ["light.one", "light.two"]}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_service_data_is_forwarded(self):
+        """Transition and flash are passed on to the members."""
+        group = _create_fast_group(["light.one"])
+
+        await group.async_turn_on(transition=2, flash="short")
+        await group.async_turn_off(transition=5)
+
+        calls = group.hass.services.async_call.call_args_list
+        assert [call.args for call in calls] == [
+            (
+                "light",
+                "turn_on",
+                {"entity_id": ["light.one"], "transition": 2, "flash": "short"},
+            ),
+            ("light", "turn_off", {"entity_id": ["light.one"], "transition": 5}),
+        ]
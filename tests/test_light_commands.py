@@ -0,0 +1,117 @@
+"""Tests for the light command coalescer."""
+
+import asyncio
+
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+
+
+def _make_hass():
+    """Create a mock HomeAssistant instance."""
+    hass = MagicMock()
+    hass.services.async_call = AsyncMock()
+    hass.async_create_background_task = MagicMock(
+        side_effect=lambda target, name: asyncio.get_running_loop().create_task(target)
+    )
+    return hass
+
+
+def _create_coalescer(hass, window=0.01):
+    """Create a LightCommandCoalescer."""
+    from custom_components.auto_areas.light_commands import LightCommandCoalescer
+    return LightCommandCoalescer(hass, window=window)
+
+
+class TestLightCommandCoalescer:
+    """Test batching of light commands."""
+
+    @pytest.mark.asyncio
+    async def test_single_command(self):
+        """A single command is sent with a single entity id."""
+        hass = _make_hass()
+        coalescer = _create_coalescer(hass)
+
+        sent = await coalescer.async_call("turn_on", "light.area_lights_kitchen")
+
+        assert sent == "turn_on"
+        hass.services.async_call.assert_called_once_with(
+            "light", "turn_on", {"entity_id": "light.area_lights_kitchen"}
+        )
+
+    @pytest.mark.asyncio
+    async def test_commands_are_batched_per_service(self):
+        """Concurrent commands result in one call per service."""
+        hass = _make_hass()
+        coalescer = _create_coalescer(hass)
+
+        await asyncio.gather(
+            coalescer.async_call("turn_on", "light.area_lights_kitchen"),
+            coalescer.async_call("turn_off", "light.area_lights_bedroom"),
+            coalescer.async_call("turn_on", "light.area_lights_hall"),
+        )
+
+        assert hass.services.async_call.call_count == 2
+        hass.services.async_call.assert_any_call(
+            "light",
+            "turn_on",
+            {"entity_id": ["light.area_lights_kitchen", "light.area_lights_hall"]},
+        )
+        hass.services.async_call.assert_any_call(
+            "light", "turn_off", {"entity_id": "light.area_lights_bedroom"}
+        )
+
+    @pytest.mark.asyncio
+    async def test_last_command_wins(self):
+        """Only the last command for an entity within the window is sent."""
+        hass = _make_hass()
+        coalescer = _create_coalescer(hass)
+
+        await asyncio.gather(
+            coalescer.async_call("turn_on", "light.area_lights_kitchen"),
+            coalescer.async_call("turn_off", "light.area_lights_kitchen"),
+        )
+
+        hass.services.async_call.assert_called_once_with(
+            "light", "turn_off", {"entity_id": "light.area_lights_kitchen"}
+        )
+
+    @pytest.mark.asyncio
+    async def test_superseded_caller_is_told(self):
+        """Competing commands for an entity return the command actually sent."""
+        hass = _make_hass()
+        coalescer = _create_coalescer(hass)
+
+        sent = await asyncio.gather(
+            coalescer.async_call("turn_on", "light.area_lights_kitchen"),
+            coalescer.async_call("turn_off", "light.area_lights_kitchen"),
+        )
+
+        assert sent == ["turn_off", "turn_off"]
+
+    @pytest.mark.asyncio
+    async def test_new_window_after_flush(self):
+        """Commands after a flush start a new batch."""
+        hass = _make_hass()
+        coalescer = _create_coalescer(hass)
+
+        await coalescer.async_call("turn_on", "light.area_lights_kitchen")
+        await coalescer.async_call("turn_off", "light.area_lights_kitchen")
+
+        assert hass.services.async_call.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_shutdown_drops_pending_commands(self):
+        """Commands still waiting for the window are not sent after shutdown."""
+        hass = _make_hass()
+        coalescer = _create_coalescer(hass)
+
+        call = asyncio.ensure_future(
+            coalescer.async_call("turn_on", "light.area_lights_kitchen")
+        )
+        await asyncio.sleep(0)
+        coalescer.async_shutdown()
+
+        with pytest.raises(asyncio.CancelledError):
+            await call
+        await asyncio.sleep(0.02)
+        hass.services.async_call.assert_not_called()
@@ -0,0 +1,100 @@
+"""Tests for area metrics."""
+
+import pytest
+
+
+class _Handler:
+    """Object with instrumented methods."""
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+        self.calls = 0
+
+    def _sync(self):
+        self.calls += 1
+        return "sync"
+
+    async def _async(self):
+        self.calls += 1
+        return "async"
+
+
+def _make_handler(enabled):
+    """Create a handler with instrumented methods."""
+    from custom_components.auto_areas.metrics import AreaMetrics, instrumented
+
+    class Handler(_Handler):
+        sync = instrumented(_Handler._sync)
+        run = instrumented(_Handler._async)
+
+    return Handler(AreaMetrics(enabled))
+
+
+class TestAreaMetrics:
+    """Test metric collection."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_records_nothing(self):
+        """Disabled metrics still call through but record nothing."""
+        handler = _make_handler(enabled=False)
+
+        assert handler.sync() == "sync"
+        assert await handler.run() == "async"
+        handler.metrics.count("light.turn_on")
+
+        assert handler.calls == 2
+        assert handler.metrics.as_dict() == {
+            "enabled": False,
+            "handlers": {},
+            "counters": {},
+        }
+
+    @pytest.mark.asyncio
+    async def test_enabled_records_calls(self):
+        """Calls and counters are recorded when enabled."""
+        handler = _make_handler(enabled=True)
+
+        handler.sync()
+        await handler.run()
+        await handler.run()
+        handler.metrics.count("light.turn_on")
+
+        metrics = handler.metrics.as_dict()
+        assert metrics["handlers"]["_Handler._sync"]["calls"] == 1
+        assert metrics["handlers"]["_Handler._async"]["calls"] == 2
+        assert metrics["handlers"]["_Handler._async"]["p99_ms"] >= 0
+        assert metrics["counters"] == {"light.turn_on": 1}
+
+    def test_entities_are_recorded_separately(self):
+        """Entities sharing a handler get their own metrics."""
+        from custom_components.auto_areas.metrics import AreaMetrics
+
+        metrics = AreaMetrics(enabled=True)
+        safety = _make_handler(enabled=True)
+        safety.metrics = metrics
+        safety.entity_id = "binary_sensor.kitchen_safety"
+        opened = _make_handler(enabled=True)
+        opened.metrics = metrics
+        opened.entity_id = "binary_sensor.kitchen_open"
+
+        safety.sync()
+        opened.sync()
+        opened.sync()
+
+        handlers = metrics.as_dict()["handlers"]
+        assert handlers["_Handler._sync (binary_sensor.kitchen_safety)"]["calls"] == 1
+        assert handlers["_Handler._sync (binary_sensor.kitchen_open)"]["calls"] == 2
+        assert "_Handler._sync" not in handlers
+
+    def test_p99(self):
+        """The p99 latency is taken from the recent samples."""
+        from custom_components.auto_areas.metrics import HandlerMetrics
+
+        handler = HandlerMetrics()
+        for number in range(100):
+            handler.add(number / 1000)
+
+        metrics = handler.as_dict()
+        assert metrics["calls"] == 100
+        assert metrics["p99_ms"] == pytest.approx(99)
+        assert metrics["max_ms"] == pytest.approx(99)
@@ -44,7 +44,7 @@ def _make_auto_area(area_name="kitchen", entry_id="test_entry"):
         "identifiers": {("auto_areas", entry_id)},
         "name": "Auto Areas",
     }
-    auto_area.get_valid_entities.return_value = []
+    auto_area.get_entity_ids.return_value = []
     return auto_area
 
 
@@ -73,6 +73,8 @@ def _create_open_sensor(hass, auto_area, entity_ids):
         return_value=entity_ids,
     ):
         sensor = OpenBinarySensor(hass=hass, auto_area=auto_area)
+    # Read the initial active entities like async_added_to_hass does
+    sensor._active = sensor._get_active()
     return sensor
 
 
@@ -85,17 +87,17 @@ class TestOpenNoSensors:
         hass = _make_hass()
 
         sensor = _create_open_sensor(hass, auto_area, [])
-        sensor.any_open = False
+        sensor.any_on = False
 
         assert sensor.state == STATE_OFF
 
-    def test_no_sensors_initial_any_open_false(self):
-        """With no sensors, _any_sensor_on returns False."""
+    def test_no_sensors_initial_any_on_false(self):
+        """With no sensors, _get_active returns no entities, so False."""
         auto_area = _make_auto_area()
         hass = _make_hass()
 
         sensor = _create_open_sensor(hass, auto_area, [])
-        assert sensor._any_sensor_on() is False
+        assert bool(sensor._get_active()) is False
 
 
 class TestOpenSingleSensor:
@@ -111,7 +113,7 @@ class TestOpenSingleSensor:
         sensor = _create_open_sensor(
             hass, auto_area, ["binary_sensor.door_kitchen"],
         )
-        assert sensor._any_sensor_on() is True
+        assert bool(sensor._get_active()) is True
 
     def test_single_door_sensor_off(self):
         """Single door sensor OFF (closed) should set aggregate to off."""
@@ -123,7 +125,7 @@ class TestOpenSingleSensor:
         sensor = _create_open_sensor(
             hass, auto_area, ["binary_sensor.door_kitchen"],
         )
-        assert sensor._any_sensor_on() is False
+        assert bool(sensor._get_active()) is False
 
 
 class TestOpenOrLogic:
@@ -142,14 +144,14 @@ class TestOpenOrLogic:
             hass, auto_area,
             ["binary_sensor.door_kitchen", "binary_sensor.window_kitchen"],
         )
-        sensor.any_open = False
+        sensor.any_on = False
 
         event = _make_event("binary_sensor.door_kitchen", STATE_OFF, STATE_ON)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
-        assert sensor.any_open is True
+        assert sensor.any_on is True
 
     @pytest.mark.asyncio
     async def test_all_sensors_off_aggregate_off(self):
@@ -167,14 +169,14 @@ class TestOpenOrLogic:
         })
 
         sensor = _create_open_sensor(hass, auto_area, entity_ids)
-        sensor.any_open = True
+        sensor.any_on = True
 
         event = _make_event("binary_sensor.door_kitchen", STATE_ON, STATE_OFF)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
-        assert sensor.any_open is False
+        assert sensor.any_on is False
 
     @pytest.mark.asyncio
     async def test_stays_on_when_one_still_on(self):
@@ -191,14 +193,14 @@ class TestOpenOrLogic:
         })
 
         sensor = _create_open_sensor(hass, auto_area, entity_ids)
-        sensor.any_open = True
+        sensor.any_on = True
 
         event = _make_event("binary_sensor.door_kitchen", STATE_ON, STATE_OFF)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
-        assert sensor.any_open is True
+        assert sensor.any_on is True
 
 
 class TestOpenUnavailable:
@@ -219,14 +221,14 @@ class TestOpenUnavailable:
         })
 
         sensor = _create_open_sensor(hass, auto_area, entity_ids)
-        sensor.any_open = True
+        sensor.any_on = True
 
         event = _make_event("binary_sensor.door_kitchen", STATE_ON, STATE_UNAVAILABLE)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
-        assert sensor.any_open is False
+        assert sensor.any_on is False
 
     @pytest.mark.asyncio
     async def test_all_sensors_unavailable(self):
@@ -242,14 +244,14 @@ class TestOpenUnavailable:
         })
 
         sensor = _create_open_sensor(hass, auto_area, entity_ids)
-        sensor.any_open = True
+        sensor.any_on = True
 
         event = _make_event("binary_sensor.window_kitchen", STATE_ON, STATE_UNAVAILABLE)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
-        assert sensor.any_open is False
+        assert sensor.any_on is False
 
     @pytest.mark.asyncio
     async def test_sensor_becomes_unknown(self):
@@ -265,15 +267,15 @@ class TestOpenUnavailable:
         })
 
         sensor = _create_open_sensor(hass, auto_area, entity_ids)
-        sensor.any_open = True
+        sensor.any_on = True
 
         event = _make_event("binary_sensor.door_kitchen", STATE_ON, STATE_UNKNOWN)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
         # window_kitchen is still ON, so open stays
-        assert sensor.any_open is True
+        assert sensor.any_on is True
 
 
 class TestOpenMixedDeviceClasses:
@@ -296,7 +298,7 @@ class TestOpenMixedDeviceClasses:
                 "binary_sensor.opening_kitchen",
             ],
         )
-        assert sensor._any_sensor_on() is True
+        assert bool(sensor._get_active()) is True
 
     def test_mixed_classes_all_off(self):
         """Mixed device classes — all OFF means closed."""
@@ -315,7 +317,7 @@ class TestOpenMixedDeviceClasses:
                 "binary_sensor.opening_kitchen",
             ],
         )
-        assert sensor._any_sensor_on() is False
+        assert bool(sensor._get_active()) is False
 
 
 class TestOpenStateChanges:
@@ -330,14 +332,14 @@ class TestOpenStateChanges:
         sensor = _create_open_sensor(
             hass, auto_area, ["binary_sensor.door_kitchen"],
         )
-        sensor.any_open = False
+        sensor.any_on = False
 
         event = _make_event("binary_sensor.door_kitchen", STATE_OFF, STATE_ON)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
-        assert sensor.any_open is True
+        assert sensor.any_on is True
 
     @pytest.mark.asyncio
     async def test_on_to_off_transition(self):
@@ -350,14 +352,14 @@ class TestOpenStateChanges:
         sensor = _create_open_sensor(
             hass, auto_area, ["binary_sensor.door_kitchen"],
         )
-        sensor.any_open = True
+        sensor.any_on = True
 
         event = _make_event("binary_sensor.door_kitchen", STATE_ON, STATE_OFF)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
-        assert sensor.any_open is False
+        assert sensor.any_on is False
 
 
 class TestOpenEntityProperties:
@@ -393,14 +395,14 @@ class TestOpenEdgeCases:
         sensor = _create_open_sensor(
             hass, auto_area, ["binary_sensor.door_kitchen"],
         )
-        sensor.any_open = False
+        sensor.any_on = False
 
         event = _make_event("binary_sensor.door_kitchen", STATE_OFF, STATE_OFF)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
-        assert sensor.any_open is False
+        assert sensor.any_on is False
 
     @pytest.mark.asyncio
     async def test_none_new_state_handled_gracefully(self):
@@ -411,9 +413,36 @@ class TestOpenEdgeCases:
         sensor = _create_open_sensor(
             hass, auto_area, ["binary_sensor.door_kitchen"],
         )
-        sensor.any_open = True
+        sensor.any_on = True
 
         event = _make_event("binary_sensor.door_kitchen", STATE_ON, None)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
+
+
+class TestOpenCount:
+    """Test the number of open entities."""
+
+    @pytest.mark.asyncio
+    async def test_open_count_attribute(self):
+        """The open_count attribute follows the open entities."""
+        auto_area = _make_auto_area()
+        hass = _make_hass({
+            "binary_sensor.window_1": STATE_ON,
+            "binary_sensor.window_2": STATE_ON,
+        })
+
+        sensor = _create_open_sensor(
+            hass, auto_area,
+            ["binary_sensor.window_1", "binary_sensor.window_2"],
+        )
+        sensor.any_on = True
+        assert sensor.extra_state_attributes == {"open_count": 2}
+
+        event = _make_event("binary_sensor.window_1", STATE_ON, STATE_OFF)
+        with patch.object(sensor, 'async_write_ha_state'):
+            sensor._handle_state_change(event)
+
+        assert sensor.extra_state_attributes == {"open_count": 1}
+        assert sensor.any_on is True
@@ -43,7 +43,7 @@ def _make_auto_area(area_name="living_room", entry_id="test_entry"):
         "identifiers": {("auto_areas", entry_id)},
         "name": "Auto Areas",
     }
-    auto_area.get_valid_entities.return_value = []
+    auto_area.get_entity_ids.return_value = []
     return auto_area
 
 
@@ -66,12 +66,16 @@ def _create_presence_sensor(hass, auto_area, entity_ids):
     from custom_components.auto_areas.binary_sensors.presence import (
         PresenceBinarySensor,
     )
+    from custom_components.auto_areas.const import PRESENCE_ON_STATES
+    from custom_components.auto_areas.ha_helpers import get_active_entity_ids
 
     with patch.object(
         PresenceBinarySensor, '_get_sensor_entities',
         return_value=entity_ids,
     ):
         sensor = PresenceBinarySensor(hass=hass, auto_area=auto_area)
+    # Read the initial active entities like async_added_to_hass does
+    sensor._active = get_active_entity_ids(hass, entity_ids, PRESENCE_ON_STATES)
     return sensor
 
 
@@ -93,7 +97,7 @@ class TestPresenceDetection:
         event = _make_event("binary_sensor.motion1", STATE_OFF, STATE_ON)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
         assert sensor.presence is True
 
@@ -112,7 +116,7 @@ class TestPresenceDetection:
         event = _make_event("binary_sensor.motion1", STATE_OFF, STATE_HOME)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
         assert sensor.presence is True
 
@@ -142,7 +146,7 @@ class TestPresenceClears:
         event = _make_event("binary_sensor.motion1", STATE_ON, STATE_OFF)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
         assert sensor.presence is False
 
@@ -168,11 +172,58 @@ class TestPresenceClears:
         event = _make_event("binary_sensor.motion1", STATE_ON, STATE_OFF)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
         assert sensor.presence is True
 
 
+class TestPresenceRestored:
+    """Test that a restored presence is kept until a presence sensor reports."""
+
+    def test_lock_does_not_clear_restored_presence(self):
+        """The presence lock writing its first state keeps restored presence."""
+        auto_area = _make_auto_area()
+        entity_ids = [
+            "switch.area_presence_lock_living_room",
+            "binary_sensor.motion1",
+        ]
+        hass = _make_hass({
+            "switch.area_presence_lock_living_room": STATE_OFF,
+        })
+
+        sensor = _create_presence_sensor(hass, auto_area, entity_ids)
+        sensor.presence = True
+        sensor._restored = True
+
+        event = _make_event("switch.area_presence_lock_living_room", None, STATE_OFF)
+        with patch.object(sensor, 'async_write_ha_state'):
+            sensor._handle_state_change(event)
+
+        assert sensor.presence is True
+
+    def test_presence_sensor_clears_restored_presence(self):
+        """A presence sensor reporting off replaces the restored presence."""
+        auto_area = _make_auto_area()
+        entity_ids = [
+            "switch.area_presence_lock_living_room",
+            "binary_sensor.motion1",
+        ]
+        hass = _make_hass({
+            "switch.area_presence_lock_living_room": STATE_OFF,
+            "binary_sensor.motion1": STATE_OFF,
+        })
+
+        sensor = _create_presence_sensor(hass, auto_area, entity_ids)
+        sensor.presence = True
+        sensor._restored = True
+
+        event = _make_event("binary_sensor.motion1", None, STATE_OFF)
+        with patch.object(sensor, 'async_write_ha_state'):
+            sensor._handle_state_change(event)
+
+        assert sensor.presence is False
+
+
 class TestPresenceInitialState:
     """Test initial presence state."""
 
@@ -188,12 +239,12 @@ class TestPresenceInitialState:
         sensor = _create_presence_sensor(hass, auto_area, entity_ids)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            from custom_components.auto_areas.ha_helpers import all_states_are_off
+            from custom_components.auto_areas.ha_helpers import get_active_entity_ids
             from custom_components.auto_areas.const import PRESENCE_ON_STATES
 
-            sensor.presence = not all_states_are_off(
+            sensor.presence = bool(get_active_entity_ids(
                 hass, sensor.entity_ids, PRESENCE_ON_STATES,
-            )
+            ))
             assert sensor.presence is False
 
     def test_initial_presence_true_when_one_on(self):
@@ -208,12 +259,12 @@ class TestPresenceInitialState:
         sensor = _create_presence_sensor(hass, auto_area, entity_ids)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            from custom_components.auto_areas.ha_helpers import all_states_are_off
+            from custom_components.auto_areas.ha_helpers import get_active_entity_ids
             from custom_components.auto_areas.const import PRESENCE_ON_STATES
 
-            sensor.presence = not all_states_are_off(
+            sensor.presence = bool(get_active_entity_ids(
                 hass, sensor.entity_ids, PRESENCE_ON_STATES,
-            )
+            ))
             assert sensor.presence is True
 
 
@@ -234,7 +285,7 @@ class TestPresenceEdgeCases:
         event = _make_event("binary_sensor.motion1", STATE_OFF, STATE_OFF)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
         assert sensor.presence is False
 
@@ -252,4 +303,109 @@ class TestPresenceEdgeCases:
         event = _make_event("binary_sensor.motion1", STATE_ON, None)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
+
+
+class TestPresenceActiveMembers:
+    """Test the tracked set of active presence entities."""
+
+    @pytest.mark.asyncio
+    async def test_active_members_follow_events(self):
+        """Presence clears only after the last active entity goes off."""
+        auto_area = _make_auto_area()
+        hass = _make_hass()
+
+        sensor = _create_presence_sensor(
+            hass, auto_area,
+            ["binary_sensor.motion1", "binary_sensor.motion2"],
+        )
+        sensor.presence = False
+
+        with patch.object(sensor, 'async_write_ha_state'):
+            sensor._handle_state_change(
+                _make_event("binary_sensor.motion1", STATE_OFF, STATE_ON)
+            )
+            sensor._handle_state_change(
+                _make_event("binary_sensor.motion2", STATE_OFF, STATE_ON)
+            )
+            sensor._handle_state_change(
+                _make_event("binary_sensor.motion1", STATE_ON, STATE_OFF)
+            )
+            assert sensor.presence is True
+
+            sensor._handle_state_change(
+                _make_event("binary_sensor.motion2", STATE_ON, STATE_OFF)
+            )
+
+        assert sensor.presence is False
+        assert sensor._active == set()
+
+    def test_reconcile_corrects_drift(self):
+        """A missed event is corrected from the state machine."""
+        auto_area = _make_auto_area()
+        states = {"binary_sensor.motion1": STATE_OFF}
+        hass = _make_hass(states)
+
+        sensor = _create_presence_sensor(
+            hass, auto_area, ["binary_sensor.motion1"],
+        )
+        sensor.presence = False
+
+        states["binary_sensor.motion1"] = STATE_ON
+        with patch.object(sensor, 'async_write_ha_state') as mock_write:
+            sensor._async_reconcile()
+
+        assert sensor.presence is True
+        assert sensor._active == {"binary_sensor.motion1"}
+        mock_write.assert_called_once()
+
+
+class TestPresenceCoalescing:
+    """Test presence with coalesced member updates."""
+
+    def _create(self, states):
+        from custom_components.auto_areas.const import CONFIG_COALESCE_UPDATES
+
+        auto_area = _make_auto_area()
+        auto_area.config_entry.options = {CONFIG_COALESCE_UPDATES: True}
+        hass = _make_hass(states)
+        sensor = _create_presence_sensor(
+            hass, auto_area, ["binary_sensor.motion1", "binary_sensor.motion2"],
+        )
+        return hass, sensor
+
+    def test_rising_edge_is_immediate(self):
+        """Presence is detected without waiting for the coalesced evaluation."""
+        hass, sensor = self._create({})
+        sensor.presence = False
+
+        with patch.object(sensor, 'async_write_ha_state') as mock_write:
+            sensor._handle_state_change(
+                _make_event("binary_sensor.motion1", STATE_OFF, STATE_ON)
+            )
+
+        assert sensor.presence is True
+        mock_write.assert_called_once()
+        hass.loop.call_soon.assert_not_called()
+
+    def test_falling_edge_is_coalesced(self):
+        """Clearing presence waits for the end of the burst."""
+        hass, sensor = self._create({
+            "binary_sensor.motion1": STATE_ON,
+            "binary_sensor.motion2": STATE_ON,
+        })
+        sensor.presence = True
+
+        with patch.object(sensor, 'async_write_ha_state'):
+            sensor._handle_state_change(
+                _make_event("binary_sensor.motion1", STATE_ON, STATE_OFF)
+            )
+            sensor._handle_state_change(
+                _make_event("binary_sensor.motion2", STATE_ON, STATE_OFF)
+            )
+            assert sensor.presence is True
+            hass.loop.call_soon.assert_called_once()
+
+            sensor._async_run_evaluation()
+
+        assert sensor.presence is False
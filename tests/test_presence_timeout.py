@@ -30,22 +30,23 @@ def _make_event(entity_id, old_state_value, new_state_value):
     return event
 
 
-def _make_auto_area(area_name="living_room", entry_id="test_entry", presence_timeout=0):
+def _make_auto_area(area_name="living_room", entry_id="test_entry", presence_timeout=0, options=None):
     """Create a mock AutoArea."""
     auto_area = MagicMock()
     auto_area.area_name = area_name
     auto_area.slugified_area_name = area_name
     auto_area.config_entry.entry_id = entry_id
-    auto_area.config_entry.options = {"presence_timeout": presence_timeout}
+    auto_area.config_entry.options = {"presence_timeout": presence_timeout, **(options or {})}
     auto_area.device_info = {
         "identifiers": {("auto_areas", entry_id)},
         "name": "Auto Areas",
     }
-    auto_area.get_valid_entities.return_value = []
+    auto_area.get_entity_ids.return_value = []
+    auto_area.presence_timers.async_is_scheduled.return_value = False
     return auto_area
 
 
-def _make_hass(states_map=None):
+def _make_hass(states_map=None, now=1000.0):
     """Create a mock HomeAssistant instance."""
     hass = MagicMock()
     states_map = states_map or {}
@@ -56,6 +57,7 @@ def _make_hass(states_map=None):
         return None
 
     hass.states.get = MagicMock(side_effect=get_state)
+    hass.loop.time.return_value = now
     return hass
 
 
@@ -64,12 +66,16 @@ def _create_presence_sensor(hass, auto_area, entity_ids):
     from custom_components.auto_areas.binary_sensors.presence import (
         PresenceBinarySensor,
     )
+    from custom_components.auto_areas.const import PRESENCE_ON_STATES
+    from custom_components.auto_areas.ha_helpers import get_active_entity_ids
 
     with patch.object(
         PresenceBinarySensor, '_get_sensor_entities',
         return_value=entity_ids,
     ):
         sensor = PresenceBinarySensor(hass=hass, auto_area=auto_area)
+    # Read the initial active entities like async_added_to_hass does
+    sensor._active = get_active_entity_ids(hass, entity_ids, PRESENCE_ON_STATES)
     return sensor
 
 
@@ -89,10 +95,10 @@ class TestTimeoutDisabled:
         event = _make_event("binary_sensor.motion1", STATE_ON, STATE_OFF)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
         assert sensor.presence is False
-        assert sensor._timeout_cancel is None
+        auto_area.presence_timers.async_schedule.assert_not_called()
 
 
 class TestTimeoutEnabled:
@@ -110,18 +116,15 @@ class TestTimeoutEnabled:
 
         event = _make_event("binary_sensor.motion1", STATE_ON, STATE_OFF)
 
-        with patch(
-            'custom_components.auto_areas.binary_sensors.presence.async_call_later'
-        ) as mock_call_later:
-            mock_call_later.return_value = MagicMock()
-            with patch.object(sensor, 'async_write_ha_state'):
-                await sensor._handle_state_change(event)
+        with patch.object(sensor, 'async_write_ha_state'):
+            sensor._handle_state_change(event)
 
         # Presence should still be True — waiting for timeout
         assert sensor.presence is True
-        # async_call_later should have been called with 30s
-        mock_call_later.assert_called_once()
-        assert mock_call_later.call_args[0][1] == 30
+        # The shared timers should hold presence for 30s
+        auto_area.presence_timers.async_schedule.assert_called_once_with(
+            sensor, 1030.0, sensor._async_handle_timeout
+        )
 
     @pytest.mark.asyncio
     async def test_presence_on_immediately_when_sensor_triggers(self):
@@ -136,7 +139,7 @@ class TestTimeoutEnabled:
         event = _make_event("binary_sensor.motion1", STATE_OFF, STATE_ON)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
         assert sensor.presence is True
 
@@ -154,24 +157,19 @@ class TestTimerReset:
         sensor = _create_presence_sensor(hass, auto_area, entity_ids)
         sensor.presence = True
 
-        # Simulate a pending timeout
-        cancel_mock = MagicMock()
-        sensor._timeout_cancel = cancel_mock
-
         # Sensor triggers again
         event = _make_event("binary_sensor.motion1", STATE_OFF, STATE_ON)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
         # Timer should have been cancelled
-        cancel_mock.assert_called_once()
-        assert sensor._timeout_cancel is None
+        auto_area.presence_timers.async_cancel.assert_called_once_with(sensor)
         assert sensor.presence is True
 
     @pytest.mark.asyncio
     async def test_timer_resets_on_repeated_off(self):
-        """When sensors go off again during a pending timeout, timer resets."""
+        """When sensors go off again later, the deadline moves."""
         auto_area = _make_auto_area(presence_timeout=30)
         entity_ids = ["binary_sensor.motion1"]
         hass = _make_hass({"binary_sensor.motion1": STATE_OFF})
@@ -179,23 +177,18 @@ class TestTimerReset:
         sensor = _create_presence_sensor(hass, auto_area, entity_ids)
         sensor.presence = True
 
-        # Simulate a pending timeout
-        old_cancel = MagicMock()
-        sensor._timeout_cancel = old_cancel
-
         event = _make_event("binary_sensor.motion1", STATE_ON, STATE_OFF)
 
-        with patch(
-            'custom_components.auto_areas.binary_sensors.presence.async_call_later'
-        ) as mock_call_later:
-            new_cancel = MagicMock()
-            mock_call_later.return_value = new_cancel
-            with patch.object(sensor, 'async_write_ha_state'):
-                await sensor._handle_state_change(event)
+        with patch.object(sensor, 'async_write_ha_state'):
+            sensor._handle_state_change(event)
+            hass.loop.time.return_value = 1010.0
+            sensor._handle_state_change(
+                _make_event("binary_sensor.motion1", STATE_OFF, STATE_ON)
+            )
+            sensor._handle_state_change(event)
 
-        # Old timer cancelled, new one started
-        old_cancel.assert_called_once()
-        mock_call_later.assert_called_once()
+        schedule = auto_area.presence_timers.async_schedule
+        assert [call.args[1] for call in schedule.call_args_list] == [1030.0, 1040.0]
 
 
 class TestTimeoutExpires:
@@ -212,10 +205,9 @@ class TestTimeoutExpires:
         sensor.presence = True
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_timeout(None)
+            sensor._async_handle_timeout()
 
         assert sensor.presence is False
-        assert sensor._timeout_cancel is None
 
     @pytest.mark.asyncio
     async def test_timeout_does_not_clear_if_sensor_on(self):
@@ -229,7 +221,7 @@ class TestTimeoutExpires:
         sensor.presence = True
 
         with patch.object(sensor, 'async_write_ha_state') as mock_write:
-            await sensor._handle_timeout(None)
+            sensor._async_handle_timeout()
 
         assert sensor.presence is True
         mock_write.assert_not_called()
@@ -254,13 +246,11 @@ class TestMultipleSensors:
 
         event = _make_event("binary_sensor.motion1", STATE_ON, STATE_OFF)
 
-        with patch(
-            'custom_components.auto_areas.binary_sensors.presence.async_call_later'
-        ) as mock_call_later, patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+        with patch.object(sensor, 'async_write_ha_state'):
+            sensor._handle_state_change(event)
 
         # No timeout started — motion2 still on
-        mock_call_later.assert_not_called()
+        auto_area.presence_timers.async_schedule.assert_not_called()
         assert sensor.presence is True
 
     @pytest.mark.asyncio
@@ -279,19 +269,86 @@ class TestMultipleSensors:
 
         event = _make_event("binary_sensor.motion2", STATE_ON, STATE_OFF)
 
-        with patch(
-            'custom_components.auto_areas.binary_sensors.presence.async_call_later'
-        ) as mock_call_later:
-            mock_call_later.return_value = MagicMock()
-            with patch.object(sensor, 'async_write_ha_state'):
-                await sensor._handle_state_change(event)
+        with patch.object(sensor, 'async_write_ha_state'):
+            sensor._handle_state_change(event)
+
+        auto_area.presence_timers.async_schedule.assert_called_once()
+        assert sensor.presence is True
+
+
+class TestHoldTimes:
+    """Test hold times per device class."""
+
+    @staticmethod
+    def _make_registry(auto_area, device_classes):
+        """Return registry entries with the given device classes."""
+        def get_entry(entity_id):
+            entry = MagicMock()
+            entry.device_class = None
+            entry.original_device_class = device_classes.get(entity_id)
+            return entry
+
+        auto_area.entity_registry.async_get = MagicMock(side_effect=get_entry)
+
+    @pytest.mark.asyncio
+    async def test_longest_hold_wins(self):
+        """A PIR that turned off earlier keeps presence for its hold time."""
+        auto_area = _make_auto_area(
+            presence_timeout=30,
+            options={"motion_hold_time": 60, "presence_hold_time": 0},
+        )
+        self._make_registry(auto_area, {
+            "binary_sensor.pir": "motion",
+            "binary_sensor.mmwave": "presence",
+        })
+        entity_ids = ["binary_sensor.pir", "binary_sensor.mmwave"]
+        hass = _make_hass({
+            "binary_sensor.pir": STATE_ON,
+            "binary_sensor.mmwave": STATE_ON,
+        })
+
+        sensor = _create_presence_sensor(hass, auto_area, entity_ids)
+        sensor.presence = True
+
+        with patch.object(sensor, 'async_write_ha_state'):
+            sensor._handle_state_change(
+                _make_event("binary_sensor.pir", STATE_ON, STATE_OFF)
+            )
+            hass.loop.time.return_value = 1010.0
+            sensor._handle_state_change(
+                _make_event("binary_sensor.mmwave", STATE_ON, STATE_OFF)
+            )
 
-        mock_call_later.assert_called_once()
         assert sensor.presence is True
+        auto_area.presence_timers.async_schedule.assert_called_once_with(
+            sensor, 1060.0, sensor._async_handle_timeout
+        )
+
+    @pytest.mark.asyncio
+    async def test_zero_hold_clears_immediately(self):
+        """A sensor with a hold time of 0 clears presence right away."""
+        auto_area = _make_auto_area(
+            presence_timeout=30,
+            options={"presence_hold_time": 0},
+        )
+        self._make_registry(auto_area, {"binary_sensor.mmwave": "presence"})
+        entity_ids = ["binary_sensor.mmwave"]
+        hass = _make_hass({"binary_sensor.mmwave": STATE_ON})
+
+        sensor = _create_presence_sensor(hass, auto_area, entity_ids)
+        sensor.presence = True
+
+        with patch.object(sensor, 'async_write_ha_state'):
+            sensor._handle_state_change(
+                _make_event("binary_sensor.mmwave", STATE_ON, STATE_OFF)
+            )
+
+        assert sensor.presence is False
+        auto_area.presence_timers.async_schedule.assert_not_called()
 
 
 class TestRemovalCleanup:
-    """Test that timeout task is cancelled on entity removal."""
+    """Test that the pending timeout is cancelled on entity removal."""
 
     @pytest.mark.asyncio
     async def test_timeout_cancelled_on_removal(self):
@@ -302,27 +359,25 @@ class TestRemovalCleanup:
 
         sensor = _create_presence_sensor(hass, auto_area, entity_ids)
 
-        cancel_mock = MagicMock()
-        sensor._timeout_cancel = cancel_mock
-
         with patch.object(
             type(sensor).__mro__[2], 'async_will_remove_from_hass',
             new_callable=AsyncMock,
         ):
             await sensor.async_will_remove_from_hass()
 
-        cancel_mock.assert_called_once()
-        assert sensor._timeout_cancel is None
+        auto_area.presence_timers.async_cancel.assert_called_once_with(sensor)
 
     @pytest.mark.asyncio
     async def test_removal_without_pending_timeout(self):
         """Removal should work cleanly even with no pending timeout."""
+        from custom_components.auto_areas.presence_timers import PresenceTimers
+
         auto_area = _make_auto_area(presence_timeout=30)
+        auto_area.presence_timers = PresenceTimers(MagicMock())
         entity_ids = ["binary_sensor.motion1"]
         hass = _make_hass()
 
         sensor = _create_presence_sensor(hass, auto_area, entity_ids)
-        sensor._timeout_cancel = None
 
         with patch.object(
             type(sensor).__mro__[2], 'async_will_remove_from_hass',
@@ -330,7 +385,7 @@ class TestRemovalCleanup:
         ):
             await sensor.async_will_remove_from_hass()
 
-        assert sensor._timeout_cancel is None
+        assert not auto_area.presence_timers.async_is_scheduled(sensor)
 
 
 class TestReentryDuringTimeout:
@@ -349,23 +404,17 @@ class TestReentryDuringTimeout:
         # Step 1: Sensor goes off → timeout starts
         off_event = _make_event("binary_sensor.motion1", STATE_ON, STATE_OFF)
 
-        with patch(
-            'custom_components.auto_areas.binary_sensors.presence.async_call_later'
-        ) as mock_call_later:
-            cancel_mock = MagicMock()
-            mock_call_later.return_value = cancel_mock
-            with patch.object(sensor, 'async_write_ha_state'):
-                await sensor._handle_state_change(off_event)
+        with patch.object(sensor, 'async_write_ha_state'):
+            sensor._handle_state_change(off_event)
 
         assert sensor.presence is True
-        assert sensor._timeout_cancel is cancel_mock
+        auto_area.presence_timers.async_schedule.assert_called_once()
 
         # Step 2: Sensor triggers again → timer cancelled, presence stays True
         on_event = _make_event("binary_sensor.motion1", STATE_OFF, STATE_ON)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(on_event)
+            sensor._handle_state_change(on_event)
 
-        cancel_mock.assert_called_once()
-        assert sensor._timeout_cancel is None
+        auto_area.presence_timers.async_cancel.assert_called_once_with(sensor)
         assert sensor.presence is True
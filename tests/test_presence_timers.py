@@ -0,0 +1,122 @@
+"""Tests for the shared presence timers."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.auto_areas.presence_timers import PresenceTimers
+
+CALL_AT = "custom_components.auto_areas.presence_timers.async_call_at"
+
+
+def _make_timers(now=1000.0, resolution=1.0):
+    """Create timers on a mocked loop clock."""
+    hass = MagicMock()
+    hass.loop.time.return_value = now
+    return PresenceTimers(hass, resolution=resolution)
+
+
+class TestPresenceTimers:
+    """Test scheduling, batching and lazy cancellation."""
+
+    @pytest.mark.asyncio
+    async def test_only_earliest_deadline_is_armed(self):
+        """One loop timer is armed for any number of deadlines."""
+        timers = _make_timers()
+
+        with patch(CALL_AT) as call_at:
+            timers.async_schedule("kitchen", 1060.0, MagicMock())
+            timers.async_schedule("office", 1030.0, MagicMock())
+            timers.async_schedule("hall", 1090.0, MagicMock())
+
+        assert [call.args[2] for call in call_at.call_args_list] == [1060.0, 1030.0]
+        call_at.return_value.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_deadlines_expire_in_batches(self):
+        """Deadlines within the resolution expire with one timer."""
+        timers = _make_timers()
+        kitchen, office, hall = MagicMock(), MagicMock(), MagicMock()
+
+        with patch(CALL_AT) as call_at:
+            timers.async_schedule("kitchen", 1029.2, kitchen)
+            timers.async_schedule("office", 1029.9, office)
+            timers.async_schedule("hall", 1090.0, hall)
+            call_at.assert_called_once()
+            assert call_at.call_args.args[2] == 1030.0
+
+            timers.hass.loop.time.return_value = 1030.0
+            timers._async_fire(None)
+
+            kitchen.assert_called_once_with()
+            office.assert_called_once_with()
+            hall.assert_not_called()
+            # The next deadline is armed
+            assert call_at.call_args.args[2] == 1090.0
+
+    @pytest.mark.asyncio
+    async def test_cancel_is_lazy(self):
+        """Cancelled deadlines are skipped when their timer fires."""
+        timers = _make_timers()
+        action = MagicMock()
+
+        with patch(CALL_AT) as call_at:
+            timers.async_schedule("kitchen", 1030.0, action)
+            timers.async_cancel("kitchen")
+            assert not timers.async_is_scheduled("kitchen")
+            call_at.return_value.assert_not_called()
+
+            timers.hass.loop.time.return_value = 1030.0
+            timers._async_fire(None)
+
+        action.assert_not_called()
+        assert call_at.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_reschedule_later_keeps_armed_timer(self):
+        """Moving a deadline later does not touch the armed timer."""
+        timers = _make_timers()
+        action = MagicMock()
+
+        with patch(CALL_AT) as call_at:
+            timers.async_schedule("kitchen", 1030.0, action)
+            timers.async_schedule("kitchen", 1060.0, action)
+            call_at.assert_called_once()
+
+            # The early timer finds nothing due and arms the new deadline
+            timers.hass.loop.time.return_value = 1030.0
+            timers._async_fire(None)
+            action.assert_not_called()
+            assert call_at.call_args.args[2] == 1060.0
+
+            timers.hass.loop.time.return_value = 1060.0
+            timers._async_fire(None)
+
+        action.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_failing_action_does_not_stop_batch(self):
+        """An error in one action does not keep the others from running."""
+        timers = _make_timers()
+        failing = MagicMock(side_effect=ValueError)
+        action = MagicMock()
+
+        with patch(CALL_AT):
+            timers.async_schedule("kitchen", 1030.0, failing)
+            timers.async_schedule("office", 1030.0, action)
+            timers.hass.loop.time.return_value = 1030.0
+            timers._async_fire(None)
+
+        action.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_cancels_timer(self):
+        """Shutting down drops all deadlines and the armed timer."""
+        timers = _make_timers()
+
+        with patch(CALL_AT) as call_at:
+            timers.async_schedule("kitchen", 1030.0, MagicMock())
+            timers.async_shutdown()
+
+        call_at.return_value.assert_called_once()
+        assert not timers.async_is_scheduled("kitchen")
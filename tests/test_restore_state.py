@@ -0,0 +1,116 @@
+"""Tests for restoring aggregate states after a restart."""
+
+import pytest
+
+from homeassistant.const import STATE_OFF, STATE_ON, STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers import area_registry as ar, entity_registry as er
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    mock_restore_cache,
+)
+
+from custom_components.auto_areas.const import CONFIG_AREA, DOMAIN
+
+PRESENCE = "binary_sensor.area_presence_test_room"
+TEMPERATURE = "sensor.area_temperature_test_room"
+
+
+async def _add_member(
+    hass: HomeAssistant,
+    area: ar.AreaEntry,
+    domain: str,
+    unique_id: str,
+    device_class: str,
+) -> str:
+    """Create an area member that has not reported yet."""
+    entity_registry = er.async_get(hass)
+    entry = entity_registry.async_get_or_create(
+        domain=domain,
+        platform="test",
+        unique_id=unique_id,
+        original_device_class=device_class,
+    )
+    entity_registry.async_update_entity(entry.entity_id, area_id=area.id)
+    hass.states.async_set(entry.entity_id, STATE_UNAVAILABLE)
+    await hass.async_block_till_done()
+    return entry.entity_id
+
+
+async def _setup_entry(hass: HomeAssistant, area: ar.AreaEntry) -> None:
+    """Set up auto_areas for the area."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONFIG_AREA: area.id},
+        options={},
+        title="Test Room",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.asyncio
+async def test_presence_restored_until_members_report(
+    hass: HomeAssistant, test_area: ar.AreaEntry
+):
+    """Presence keeps its last state until a presence sensor reports."""
+    motion = await _add_member(hass, test_area, "binary_sensor", "motion", "motion")
+    mock_restore_cache(hass, [State(PRESENCE, STATE_ON)])
+
+    await _setup_entry(hass, test_area)
+    assert hass.states.get(PRESENCE).state == STATE_ON
+
+    hass.states.async_set(motion, STATE_OFF)
+    await hass.async_block_till_done()
+    assert hass.states.get(PRESENCE).state == STATE_OFF
+
+
+@pytest.mark.asyncio
+async def test_presence_not_restored_when_members_reported(
+    hass: HomeAssistant, test_area: ar.AreaEntry
+):
+    """Live member states win over the restored state."""
+    motion = await _add_member(hass, test_area, "binary_sensor", "motion", "motion")
+    hass.states.async_set(motion, STATE_OFF)
+    mock_restore_cache(hass, [State(PRESENCE, STATE_ON)])
+
+    await _setup_entry(hass, test_area)
+
+    assert hass.states.get(PRESENCE).state == STATE_OFF
+
+
+@pytest.mark.asyncio
+async def test_sensor_restored_until_members_report(
+    hass: HomeAssistant, test_area: ar.AreaEntry
+):
+    """Aggregated sensors keep their last value until a member reports."""
+    temperature = await _add_member(
+        hass, test_area, "sensor", "temperature", "temperature"
+    )
+    mock_restore_cache(hass, [State(TEMPERATURE, "21.5")])
+
+    await _setup_entry(hass, test_area)
+    assert float(hass.states.get(TEMPERATURE).state) == 21.5
+
+    hass.states.async_set(temperature, "19.0")
+    await hass.async_block_till_done()
+    assert float(hass.states.get(TEMPERATURE).state) == 19.0
+
+
+@pytest.mark.asyncio
+async def test_sensor_restored_value_kept_on_unavailable_member(
+    hass: HomeAssistant, test_area: ar.AreaEntry
+):
+    """An unavailable member update does not replace the restored value."""
+    temperature = await _add_member(
+        hass, test_area, "sensor", "temperature", "temperature"
+    )
+    mock_restore_cache(hass, [State(TEMPERATURE, "21.5")])
+
+    await _setup_entry(hass, test_area)
+    hass.states.async_set(temperature, "unknown")
+    await hass.async_block_till_done()
+
+    assert float(hass.states.get(TEMPERATURE).state) == 21.5
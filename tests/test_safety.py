@@ -44,7 +44,7 @@ def _make_auto_area(area_name="kitchen", entry_id="test_entry"):
         "identifiers": {("auto_areas", entry_id)},
         "name": "Auto Areas",
     }
-    auto_area.get_valid_entities.return_value = []
+    auto_area.get_entity_ids.return_value = []
     return auto_area
 
 
@@ -73,6 +73,8 @@ def _create_safety_sensor(hass, auto_area, entity_ids):
         return_value=entity_ids,
     ):
         sensor = SafetyBinarySensor(hass=hass, auto_area=auto_area)
+    # Read the initial active entities like async_added_to_hass does
+    sensor._active = sensor._get_active()
     return sensor
 
 
@@ -85,17 +87,17 @@ class TestSafetyNoSensors:
         hass = _make_hass()
 
         sensor = _create_safety_sensor(hass, auto_area, [])
-        sensor.safety_alert = False
+        sensor.any_on = False
 
         assert sensor.state == STATE_OFF
 
     def test_no_sensors_initial_alert_false(self):
-        """With no safety sensors, _any_sensor_on returns False."""
+        """With no safety sensors, _get_active returns no entities, so False."""
         auto_area = _make_auto_area()
         hass = _make_hass()
 
         sensor = _create_safety_sensor(hass, auto_area, [])
-        assert sensor._any_sensor_on() is False
+        assert bool(sensor._get_active()) is False
 
 
 class TestSafetySingleSensor:
@@ -111,7 +113,7 @@ class TestSafetySingleSensor:
         sensor = _create_safety_sensor(
             hass, auto_area, ["binary_sensor.smoke_kitchen"],
         )
-        assert sensor._any_sensor_on() is True
+        assert bool(sensor._get_active()) is True
 
     def test_single_smoke_sensor_off(self):
         """Single smoke sensor OFF should set aggregate to off."""
@@ -123,7 +125,7 @@ class TestSafetySingleSensor:
         sensor = _create_safety_sensor(
             hass, auto_area, ["binary_sensor.smoke_kitchen"],
         )
-        assert sensor._any_sensor_on() is False
+        assert bool(sensor._get_active()) is False
 
 
 class TestSafetyOrLogic:
@@ -142,14 +144,14 @@ class TestSafetyOrLogic:
             hass, auto_area,
             ["binary_sensor.smoke_kitchen", "binary_sensor.co_kitchen"],
         )
-        sensor.safety_alert = False
+        sensor.any_on = False
 
         event = _make_event("binary_sensor.smoke_kitchen", STATE_OFF, STATE_ON)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
-        assert sensor.safety_alert is True
+        assert sensor.any_on is True
 
     @pytest.mark.asyncio
     async def test_all_sensors_off_aggregate_off(self):
@@ -167,14 +169,14 @@ class TestSafetyOrLogic:
         })
 
         sensor = _create_safety_sensor(hass, auto_area, entity_ids)
-        sensor.safety_alert = True
+        sensor.any_on = True
 
         event = _make_event("binary_sensor.smoke_kitchen", STATE_ON, STATE_OFF)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
-        assert sensor.safety_alert is False
+        assert sensor.any_on is False
 
     @pytest.mark.asyncio
     async def test_stays_on_when_one_still_on(self):
@@ -191,14 +193,14 @@ class TestSafetyOrLogic:
         })
 
         sensor = _create_safety_sensor(hass, auto_area, entity_ids)
-        sensor.safety_alert = True
+        sensor.any_on = True
 
         event = _make_event("binary_sensor.smoke_kitchen", STATE_ON, STATE_OFF)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
-        assert sensor.safety_alert is True
+        assert sensor.any_on is True
 
 
 class TestSafetyUnavailable:
@@ -219,14 +221,14 @@ class TestSafetyUnavailable:
         })
 
         sensor = _create_safety_sensor(hass, auto_area, entity_ids)
-        sensor.safety_alert = True
+        sensor.any_on = True
 
         event = _make_event("binary_sensor.smoke_kitchen", STATE_ON, STATE_UNAVAILABLE)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
-        assert sensor.safety_alert is False
+        assert sensor.any_on is False
 
     @pytest.mark.asyncio
     async def test_all_sensors_unavailable(self):
@@ -242,14 +244,14 @@ class TestSafetyUnavailable:
         })
 
         sensor = _create_safety_sensor(hass, auto_area, entity_ids)
-        sensor.safety_alert = True
+        sensor.any_on = True
 
         event = _make_event("binary_sensor.co_kitchen", STATE_ON, STATE_UNAVAILABLE)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
-        assert sensor.safety_alert is False
+        assert sensor.any_on is False
 
     @pytest.mark.asyncio
     async def test_sensor_becomes_unknown(self):
@@ -265,15 +267,15 @@ class TestSafetyUnavailable:
         })
 
         sensor = _create_safety_sensor(hass, auto_area, entity_ids)
-        sensor.safety_alert = True
+        sensor.any_on = True
 
         event = _make_event("binary_sensor.smoke_kitchen", STATE_ON, STATE_UNKNOWN)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
         # co_kitchen is still ON, so alert stays
-        assert sensor.safety_alert is True
+        assert sensor.any_on is True
 
 
 class TestSafetyMixedDeviceClasses:
@@ -296,7 +298,7 @@ class TestSafetyMixedDeviceClasses:
                 "binary_sensor.co_kitchen",
             ],
         )
-        assert sensor._any_sensor_on() is True
+        assert bool(sensor._get_active()) is True
 
     def test_mixed_classes_all_off(self):
         """Mixed device classes — all OFF means safe."""
@@ -315,7 +317,7 @@ class TestSafetyMixedDeviceClasses:
                 "binary_sensor.co_kitchen",
             ],
         )
-        assert sensor._any_sensor_on() is False
+        assert bool(sensor._get_active()) is False
 
 
 class TestSafetyStateChanges:
@@ -330,14 +332,14 @@ class TestSafetyStateChanges:
         sensor = _create_safety_sensor(
             hass, auto_area, ["binary_sensor.smoke_kitchen"],
         )
-        sensor.safety_alert = False
+        sensor.any_on = False
 
         event = _make_event("binary_sensor.smoke_kitchen", STATE_OFF, STATE_ON)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
-        assert sensor.safety_alert is True
+        assert sensor.any_on is True
 
     @pytest.mark.asyncio
     async def test_on_to_off_transition(self):
@@ -350,14 +352,14 @@ class TestSafetyStateChanges:
         sensor = _create_safety_sensor(
             hass, auto_area, ["binary_sensor.smoke_kitchen"],
         )
-        sensor.safety_alert = True
+        sensor.any_on = True
 
         event = _make_event("binary_sensor.smoke_kitchen", STATE_ON, STATE_OFF)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
-        assert sensor.safety_alert is False
+        assert sensor.any_on is False
 
 
 class TestSafetyEntityProperties:
@@ -393,14 +395,14 @@ class TestSafetyEdgeCases:
         sensor = _create_safety_sensor(
             hass, auto_area, ["binary_sensor.smoke_kitchen"],
         )
-        sensor.safety_alert = False
+        sensor.any_on = False
 
         event = _make_event("binary_sensor.smoke_kitchen", STATE_OFF, STATE_OFF)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
 
-        assert sensor.safety_alert is False
+        assert sensor.any_on is False
 
     @pytest.mark.asyncio
     async def test_none_new_state_handled_gracefully(self):
@@ -411,9 +413,33 @@ class TestSafetyEdgeCases:
         sensor = _create_safety_sensor(
             hass, auto_area, ["binary_sensor.smoke_kitchen"],
         )
-        sensor.safety_alert = True
+        sensor.any_on = True
 
         event = _make_event("binary_sensor.smoke_kitchen", STATE_ON, None)
 
         with patch.object(sensor, 'async_write_ha_state'):
-            await sensor._handle_state_change(event)
+            sensor._handle_state_change(event)
+
+
+class TestSafetyAlertCount:
+    """Test the number of alerting entities."""
+
+    @pytest.mark.asyncio
+    async def test_alert_count_attribute(self):
+        """The alert_count attribute follows the alerting entities."""
+        auto_area = _make_auto_area()
+        hass = _make_hass({"binary_sensor.co_kitchen": STATE_ON})
+
+        sensor = _create_safety_sensor(
+            hass, auto_area,
+            ["binary_sensor.smoke_kitchen", "binary_sensor.co_kitchen"],
+        )
+        sensor.any_on = True
+        assert sensor.extra_state_attributes == {"alert_count": 1}
+
+        event = _make_event("binary_sensor.smoke_kitchen", STATE_OFF, STATE_ON)
+        with patch.object(sensor, 'async_write_ha_state') as mock_write:
+            sensor._handle_state_change(event)
+
+        assert sensor.extra_state_attributes == {"alert_count": 2}
+        mock_write.assert_called_once()
@@ -0,0 +1,93 @@
+"""Tests for the per-area signal bus."""
+
+from homeassistant.core import HomeAssistant, callback
+
+from custom_components.auto_areas.signals import AreaSignals
+
+
+async def test_publish_and_subscribe(hass: HomeAssistant):
+    """Listeners receive every new value of their signal only."""
+    signals = AreaSignals(hass)
+    presence: list = []
+    illuminance: list = []
+
+    @callback
+    def _presence_listener(value):
+        presence.append(value)
+
+    @callback
+    def _illuminance_listener(value):
+        illuminance.append(value)
+
+    signals.async_subscribe("presence", _presence_listener)
+    signals.async_subscribe("illuminance", _illuminance_listener)
+
+    signals.async_publish("presence", True)
+    signals.async_publish("presence", False)
+    await hass.async_block_till_done()
+
+    assert presence == [True, False]
+    assert illuminance == []
+
+
+async def test_coroutine_listener(hass: HomeAssistant):
+    """Coroutine listeners are scheduled as tasks."""
+    signals = AreaSignals(hass)
+    received: list = []
+
+    async def _listener(value):
+        received.append(value)
+
+    signals.async_subscribe("illuminance", _listener)
+    signals.async_publish("illuminance", 42.0)
+    await hass.async_block_till_done()
+
+    assert received == [42.0]
+
+
+async def test_unchanged_value_is_not_delivered(hass: HomeAssistant):
+    """Publishing the same value twice notifies only once."""
+    signals = AreaSignals(hass)
+    received: list = []
+
+    @callback
+    def _listener(value):
+        received.append(value)
+
+    signals.async_subscribe("presence", _listener)
+
+    signals.async_publish("presence", True)
+    signals.async_publish("presence", True)
+    await hass.async_block_till_done()
+
+    assert received == [True]
+
+
+async def test_last_value_is_kept(hass: HomeAssistant):
+    """Late consumers can read the last published value."""
+    signals = AreaSignals(hass)
+    assert signals.async_get("presence") is None
+    assert signals.async_get("presence", False) is False
+
+    signals.async_publish("presence", True)
+
+    assert signals.async_get("presence") is True
+
+
+async def test_unsubscribe(hass: HomeAssistant):
+    """Unsubscribed listeners are not called anymore."""
+    signals = AreaSignals(hass)
+    received: list = []
+
+    @callback
+    def _listener(value):
+        received.append(value)
+
+    unsubscribe = signals.async_subscribe("sleep_mode", _listener)
+
+    signals.async_publish("sleep_mode", True)
+    unsubscribe()
+    signals.async_publish("sleep_mode", False)
+    await hass.async_block_till_done()
+
+    assert received == [True]
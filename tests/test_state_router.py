@@ -0,0 +1,110 @@
+"""Tests for the shared state change router."""
+
+from homeassistant.core import HomeAssistant, callback
+
+from custom_components.auto_areas.const import DATA_STATE_ROUTER, DOMAIN
+from custom_components.auto_areas.state_router import async_get_state_router
+
+
+async def test_router_is_shared(hass: HomeAssistant):
+    """The router is created once and stored in hass.data."""
+    state_router = async_get_state_router(hass)
+
+    assert async_get_state_router(hass) is state_router
+    assert hass.data[DOMAIN][DATA_STATE_ROUTER] is state_router
+
+
+async def test_changes_are_routed_by_entity(hass: HomeAssistant):
+    """Handlers only receive changes of their own entities."""
+    state_router = async_get_state_router(hass)
+    kitchen: list = []
+    office: list = []
+    state_router.async_subscribe(
+        ["binary_sensor.kitchen", "binary_sensor.hall"],
+        callback(lambda event: kitchen.append(event.data["entity_id"])),
+    )
+    state_router.async_subscribe(
+        ["binary_sensor.office", "binary_sensor.hall"],
+        callback(lambda event: office.append(event.data["entity_id"])),
+    )
+
+    hass.states.async_set("binary_sensor.kitchen", "on")
+    hass.states.async_set("binary_sensor.hall", "on")
+    hass.states.async_set("binary_sensor.unrelated", "on")
+    await hass.async_block_till_done()
+
+    assert kitchen == ["binary_sensor.kitchen", "binary_sensor.hall"]
+    assert office == ["binary_sensor.hall"]
+
+
+async def test_callback_handlers_run_synchronously(hass: HomeAssistant):
+    """Callback handlers have run once the state is set."""
+    state_router = async_get_state_router(hass)
+    received: list = []
+
+    @callback
+    def _handler(event):
+        received.append(event)
+
+    state_router.async_subscribe(["binary_sensor.kitchen"], _handler)
+
+    hass.states.async_set("binary_sensor.kitchen", "on")
+
+    assert len(received) == 1
+
+
+async def test_coroutine_handlers(hass: HomeAssistant):
+    """Coroutine handlers are scheduled as tasks."""
+    state_router = async_get_state_router(hass)
+    received: list = []
+
+    async def _handler(event):
+        received.append(event.data["new_state"].state)
+
+    state_router.async_subscribe(["sensor.kitchen"], _handler)
+    hass.states.async_set("sensor.kitchen", "21")
+    await hass.async_block_till_done()
+
+    assert received == ["21"]
+
+
+async def test_entities_can_be_changed(hass: HomeAssistant):
+    """Changing the entities of a subscription adds and removes routes."""
+    state_router = async_get_state_router(hass)
+    received: list = []
+    subscription = state_router.async_subscribe(
+        ["binary_sensor.kitchen"],
+        callback(lambda event: received.append(event.data["entity_id"])),
+    )
+
+    subscription.async_set_entity_ids(["binary_sensor.office"])
+    hass.states.async_set("binary_sensor.kitchen", "on")
+    hass.states.async_set("binary_sensor.office", "on")
+    await hass.async_block_till_done()
+    assert received == ["binary_sensor.office"]
+
+    subscription.async_unsubscribe()
+    hass.states.async_set("binary_sensor.office", "off")
+    await hass.async_block_till_done()
+    assert received == ["binary_sensor.office"]
+
+
+async def test_failing_handler_does_not_stop_others(hass: HomeAssistant):
+    """An error in one handler does not keep the others from running."""
+    state_router = async_get_state_router(hass)
+    received: list = []
+
+    @callback
+    def _failing(event):
+        raise ValueError
+
+    @callback
+    def _handler(event):
+        received.append(event)
+
+    state_router.async_subscribe(["binary_sensor.kitchen"], _failing)
+    state_router.async_subscribe(["binary_sensor.kitchen"], _handler)
+    hass.states.async_set("binary_sensor.kitchen", "on")
+    await hass.async_block_till_done()
+
+    assert len(received) == 1
@@ -0,0 +1,70 @@
+"""Tests for the presence lock and sleep mode switches."""
+
+import pytest
+
+from homeassistant.const import ATTR_ENTITY_ID, STATE_OFF, STATE_ON
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers import area_registry as ar
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    mock_restore_cache,
+)
+
+from custom_components.auto_areas.const import (
+    CONFIG_AREA,
+    CONFIG_IS_SLEEPING_AREA,
+    DOMAIN,
+    PRESENCE_LOCK_SWITCH_ENTITY_PREFIX,
+    SLEEP_MODE_SWITCH_ENTITY_PREFIX,
+)
+
+PRESENCE_LOCK = f"{PRESENCE_LOCK_SWITCH_ENTITY_PREFIX}test_room"
+SLEEP_MODE = f"{SLEEP_MODE_SWITCH_ENTITY_PREFIX}test_room"
+
+
+async def _setup_entry(hass: HomeAssistant, area: ar.AreaEntry) -> MockConfigEntry:
+    """Set up a sleeping area so both switches exist."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONFIG_AREA: area.id},
+        options={CONFIG_IS_SLEEPING_AREA: True},
+        title="Test Room",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("entity_id", [PRESENCE_LOCK, SLEEP_MODE])
+async def test_switch_turn_on_off(
+    hass: HomeAssistant, test_area: ar.AreaEntry, entity_id: str
+):
+    """Toggling a switch writes its state right away."""
+    await _setup_entry(hass, test_area)
+    assert hass.states.get(entity_id).state == STATE_OFF
+
+    await hass.services.async_call(
+        "switch", "turn_on", {ATTR_ENTITY_ID: entity_id}, blocking=True
+    )
+    assert hass.states.get(entity_id).state == STATE_ON
+
+    await hass.services.async_call(
+        "switch", "turn_off", {ATTR_ENTITY_ID: entity_id}, blocking=True
+    )
+    assert hass.states.get(entity_id).state == STATE_OFF
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("entity_id", [PRESENCE_LOCK, SLEEP_MODE])
+async def test_switch_state_is_restored(
+    hass: HomeAssistant, test_area: ar.AreaEntry, entity_id: str
+):
+    """The last state of a switch survives a restart."""
+    mock_restore_cache(hass, [State(entity_id, STATE_ON)])
+
+    await _setup_entry(hass, test_area)
+
+    assert hass.states.get(entity_id).state == STATE_ON